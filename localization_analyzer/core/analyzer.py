@@ -459,7 +459,7 @@ class LocalizationAnalyzer:
             from ..features.dynamic_key_analyzer import DynamicKeyAnalyzer
 
             # Mevcut key'leri al
-            existing_keys = set(self.file_manager.keys.keys())
+            existing_keys = self.file_manager.keys.keys()
 
             # DynamicKeyAnalyzer oluştur
             analyzer = DynamicKeyAnalyzer(self.project_dir, existing_keys)
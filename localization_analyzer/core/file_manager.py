@@ -1,13 +1,40 @@
 """Multi-language localization file manager."""
 
+import os
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 from collections import defaultdict
 
 from ..frameworks.base import BaseAdapter
 from ..utils.colors import Colors
 
 
+def _iter_matching_files(root: Path, pattern: str) -> Iterator[Path]:
+    """
+    Recursively yield files under root whose name matches pattern.
+
+    Depth-first: a directory's matching files come before anything in its
+    subdirectories, each level in os.scandir order (filesystem-dependent,
+    so callers that need a stable order must sort). os.scandir's d_type
+    answers is_dir()/is_file() without an extra stat per entry. Symlinked
+    directories are not followed.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif fnmatch(entry.name, pattern) and entry.is_file():
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _iter_matching_files(subdir, pattern)
+
+
 class LocalizationFileManager:
     """
     Manages localization files for multiple languages.
@@ -46,7 +73,7 @@ class LocalizationFileManager:
         # Group files by language
         lang_files_count = defaultdict(int)
 
-        for file_path in self.localization_dir.rglob(pattern.split('/')[-1]):
+        for file_path in _iter_matching_files(self.localization_dir, pattern.split('/')[-1]):
             if self.adapter.should_exclude_file(file_path):
                 continue
 
@@ -78,7 +105,6 @@ class LocalizationFileManager:
         print(f"\n📚 Loading localization keys...")
 
         total_files = sum(len(files) for files in self.languages.values())
-        processed = 0
 
         for lang_code, file_paths in self.languages.items():
             for file_path in file_paths:
@@ -93,8 +119,6 @@ class LocalizationFileManager:
                     if key not in self.key_modules:
                         self.key_modules[key] = module_name
 
-                processed += 1
-
         print(f"   {Colors.success('✓')} Loaded {len(self.keys)} unique keys from {total_files} module files across {len(self.languages)} languages")
 
     def add_key(
@@ -245,17 +269,16 @@ class LocalizationFileManager:
         """
         untranslated = {}
 
+        # Single pass over self.keys; each key's translations are scanned once
         for key, translations in self.keys.items():
-            if source_lang not in translations:
+            source_text = translations.get(source_lang)
+            if source_text is None or len(translations) < 2:
                 continue
 
-            source_text = translations[source_lang]
-            same_langs = set()
-
-            for lang_code, text in translations.items():
-                if lang_code != source_lang and text == source_text:
-                    same_langs.add(lang_code)
-
+            same_langs = {
+                lang_code for lang_code, text in translations.items()
+                if text == source_text and lang_code != source_lang
+            }
             if same_langs:
                 untranslated[key] = same_langs
 
@@ -1,10 +1,11 @@
 """Localization health score calculator."""
 
+from bisect import bisect_right
 from typing import Dict, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class HealthScore:
     """Localization health score and metrics."""
     score: float  # 0-100
@@ -31,6 +32,10 @@ class HealthCalculator:
         'F': 0,
     }
 
+    # Ascending lookup tables for bisect, derived from GRADE_THRESHOLDS
+    _GRADES = tuple(sorted(GRADE_THRESHOLDS, key=GRADE_THRESHOLDS.get))  # ('F', 'D', ..., 'A+')
+    _GRADE_BOUNDS = tuple(map(GRADE_THRESHOLDS.get, _GRADES[1:]))  # (60, 70, 80, 90, 95)
+
     # Penalty weights
     MISSING_KEY_PENALTY = 0.5  # per missing key
     DEAD_KEY_PENALTY = 0.1  # per dead key
@@ -120,10 +125,7 @@ class HealthCalculator:
     @classmethod
     def _calculate_grade(cls, score: float) -> str:
         """Convert score to letter grade."""
-        for grade, threshold in cls.GRADE_THRESHOLDS.items():
-            if score >= threshold:
-                return grade
-        return 'F'
+        return cls._GRADES[bisect_right(cls._GRADE_BOUNDS, score)]
 
     @classmethod
     def get_grade_color(cls, grade: str) -> str:
@@ -43,6 +43,24 @@ class DiffResult:
     def has_differences(self) -> bool:
         return self.total_differences > 0
 
+    def get(self, key: str) -> Optional[DiffEntry]:
+        """
+        Key'e ait diff kaydını döndür.
+
+        Listeler her çağrıda taranır; sonradan eklenen kayıtlar da bulunur.
+
+        Args:
+            key: Aranan key
+
+        Returns:
+            DiffEntry veya bulunamazsa None
+        """
+        for entries in (self.added, self.removed, self.changed, self.same):
+            for entry in entries:
+                if entry.key == key:
+                    return entry
+        return None
+
 
 class LocalizationDiff:
     """
@@ -79,11 +97,13 @@ class LocalizationDiff:
         """
         result = DiffResult(source_lang=source_lang, target_lang=target_lang)
 
-        source_set = set(source_keys.keys())
-        target_set = set(target_keys.keys())
+        # dict key view'ları set işlemlerini doğrudan destekler (set() kopyası gerekmez).
+        # Key'ler sıralı gezildiği için listeler sonradan ayrıca sıralanmaz.
+        source_set = source_keys.keys()
+        target_set = target_keys.keys()
 
         # Removed: kaynakta var, hedefte yok
-        for key in source_set - target_set:
+        for key in sorted(source_set - target_set):
             result.removed.append(DiffEntry(
                 key=key,
                 diff_type=DiffType.REMOVED,
@@ -92,7 +112,7 @@ class LocalizationDiff:
             ))
 
         # Added: hedefte var, kaynakta yok
-        for key in target_set - source_set:
+        for key in sorted(target_set - source_set):
             result.added.append(DiffEntry(
                 key=key,
                 diff_type=DiffType.ADDED,
@@ -101,7 +121,7 @@ class LocalizationDiff:
             ))
 
         # Her ikisinde de var
-        for key in source_set & target_set:
+        for key in sorted(source_set & target_set):
             source_value = source_keys[key]
             target_value = target_keys[key]
 
@@ -122,12 +142,6 @@ class LocalizationDiff:
                     target_value=target_value
                 ))
 
-        # Sırala
-        result.added.sort(key=lambda x: x.key)
-        result.removed.sort(key=lambda x: x.key)
-        result.changed.sort(key=lambda x: x.key)
-        result.same.sort(key=lambda x: x.key)
-
         return result
 
     def print_diff(
@@ -228,9 +242,7 @@ class LocalizationDiff:
         """Metni kısalt."""
         if not text:
             return ""
-        if len(text) <= max_len:
-            return text
-        return text[:max_len - 3] + "..."
+        return text if len(text) <= max_len else f"{text[:max_len - 3]}..."
 
     def export_diff(self, result: DiffResult, output_path: Path, format: str = "md"):
         """
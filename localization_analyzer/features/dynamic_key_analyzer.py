@@ -14,10 +14,21 @@ Desteklenen pattern'ler:
 
 import re
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+# Derlenmiş regex'ler (her dosya/satır için yeniden derlenmemesi için modül seviyesinde)
+_ENUM_DECL_RE = re.compile(r'enum\s+(\w+)\s*(?::\s*[\w,\s]+)?\s*\{', re.MULTILINE)
+_ENUM_CASE_RE = re.compile(r'case\s+(\w+)(?:\s*=\s*"([^"]+)")?')
+_LOCALIZED_LITERAL_RE = re.compile(
+    r'"([^"\\]*(?:\\.[^"\\]*)*)"\.localized(?:\(from:\s*\.[a-zA-Z]+\))?'
+)
+_INTERPOLATION_RE = re.compile(r'\\\(([^)]+)\)')
+_CAMEL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+_EXCLUDED_DIRS = ('build/', '.build/', 'DerivedData/', 'Pods/', '.git/')
+
 
 @dataclass
 class DynamicKeyPattern:
@@ -81,14 +92,15 @@ class DynamicKeyAnalyzer:
     SWIFT_ENUM_PATTERN = r'enum\s+(\w+)\s*(?::\s*\w+)?\s*\{([^}]+)\}'
     SWIFT_CASE_PATTERN = r'case\s+(\w+)(?:\s*=\s*"([^"]+)")?'
 
-    def __init__(self, source_dir: Path, existing_keys: Set[str]):
+    def __init__(self, source_dir: Path, existing_keys: Iterable[str]):
         """
         Args:
             source_dir: Kaynak kod dizini
             existing_keys: .strings dosyalarındaki mevcut key'ler
+                (frozenset'e çevrilir; çağıranın set'i değiştirilmez)
         """
         self.source_dir = source_dir
-        self.existing_keys = existing_keys
+        self.existing_keys: FrozenSet[str] = frozenset(existing_keys)
         self.enums: Dict[str, EnumDefinition] = {}
         self.dynamic_patterns: List[DynamicKeyPattern] = []
         self.results: List[DynamicKeyAnalysisResult] = []
@@ -115,8 +127,7 @@ class DynamicKeyAnalyzer:
         """Tüm Swift enum tanımlarını bul."""
         for swift_file in self.source_dir.rglob('*.swift'):
             # Exclude build directories
-            if any(excluded in str(swift_file) for excluded in
-                   ['build/', '.build/', 'DerivedData/', 'Pods/', '.git/']):
+            if any(excluded in str(swift_file) for excluded in _EXCLUDED_DIRS):
                 continue
 
             try:
@@ -127,13 +138,7 @@ class DynamicKeyAnalyzer:
 
     def _extract_enums_from_content(self, content: str, file_path: str):
         """Dosya içeriğinden enum tanımlarını çıkar."""
-        # Basit enum pattern - çok satırlı
-        enum_pattern = re.compile(
-            r'enum\s+(\w+)\s*(?::\s*[\w,\s]+)?\s*\{',
-            re.MULTILINE
-        )
-
-        for match in enum_pattern.finditer(content):
+        for match in _ENUM_DECL_RE.finditer(content):
             enum_name = match.group(1)
             start_pos = match.end()
 
@@ -155,8 +160,7 @@ class DynamicKeyAnalyzer:
             cases = []
             raw_values = {}
 
-            case_pattern = re.compile(r'case\s+(\w+)(?:\s*=\s*"([^"]+)")?')
-            for case_match in case_pattern.finditer(enum_body):
+            for case_match in _ENUM_CASE_RE.finditer(enum_body):
                 case_name = case_match.group(1)
                 raw_value = case_match.group(2)  # Optional
 
@@ -178,27 +182,26 @@ class DynamicKeyAnalyzer:
     def _camel_to_snake(self, name: str) -> str:
         """CamelCase'i snake_case'e çevir."""
         # Basit dönüşüm: büyük harflerden önce _ ekle
-        result = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+        result = _CAMEL_BOUNDARY_RE.sub('_', name).lower()
         return result
 
     def _discover_dynamic_patterns(self):
         """Dinamik key pattern'lerini bul."""
         for swift_file in self.source_dir.rglob('*.swift'):
-            if any(excluded in str(swift_file) for excluded in
-                   ['build/', '.build/', 'DerivedData/', 'Pods/', '.git/']):
+            if any(excluded in str(swift_file) for excluded in _EXCLUDED_DIRS):
                 continue
 
             try:
                 content = swift_file.read_text(encoding='utf-8')
-                lines = content.split('\n')
-
-                for line_num, line in enumerate(lines, 1):
-                    self._extract_dynamic_patterns_from_line(
-                        line, str(swift_file), line_num
-                    )
+                self._extract_dynamic_patterns_from_content(content, str(swift_file))
             except Exception:
                 continue
 
+    def _extract_dynamic_patterns_from_content(self, content: str, file_path: str):
+        """Dosya içeriğinden dinamik pattern'leri çıkar."""
+        for line_num, line in enumerate(content.split('\n'), 1):
+            self._extract_dynamic_patterns_from_line(line, file_path, line_num)
+
     def _extract_dynamic_patterns_from_line(
         self, line: str, file_path: str, line_number: int
     ):
@@ -207,15 +210,11 @@ class DynamicKeyAnalyzer:
         # Örnek: "activity.\(id)".localized
 
         # Genel pattern - string interpolation içeren .localized kullanımları
-        pattern = re.compile(
-            r'"([^"\\]*(?:\\.[^"\\]*)*)"\.localized(?:\(from:\s*\.[a-zA-Z]+\))?'
-        )
-
-        for match in pattern.finditer(line):
+        for match in _LOCALIZED_LITERAL_RE.finditer(line):
             key_template = match.group(1)
 
             # İnterpolation içeriyor mu?
-            interp_match = re.search(r'\\\(([^)]+)\)', key_template)
+            interp_match = _INTERPOLATION_RE.search(key_template)
             if not interp_match:
                 continue
 
@@ -276,9 +275,9 @@ class DynamicKeyAnalyzer:
 
         for enum in possible_enums:
             expected_keys = self._generate_expected_keys(pattern, enum)
-            existing = [k for k in expected_keys if k in self.existing_keys]
-            if len(existing) > best_match_count:
-                best_match_count = len(existing)
+            match_count = len(self.existing_keys.intersection(expected_keys))
+            if match_count > best_match_count:
+                best_match_count = match_count
                 best_enum = enum
 
         if not best_enum:
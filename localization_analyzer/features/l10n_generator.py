@@ -58,13 +58,13 @@ class L10nGenerator:
         """
         seen_keys: Dict[str, Set[str]] = defaultdict(set)  # module -> set of keys
 
-        for item in hardcoded_strings:
+        # Generate clean keys for all strings in one batch
+        clean_keys = self.adapter.text_to_keys([item.text for item in hardcoded_strings])
+
+        for item, clean_key in zip(hardcoded_strings, clean_keys):
             # Determine module from file path
             module = self.adapter.determine_module(item.file)
 
-            # Generate clean key
-            clean_key = self.adapter.text_to_key(item.text)
-
             # Skip if key already exists in this module
             if clean_key in seen_keys[module]:
                 self.skipped_count += 1
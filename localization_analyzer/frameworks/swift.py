@@ -1,11 +1,818 @@
 """Swift/iOS framework adapter for localization analysis."""
 
 import re
+import string
+import unicodedata
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from .base import BaseAdapter, LocalizationPattern
 
+# .strings entry: "key" = "value";
+# Value supports escaped characters: \" \\ \n etc.
+# (?:[^"\\]|\\.)* matches: non-quote/non-backslash chars OR backslash+any char
+_STRINGS_ENTRY_RE = re.compile(r'^"([^"]+)"\s*=\s*"((?:[^"\\]|\\.)*)";', re.MULTILINE)
+
+# Deletes the Combining Diacritical Marks block (U+0300-U+036F), which holds
+# every accent NFKD splits off Latin letters
+_STRIP_COMBINING = dict.fromkeys(range(0x0300, 0x0370))
+
+# Letters with no Unicode decomposition, so NFKD cannot fold them to ASCII
+_SPECIAL_LETTERS = {
+    'ı': 'i',  # Turkish dotless i
+    'ß': 'ss',  # German
+    'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE',  # French, Scandinavian
+    'ł': 'l', 'Ł': 'L',  # Polish
+    'ø': 'o', 'Ø': 'O',  # Scandinavian
+    'ð': 'd', 'Ð': 'D', 'þ': 'th', 'Þ': 'TH',  # Icelandic, Old English
+}
+
+
+def _build_char_map() -> Dict[str, str]:
+    """
+    Build the special-character to ASCII map.
+
+    Scans Latin-1 through Cyrillic (U+0080-U+04FF) for cased letters whose
+    NFKD form, minus combining marks, is plain ASCII letters (é -> e,
+    ĳ -> ij, ...), then adds _SPECIAL_LETTERS.
+    """
+    char_map = {}
+    for codepoint in range(0x80, 0x0500):
+        char = chr(codepoint)
+        if unicodedata.category(char) not in ('Lu', 'Ll', 'Lt'):
+            continue
+        folded = ''.join(c for c in unicodedata.normalize('NFKD', char)
+                         if not unicodedata.combining(c))
+        if folded != char and folded.isascii() and folded.isalpha():
+            char_map[char] = folded
+    char_map.update(_SPECIAL_LETTERS)
+    return char_map
+
+
+# Built once at import; exposed as SwiftAdapter.CHAR_MAP
+_CHAR_MAP = _build_char_map()
+
+# Single translate table for _fold_special_chars, exposed as
+# SwiftAdapter.CHAR_TRANS: deletes the accent block, spells out
+# _SPECIAL_LETTERS and lowercases ASCII in one pass. (Keys are
+# case-insensitive from here on; str.lower() is avoided because it turns
+# 'İ' into 'i' + a combining dot.)
+#
+# An int-keyed dict is already the fast form for str.translate: CPython
+# looks each code point up in C, with an extra cached fast path for all-ASCII
+# input. A bytes table (bytes.maketrans over latin-1) is not used because
+# it cannot map one character to several (ß -> ss) and would silently drop
+# everything outside Latin-1.
+_FOLD_TABLE = {
+    **_STRIP_COMBINING,
+    **str.maketrans(string.ascii_uppercase, string.ascii_lowercase),
+    **{ord(char): replacement.lower() for char, replacement in _SPECIAL_LETTERS.items()},
+}
+
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Joins texts for batch folding in text_to_keys; a non-alphanumeric starter
+# character, so it survives folding and never merges with its neighbours
+_KEY_SEPARATOR = '\x1f'
+
+
+def _to_camel_case(text: str) -> str:
+    """
+    Join the ASCII letter/digit runs of text into a camelCase key.
+
+    Anything outside [a-zA-Z0-9] (including non-ASCII) acts as a separator.
+    Returns "unknown" if there are no such runs.
+    """
+    words = [w for w in _NON_ALNUM_RE.split(text) if w]
+
+    if not words:
+        return "unknown"
+
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+
+def _fold_special_chars(
+    text: str,
+    fold_table: Dict[int, str] = _FOLD_TABLE,
+    pre_table: Optional[Dict[int, str]] = None,
+) -> str:
+    """Fold text to lowercase, spelling accented and special letters in ASCII."""
+    # Custom spellings for letters NFKD would otherwise fold its own way
+    if pre_table:
+        text = text.translate(pre_table)
+
+    # Split accented letters into base letter + combining accent. The quick
+    # check skips the copy when the text is already decomposed.
+    if not unicodedata.is_normalized('NFKD', text):
+        text = unicodedata.normalize('NFKD', text)
+
+    # Drop accents, map letters with no decomposition (ß -> ss, ı -> i, ...)
+    # and lowercase, all in one pass
+    text = text.translate(fold_table)
+
+    # Remove any remaining combining characters outside the main block
+    if not text.isascii():
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+
+    return text
+
+
+def _build_fold_tables(char_map: Dict[str, str]) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """
+    Build the translate tables _fold_special_chars uses for a CHAR_MAP.
+
+    Returns (pre_table, fold_table). fold_table runs after NFKD and spells
+    out the letters with no decomposition. pre_table runs before NFKD and
+    only holds letters whose CHAR_MAP spelling differs from what NFKD gives
+    them; it is empty for the generated CHAR_MAP.
+    """
+    fold_table = {
+        **_STRIP_COMBINING,
+        **str.maketrans(string.ascii_uppercase, string.ascii_lowercase),
+        **{ord(char): replacement.lower() for char, replacement in char_map.items()
+           if not unicodedata.decomposition(char)},
+    }
+    pre_table = {
+        ord(char): replacement for char, replacement in char_map.items()
+        if unicodedata.decomposition(char)
+        and _fold_special_chars(char, fold_table) != replacement.lower()
+    }
+    return pre_table, fold_table
+
+
+def _make_text_to_key(
+    pre_table: Dict[int, str], fold_table: Dict[int, str]
+) -> Callable[[str], str]:
+    """
+    Build the cached body of text_to_key for one pair of fold tables.
+
+    Each adapter class with its own CHAR_MAP gets its own function, so the
+    cache key is just the text (the same UI label usually appears on many
+    screens).
+    """
+    @lru_cache(maxsize=8192)
+    def text_to_key(text: str) -> str:
+        # Plain ASCII has nothing to fold (the common case)
+        if text.isascii():
+            return _to_camel_case(text)
+
+        return _to_camel_case(_fold_special_chars(text, fold_table, pre_table))
+
+    return text_to_key
+
+
+# text_to_key for SwiftAdapter's own CHAR_MAP
+_text_to_key_impl = _make_text_to_key({}, _FOLD_TABLE)
+
+
+def _parse_strings_content(content: str) -> Dict[str, str]:
+    """
+    Parse .strings content with plain string operations.
+
+    Produces exactly what _STRINGS_ENTRY_RE.finditer would. Lines with
+    escapes are matched with the regex one line at a time; if an entry may
+    span lines (unclosed key/value, or '=' on the next line) the whole
+    content is re-parsed with the regex instead.
+    """
+    keys = {}
+
+    # split('\n') rather than splitlines(): the regex '^' only anchors after '\n'
+    for line in content.split('\n'):
+        if not line.startswith('"'):
+            continue
+
+        if '\\' in line:
+            match = _STRINGS_ENTRY_RE.match(line)
+            if match is None:
+                break
+            key, value = match.groups()
+            keys[key] = value
+            continue
+
+        key_end = line.find('"', 1)
+        if key_end == -1:
+            break
+        if key_end == 1:
+            continue  # Empty key never matches
+
+        rest = line[key_end + 1:].lstrip()
+        if not rest:
+            break
+        if rest[0] != '=':
+            continue
+
+        rest = rest[1:].lstrip()
+        if not rest:
+            break
+        if rest[0] != '"':
+            continue
+
+        value_end = rest.find('"', 1)
+        if value_end == -1:
+            break
+        if rest[value_end + 1:value_end + 2] == ';':
+            keys[line[1:key_end]] = rest[1:value_end]
+    else:
+        return keys
+
+    # Entry possibly spanning multiple lines - defer to the regex
+    return {key: value for key, value in
+            (match.groups() for match in _STRINGS_ENTRY_RE.finditer(content))}
+
+
+# Swift-specific hardcoded patterns (built once; each adapter gets a copy)
+_HARDCODED_PATTERNS = (
+    # Basic UI Components
+    LocalizationPattern(
+        pattern=r'Text\(\s*"([^"]+)"\s*\)',
+        component_type='Text',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Label\(\s*"([^"]+)"',
+        component_type='Label',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Button\(\s*"([^"]+)"',
+        component_type='Button',
+        category='visible_ui'
+    ),
+
+    # Navigation
+    LocalizationPattern(
+        pattern=r'\.navigationTitle\(\s*"([^"]+)"\s*\)',
+        component_type='NavigationTitle',
+        category='navigation'
+    ),
+    LocalizationPattern(
+        pattern=r'\.navigationBarTitle\(\s*"([^"]+)"\s*\)',
+        component_type='NavigationBarTitle',
+        category='navigation'
+    ),
+
+    # Alerts and Dialogs
+    LocalizationPattern(
+        pattern=r'Alert\([^)]*title:\s*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Alert',
+        category='error_messages'
+    ),
+    LocalizationPattern(
+        pattern=r'Alert\(\s*"([^"]+)"',
+        component_type='Alert',
+        category='error_messages'
+    ),
+    LocalizationPattern(
+        pattern=r'\.confirmationDialog\(\s*"([^"]+)"',
+        component_type='ConfirmationDialog',
+        category='user_facing'
+    ),
+
+    # Form Elements
+    LocalizationPattern(
+        pattern=r'TextField\(\s*"([^"]+)"',
+        component_type='TextField',
+        category='placeholders'
+    ),
+    LocalizationPattern(
+        pattern=r'SecureField\(\s*"([^"]+)"',
+        component_type='SecureField',
+        category='placeholders'
+    ),
+    LocalizationPattern(
+        pattern=r'Toggle\(\s*"([^"]+)"',
+        component_type='Toggle',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Picker\(\s*"([^"]+)"',
+        component_type='Picker',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Stepper\(\s*"([^"]+)"',
+        component_type='Stepper',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Slider\(\s*value:[^,]+,\s*label:\s*\{\s*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Slider',
+        category='visible_ui'
+    ),
+
+    # Containers and Groups
+    LocalizationPattern(
+        pattern=r'Menu\(\s*"([^"]+)"',
+        component_type='Menu',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Section\(\s*"([^"]+)"',
+        component_type='Section',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'Section\(\s*header:\s*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Section',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'GroupBox\(\s*"([^"]+)"',
+        component_type='GroupBox',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'DisclosureGroup\(\s*"([^"]+)"',
+        component_type='DisclosureGroup',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'LabeledContent\(\s*"([^"]+)"',
+        component_type='LabeledContent',
+        category='labels'
+    ),
+
+    # Links and Navigation
+    LocalizationPattern(
+        pattern=r'Link\(\s*"([^"]+)"',
+        component_type='Link',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'NavigationLink\(\s*"([^"]+)"',
+        component_type='NavigationLink',
+        category='visible_ui'
+    ),
+
+    # Modifiers
+    LocalizationPattern(
+        pattern=r'\.accessibilityLabel\(\s*"([^"]+)"\s*\)',
+        component_type='AccessibilityLabel',
+        category='user_facing'
+    ),
+    LocalizationPattern(
+        pattern=r'\.placeholder\(\s*"([^"]+)"\s*\)',
+        component_type='Placeholder',
+        category='placeholders'
+    ),
+    LocalizationPattern(
+        pattern=r'\.help\(\s*"([^"]+)"\s*\)',
+        component_type='Help',
+        category='user_facing'
+    ),
+    LocalizationPattern(
+        pattern=r'\.badge\(\s*"([^"]+)"\s*\)',
+        component_type='Badge',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'\.badge\(\s*Text\(\s*"([^"]+)"\s*\)\s*\)',
+        component_type='Badge',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'\.searchPrompt\(\s*"([^"]+)"\s*\)',
+        component_type='SearchPrompt',
+        category='placeholders'
+    ),
+    LocalizationPattern(
+        pattern=r'\.prompt\(\s*"([^"]+)"\s*\)',
+        component_type='Prompt',
+        category='placeholders'
+    ),
+
+    # Tab Items
+    LocalizationPattern(
+        pattern=r'\.tabItem\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='TabItem',
+        category='navigation'
+    ),
+
+    # Toolbar
+    LocalizationPattern(
+        pattern=r'ToolbarItem\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='ToolbarItem',
+        category='visible_ui'
+    ),
+
+    # Context Menu
+    LocalizationPattern(
+        pattern=r'\.contextMenu\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='ContextMenu',
+        category='visible_ui'
+    ),
+
+    # Swipe Actions
+    LocalizationPattern(
+        pattern=r'\.swipeActions\s*\{[^}]*Button\(\s*"([^"]+)"',
+        component_type='SwipeAction',
+        category='visible_ui'
+    ),
+
+    # Sheets and Presentations
+    LocalizationPattern(
+        pattern=r'\.sheet\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Sheet',
+        category='visible_ui'
+    ),
+    LocalizationPattern(
+        pattern=r'\.popover\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Popover',
+        category='visible_ui'
+    ),
+
+    # Empty States
+    LocalizationPattern(
+        pattern=r'ContentUnavailableView\(\s*"([^"]+)"',
+        component_type='EmptyState',
+        category='visible_ui'
+    ),
+
+    # Form Labels
+    LocalizationPattern(
+        pattern=r'Form\s*\{[^}]*Section\([^)]*header:\s*Text\(\s*"([^"]+)"\s*\)',
+        component_type='FormSection',
+        category='visible_ui'
+    ),
+
+    # List Section Headers
+    LocalizationPattern(
+        pattern=r'List\s*\{[^}]*Section\(\s*"([^"]+)"',
+        component_type='ListSection',
+        category='visible_ui'
+    ),
+
+    # Error Messages in Views
+    LocalizationPattern(
+        pattern=r'if\s+.*error.*Text\(\s*"([^"]+)"\s*\)',
+        component_type='ErrorMessage',
+        category='error_messages'
+    ),
+
+    # Toast/Banner Messages
+    LocalizationPattern(
+        pattern=r'\.toast\(\s*"([^"]+)"',
+        component_type='Toast',
+        category='user_facing'
+    ),
+    LocalizationPattern(
+        pattern=r'\.banner\(\s*"([^"]+)"',
+        component_type='Banner',
+        category='user_facing'
+    ),
+
+    # Overlay Messages
+    LocalizationPattern(
+        pattern=r'\.overlay\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
+        component_type='Overlay',
+        category='visible_ui'
+    ),
+
+    # Custom Notification Content
+    LocalizationPattern(
+        pattern=r'UNMutableNotificationContent\(\)\.title\s*=\s*"([^"]+)"',
+        component_type='NotificationTitle',
+        category='user_facing'
+    ),
+    LocalizationPattern(
+        pattern=r'UNMutableNotificationContent\(\)\.body\s*=\s*"([^"]+)"',
+        component_type='NotificationBody',
+        category='user_facing'
+    ),
+
+    # Enum Cases - Switch Return Statements
+    LocalizationPattern(
+        pattern=r'case\s+\.\w+:\s*return\s+"([^"]+)"',
+        component_type='EnumCase',
+        category='enum_localization'
+    ),
+
+    # Switch-Case Numeric Range Returns (e.g., mood emojis, status messages)
+    LocalizationPattern(
+        pattern=r'case\s+\d+(?:\.\.<|\.\.\.)\d+:\s*return\s+"([^"]+)"',
+        component_type='SwitchCaseRange',
+        category='user_facing'
+    ),
+
+    # Switch-Case Simple Numeric Returns
+    LocalizationPattern(
+        pattern=r'case\s+\d+:\s*return\s+"([^"]+)"',
+        component_type='SwitchCaseNumeric',
+        category='user_facing'
+    ),
+
+    # Default Case Returns
+    LocalizationPattern(
+        pattern=r'default:\s*return\s+"([^"]+)"',
+        component_type='DefaultCase',
+        category='user_facing'
+    ),
+
+    # Enum Cases - Computed Property Returns
+    LocalizationPattern(
+        pattern=r'(?:var|let)\s+\w+:\s*String\s*\{\s*return\s+"([^"]+)"\s*\}',
+        component_type='ComputedProperty',
+        category='enum_localization'
+    ),
+
+    # Enum Raw Values
+    LocalizationPattern(
+        pattern=r'case\s+\w+\s*=\s*"([^"]+)"',
+        component_type='EnumRawValue',
+        category='enum_localization'
+    ),
+
+    # Variable/Property Assignment
+    LocalizationPattern(
+        pattern=r'(?:var|let)?\s*\w+\s*=\s*"([^"]+)"',
+        component_type='VariableAssignment',
+        category='user_facing'
+    ),
+
+    # Array Append Method
+    LocalizationPattern(
+        pattern=r'\.append\(\s*"([^"]+)"\s*\)',
+        component_type='ArrayAppend',
+        category='user_facing'
+    ),
+
+    # Array Literal Elements
+    LocalizationPattern(
+        pattern=r'\[\s*(?:"[^"]*",\s*)*"([^"]+)"',
+        component_type='ArrayLiteral',
+        category='user_facing'
+    ),
+
+    # Dictionary Literals with String Values
+    LocalizationPattern(
+        pattern=r':\s*\[.*?:\s*"([^"]+)"\s*\]',
+        component_type='DictionaryValue',
+        category='data_structure'
+    ),
+
+    # Array Literals - String Arrays
+    LocalizationPattern(
+        pattern=r'\[\s*"([^"]+)"\s*,',
+        component_type='ArrayLiteral',
+        category='data_structure'
+    ),
+    LocalizationPattern(
+        pattern=r',\s*"([^"]+)"\s*\]',
+        component_type='ArrayLiteral',
+        category='data_structure'
+    ),
+    LocalizationPattern(
+        pattern=r',\s*"([^"]+)"\s*,',
+        component_type='ArrayLiteral',
+        category='data_structure'
+    ),
+
+    # Error Messages - Throw Statements
+    LocalizationPattern(
+        pattern=r'throw\s+\w+Error\.[a-zA-Z]+\("([^"]+)"\)',
+        component_type='ErrorMessage',
+        category='error_messages'
+    ),
+    LocalizationPattern(
+        pattern=r'NSError\([^)]*NSLocalizedDescriptionKey:\s*"([^"]+)"',
+        component_type='ErrorDescription',
+        category='error_messages'
+    ),
+
+    # SwiftUI Alert Messages (multi-line)
+    LocalizationPattern(
+        pattern=r'Alert\s*\([^)]*message:\s*Text\("([^"]+)"\)',
+        component_type='AlertMessage',
+        category='user_facing'
+    ),
+
+    # Toast/HUD Messages
+    LocalizationPattern(
+        pattern=r'showToast\("([^"]+)"\)',
+        component_type='ToastMessage',
+        category='user_facing'
+    ),
+    LocalizationPattern(
+        pattern=r'HUD\.show\("([^"]+)"\)',
+        component_type='HUDMessage',
+        category='user_facing'
+    ),
+
+    # Struct/Function Named Parameters (Common UI parameters)
+    LocalizationPattern(
+        pattern=r'(?:label|title|placeholder|text|message|description|name|subtitle|header|footer|caption|hint|prompt):\s*"([^"]+)"',
+        component_type='NamedParameter',
+        category='user_facing'
+    ),
+
+    # Return Statements - Simple Strings
+    LocalizationPattern(
+        pattern=r'return\s+"([^"]+)"(?!\s*\+)',
+        component_type='ReturnStatement',
+        category='user_facing'
+    ),
+
+    # Return Statements - String Interpolation
+    # Matches: return "text \(variable) more text"
+    LocalizationPattern(
+        pattern=r'return\s+"([^"]*\\\([^)]+\)[^"]*)"',
+        component_type='ReturnInterpolation',
+        category='user_facing'
+    ),
+)
+
+# Swift localization patterns
+_LOCALIZED_PATTERNS = (
+    LocalizationPattern(
+        pattern=r'String\(\s*localized:\s*"([^"]+)"',
+        component_type='String.localized',
+        category='localized'
+    ),
+    LocalizationPattern(
+        pattern=r'NSLocalizedString\(\s*"([^"]+)"\s*,\s*comment:',
+        component_type='NSLocalizedString',
+        category='localized'
+    ),
+    LocalizationPattern(
+        pattern=r'LocalizedStringKey\(\s*"([^"]+)"\s*\)',
+        component_type='LocalizedStringKey',
+        category='localized'
+    ),
+    LocalizationPattern(
+        pattern=r'Text\(\s*String\(\s*localized:\s*"([^"]+)"',
+        component_type='Text+String.localized',
+        category='localized'
+    ),
+    LocalizationPattern(
+        pattern=r'Button\(\s*String\(\s*localized:\s*"([^"]+)"',
+        component_type='Button+String.localized',
+        category='localized'
+    ),
+    # L10n enum pattern (e.g., L10n.Common.save, L10n.Settings.title)
+    LocalizationPattern(
+        pattern=r'L10n\.[A-Z][a-zA-Z]+\.[a-zA-Z]+',
+        component_type='L10n',
+        category='localized'
+    ),
+    # .localized extension pattern (e.g., "key".localized)
+    LocalizationPattern(
+        pattern=r'"([^"]+)"\.localized',
+        component_type='StringExtension',
+        category='localized'
+    ),
+    # .localized(from:) pattern (e.g., "key".localized(from: .common))
+    LocalizationPattern(
+        pattern=r'"([^"]+)"\.localized\(from:\s*\.[a-zA-Z]+\)',
+        component_type='StringExtensionTable',
+        category='localized'
+    ),
+)
+
+# Exclusion patterns - strings that should NOT be localized
+_DEFAULT_EXCLUSION_PATTERNS = (
+    # Technical identifiers
+    r'^[a-z][a-zA-Z0-9_]*$',  # camelCase identifiers
+    r'^[A-Z][A-Z0-9_]*$',  # CONSTANT_NAMES
+
+    # File paths and URLs
+    r'^[./]',  # Starts with . or /
+    r'https?://',  # HTTP/HTTPS URLs
+    r'\.com|\.org|\.net',  # Domain names
+
+    # Format strings and regex
+    r'%[@dflsS]',  # Format specifiers
+    r'\\[nrt]',  # Escape sequences
+    r'[\[\]{}()^$*+?.|\\]',  # Regex characters
+
+    # Version strings
+    r'^\d+\.\d+',  # Version numbers like 1.0
+    r'^v\d+',  # Version like v1
+
+    # Short technical strings
+    r'^[A-Z]{2,}$',  # Abbreviations like API, URL
+    r'^\d+$',  # Pure numbers
+
+    # System keys
+    r'^@\w+',  # Property wrappers
+    r'^\$\w+',  # Dollar prefixed
+
+    # Empty or whitespace only
+    r'^\s*$',
+
+    # API Keys and secrets
+    r'^sk-',  # OpenAI API keys
+    r'^pk_',  # Stripe public keys
+    r'^sk_',  # Stripe secret keys
+    r'^AIza',  # Google API keys
+    r'^[A-Za-z0-9]{32,}$',  # Long alphanumeric strings (likely tokens/keys)
+
+    # Single characters (but NOT emojis in UI context)
+    r'^[a-zA-Z]$',  # Single ASCII letter
+    r'^[0-9]$',     # Single digit
+
+    # NOTE: Emoji patterns removed - emojis can be meaningful UI elements
+    # They will be checked contextually in should_exclude_string method
+
+    # SF Symbols (Apple's system icons)
+    r'\.(fill|slash|circle|square|badge)$',  # Common SF Symbol suffixes
+    r'^(house|person|gear|chart|heart|star|flag|bell|envelope|phone)',  # Common SF Symbols
+    r'\.(fill|slash)$',
+    r'^[a-z]+\.(fill|circle|square)',  # icon.fill patterns
+
+    # Technical enum values
+    r'^[a-z]+([A-Z][a-z]+)+$',  # camelCase without spaces (enum raw values)
+
+    # Debug/Log strings (lowercase)
+    r'^(log|debug|info|warning|error)[:=]',
+
+    # Color hex codes
+    r'^[0-9A-Fa-f]{6}$',  # Hex colors like "E74C3C"
+
+    # System property names
+    r'^(backgroundColor|textColor|borderColor|shadowColor)',  # Property names
+
+    # UserInfo keys and technical identifiers
+    r'^(type|id|key|action|category|identifier|status|code|domain)$',  # Common technical keys
+    r'^[a-z]+_[a-z]+',  # snake_case (technical identifiers)
+
+    # Array literal technical values
+    r'^(TL|USD|EUR|GBP)$',  # Currency codes
+    r'^(blue|green|red|purple|orange|pink|gray|yellow|white|black)$',  # Color names (single words)
+
+    # Date/Time format patterns
+    r'^[dMyhHmsS/:.\-\s]+$',  # Date format strings like dd/MM/yyyy, HH:mm:ss
+    r'^(dd|MM|yyyy|HH|mm|ss|yy)$',  # Individual date components
+
+    # Punctuation and symbols only
+    r'^[\s·\-:;,./\|•→←↑↓…\(\)\[\]\{\}]+$',  # Pure symbols/punctuation
+
+    # Asset/Resource identifiers
+    r'^[a-zA-Z]+_\d+$',  # asset_001, avatar_12 patterns
+    r'^(avatar|asset|image|icon|sprite|texture|model|anim)[_\-]?\d*$',  # Asset prefixes
+    r'^\d+[xX]\d+$',  # Dimension strings like 2x3, 100x100
+
+    # 3D/Animation technical names
+    r'^(idle|walk|run|jump|attack|death|spawn|hit)[_\-]?\d*$',  # Animation names
+    r'^(mesh|bone|joint|node|layer|blend)[_\-]?\w*$',  # 3D technical terms
+    r'^[A-Z][a-z]+(?:Animation|Mesh|Texture|Material|Shader|Prefab)$',  # Asset type suffixes
+
+    # Debug/Development strings
+    r'^(DEBUG|TODO|FIXME|HACK|NOTE|XXX|MARK)[:=\s-]',  # Debug markers
+    r'^\[DEBUG\]',  # Debug prefix
+    r'^(print|log|debug|trace|dump)\s*:',  # Debug output prefixes
+
+    # AI/Backend context strings (not user-facing)
+    r'^(system|user|assistant):\s*',  # AI role markers
+    r'^(prompt|context|instruction)[:=]',  # AI-related prefixes
+    r'^\{[a-z_]+\}$',  # Template variables like {user_name}
+
+    # Technical measurement units
+    r'^\d+\s*(px|pt|em|rem|%|dp|sp|vw|vh)$',  # CSS/UI units
+    r'^\d+(\.\d+)?\s*(mb|kb|gb|ms|fps|hz)$',  # Technical units (case insensitive handled elsewhere)
+
+    # JSON/Code structure strings
+    r'^\{|\}$',  # Single braces
+    r'^\[|\]$',  # Single brackets
+    r'^<[^>]+>$',  # HTML/XML tags
+    r'^[a-zA-Z]+\(\)$',  # Function call patterns like "init()"
+
+    # Filename patterns (without path)
+    r'^\w+\.(png|jpg|jpeg|gif|svg|pdf|json|xml|plist|strings|swift|m|h)$',  # File extensions
+)
+
+# Emoji character class body (without brackets), shared by the
+# emoji-stripping pattern and the pure-emoji fullmatch pattern.
+# Sorted, non-overlapping ranges: sre matches a class faster when it does
+# not have to test the same code points in several overlapping ranges.
+_EMOJI_CHAR_CLASS = (
+    r'\U0000200D'              # Zero Width Joiner (for compound emojis)
+    r'\U00002194-\U00002199'   # Arrows
+    r'\U000021A9-\U000021AA'   # More arrows
+    r'\U00002300-\U000023FF'   # Misc Technical (watch, hourglass, media controls)
+    r'\U000025AA-\U000025AB'   # Squares
+    r'\U000025B6\U000025C0'    # Play buttons
+    r'\U000025FB-\U000025FE'   # Squares
+    r'\U00002600-\U000027BF'   # Misc symbols + Dingbats (sun, zodiac, sports, ...)
+    r'\U00002934-\U00002935'   # Arrows
+    r'\U00002B05-\U00002B07'   # Arrows
+    r'\U00002B1B-\U00002B1C'   # Squares
+    r'\U00002B50'              # Star
+    r'\U00002B55'              # Circle
+    r'\U00003030'              # Wavy dash
+    r'\U0000303D'              # Part alternation mark
+    r'\U00003297'              # Circled Ideograph Congratulation
+    r'\U00003299'              # Circled Ideograph Secret
+    r'\U0000FE00-\U0000FE0F'   # Variation Selectors (incl. VS-16)
+    r'\U0001F1E0-\U0001F1FF'   # Flags
+    r'\U0001F300-\U0001FAFF'   # Pictographs, Emoticons, Transport, Supplemental, Extended-A
+)
+
+# Compiled once at import; the SwiftAdapter._get_compiled_* methods return these
+_EMOJI_RE = re.compile(f'[{_EMOJI_CHAR_CLASS}]+')
+_PURE_EMOJI_RE = re.compile(f'[{_EMOJI_CHAR_CLASS}\\s]+')
+_DEFAULT_EXCLUSION_RES = tuple(re.compile(p) for p in _DEFAULT_EXCLUSION_PATTERNS)
+
 
 class SwiftAdapter(BaseAdapter):
     """Adapter for Swift/iOS projects using .strings files."""
@@ -14,7 +821,7 @@ class SwiftAdapter(BaseAdapter):
     _compiled_hardcoded_patterns = None
     _compiled_localized_patterns = None
     _compiled_exclusion_patterns = None
-    _compiled_emoji_pattern = None
+    _compiled_char_map_pattern = None
 
     def __init__(self, l10n_config=None):
         super().__init__()
@@ -22,625 +829,40 @@ class SwiftAdapter(BaseAdapter):
         self._discovered_tables = {}  # Cache for discovered tables
 
         # Swift-specific hardcoded patterns
-        self.hardcoded_patterns = [
-            # Basic UI Components
-            LocalizationPattern(
-                pattern=r'Text\(\s*"([^"]+)"\s*\)',
-                component_type='Text',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Label\(\s*"([^"]+)"',
-                component_type='Label',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Button\(\s*"([^"]+)"',
-                component_type='Button',
-                category='visible_ui'
-            ),
-
-            # Navigation
-            LocalizationPattern(
-                pattern=r'\.navigationTitle\(\s*"([^"]+)"\s*\)',
-                component_type='NavigationTitle',
-                category='navigation'
-            ),
-            LocalizationPattern(
-                pattern=r'\.navigationBarTitle\(\s*"([^"]+)"\s*\)',
-                component_type='NavigationBarTitle',
-                category='navigation'
-            ),
-
-            # Alerts and Dialogs
-            LocalizationPattern(
-                pattern=r'Alert\([^)]*title:\s*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Alert',
-                category='error_messages'
-            ),
-            LocalizationPattern(
-                pattern=r'Alert\(\s*"([^"]+)"',
-                component_type='Alert',
-                category='error_messages'
-            ),
-            LocalizationPattern(
-                pattern=r'\.confirmationDialog\(\s*"([^"]+)"',
-                component_type='ConfirmationDialog',
-                category='user_facing'
-            ),
-
-            # Form Elements
-            LocalizationPattern(
-                pattern=r'TextField\(\s*"([^"]+)"',
-                component_type='TextField',
-                category='placeholders'
-            ),
-            LocalizationPattern(
-                pattern=r'SecureField\(\s*"([^"]+)"',
-                component_type='SecureField',
-                category='placeholders'
-            ),
-            LocalizationPattern(
-                pattern=r'Toggle\(\s*"([^"]+)"',
-                component_type='Toggle',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Picker\(\s*"([^"]+)"',
-                component_type='Picker',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Stepper\(\s*"([^"]+)"',
-                component_type='Stepper',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Slider\(\s*value:[^,]+,\s*label:\s*\{\s*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Slider',
-                category='visible_ui'
-            ),
-
-            # Containers and Groups
-            LocalizationPattern(
-                pattern=r'Menu\(\s*"([^"]+)"',
-                component_type='Menu',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Section\(\s*"([^"]+)"',
-                component_type='Section',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'Section\(\s*header:\s*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Section',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'GroupBox\(\s*"([^"]+)"',
-                component_type='GroupBox',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'DisclosureGroup\(\s*"([^"]+)"',
-                component_type='DisclosureGroup',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'LabeledContent\(\s*"([^"]+)"',
-                component_type='LabeledContent',
-                category='labels'
-            ),
-
-            # Links and Navigation
-            LocalizationPattern(
-                pattern=r'Link\(\s*"([^"]+)"',
-                component_type='Link',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'NavigationLink\(\s*"([^"]+)"',
-                component_type='NavigationLink',
-                category='visible_ui'
-            ),
-
-            # Modifiers
-            LocalizationPattern(
-                pattern=r'\.accessibilityLabel\(\s*"([^"]+)"\s*\)',
-                component_type='AccessibilityLabel',
-                category='user_facing'
-            ),
-            LocalizationPattern(
-                pattern=r'\.placeholder\(\s*"([^"]+)"\s*\)',
-                component_type='Placeholder',
-                category='placeholders'
-            ),
-            LocalizationPattern(
-                pattern=r'\.help\(\s*"([^"]+)"\s*\)',
-                component_type='Help',
-                category='user_facing'
-            ),
-            LocalizationPattern(
-                pattern=r'\.badge\(\s*"([^"]+)"\s*\)',
-                component_type='Badge',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'\.badge\(\s*Text\(\s*"([^"]+)"\s*\)\s*\)',
-                component_type='Badge',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'\.searchPrompt\(\s*"([^"]+)"\s*\)',
-                component_type='SearchPrompt',
-                category='placeholders'
-            ),
-            LocalizationPattern(
-                pattern=r'\.prompt\(\s*"([^"]+)"\s*\)',
-                component_type='Prompt',
-                category='placeholders'
-            ),
-
-            # Tab Items
-            LocalizationPattern(
-                pattern=r'\.tabItem\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='TabItem',
-                category='navigation'
-            ),
-
-            # Toolbar
-            LocalizationPattern(
-                pattern=r'ToolbarItem\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='ToolbarItem',
-                category='visible_ui'
-            ),
-
-            # Context Menu
-            LocalizationPattern(
-                pattern=r'\.contextMenu\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='ContextMenu',
-                category='visible_ui'
-            ),
-
-            # Swipe Actions
-            LocalizationPattern(
-                pattern=r'\.swipeActions\s*\{[^}]*Button\(\s*"([^"]+)"',
-                component_type='SwipeAction',
-                category='visible_ui'
-            ),
-
-            # Sheets and Presentations
-            LocalizationPattern(
-                pattern=r'\.sheet\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Sheet',
-                category='visible_ui'
-            ),
-            LocalizationPattern(
-                pattern=r'\.popover\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Popover',
-                category='visible_ui'
-            ),
-
-            # Empty States
-            LocalizationPattern(
-                pattern=r'ContentUnavailableView\(\s*"([^"]+)"',
-                component_type='EmptyState',
-                category='visible_ui'
-            ),
-
-            # Form Labels
-            LocalizationPattern(
-                pattern=r'Form\s*\{[^}]*Section\([^)]*header:\s*Text\(\s*"([^"]+)"\s*\)',
-                component_type='FormSection',
-                category='visible_ui'
-            ),
-
-            # List Section Headers
-            LocalizationPattern(
-                pattern=r'List\s*\{[^}]*Section\(\s*"([^"]+)"',
-                component_type='ListSection',
-                category='visible_ui'
-            ),
-
-            # Error Messages in Views
-            LocalizationPattern(
-                pattern=r'if\s+.*error.*Text\(\s*"([^"]+)"\s*\)',
-                component_type='ErrorMessage',
-                category='error_messages'
-            ),
-
-            # Toast/Banner Messages
-            LocalizationPattern(
-                pattern=r'\.toast\(\s*"([^"]+)"',
-                component_type='Toast',
-                category='user_facing'
-            ),
-            LocalizationPattern(
-                pattern=r'\.banner\(\s*"([^"]+)"',
-                component_type='Banner',
-                category='user_facing'
-            ),
-
-            # Overlay Messages
-            LocalizationPattern(
-                pattern=r'\.overlay\([^)]*\)\s*\{[^}]*Text\(\s*"([^"]+)"\s*\)',
-                component_type='Overlay',
-                category='visible_ui'
-            ),
-
-            # Custom Notification Content
-            LocalizationPattern(
-                pattern=r'UNMutableNotificationContent\(\)\.title\s*=\s*"([^"]+)"',
-                component_type='NotificationTitle',
-                category='user_facing'
-            ),
-            LocalizationPattern(
-                pattern=r'UNMutableNotificationContent\(\)\.body\s*=\s*"([^"]+)"',
-                component_type='NotificationBody',
-                category='user_facing'
-            ),
-
-            # Enum Cases - Switch Return Statements
-            LocalizationPattern(
-                pattern=r'case\s+\.\w+:\s*return\s+"([^"]+)"',
-                component_type='EnumCase',
-                category='enum_localization'
-            ),
-
-            # Switch-Case Numeric Range Returns (e.g., mood emojis, status messages)
-            LocalizationPattern(
-                pattern=r'case\s+\d+(?:\.\.<|\.\.\.)\d+:\s*return\s+"([^"]+)"',
-                component_type='SwitchCaseRange',
-                category='user_facing'
-            ),
-
-            # Switch-Case Simple Numeric Returns
-            LocalizationPattern(
-                pattern=r'case\s+\d+:\s*return\s+"([^"]+)"',
-                component_type='SwitchCaseNumeric',
-                category='user_facing'
-            ),
-
-            # Default Case Returns
-            LocalizationPattern(
-                pattern=r'default:\s*return\s+"([^"]+)"',
-                component_type='DefaultCase',
-                category='user_facing'
-            ),
-
-            # Enum Cases - Computed Property Returns
-            LocalizationPattern(
-                pattern=r'(?:var|let)\s+\w+:\s*String\s*\{\s*return\s+"([^"]+)"\s*\}',
-                component_type='ComputedProperty',
-                category='enum_localization'
-            ),
-
-            # Enum Raw Values
-            LocalizationPattern(
-                pattern=r'case\s+\w+\s*=\s*"([^"]+)"',
-                component_type='EnumRawValue',
-                category='enum_localization'
-            ),
-
-            # Variable/Property Assignment
-            LocalizationPattern(
-                pattern=r'(?:var|let)?\s*\w+\s*=\s*"([^"]+)"',
-                component_type='VariableAssignment',
-                category='user_facing'
-            ),
-
-            # Array Append Method
-            LocalizationPattern(
-                pattern=r'\.append\(\s*"([^"]+)"\s*\)',
-                component_type='ArrayAppend',
-                category='user_facing'
-            ),
-
-            # Array Literal Elements
-            LocalizationPattern(
-                pattern=r'\[\s*(?:"[^"]*",\s*)*"([^"]+)"',
-                component_type='ArrayLiteral',
-                category='user_facing'
-            ),
-
-            # Dictionary Literals with String Values
-            LocalizationPattern(
-                pattern=r':\s*\[.*?:\s*"([^"]+)"\s*\]',
-                component_type='DictionaryValue',
-                category='data_structure'
-            ),
-
-            # Array Literals - String Arrays
-            LocalizationPattern(
-                pattern=r'\[\s*"([^"]+)"\s*,',
-                component_type='ArrayLiteral',
-                category='data_structure'
-            ),
-            LocalizationPattern(
-                pattern=r',\s*"([^"]+)"\s*\]',
-                component_type='ArrayLiteral',
-                category='data_structure'
-            ),
-            LocalizationPattern(
-                pattern=r',\s*"([^"]+)"\s*,',
-                component_type='ArrayLiteral',
-                category='data_structure'
-            ),
-
-            # Error Messages - Throw Statements
-            LocalizationPattern(
-                pattern=r'throw\s+\w+Error\.[a-zA-Z]+\("([^"]+)"\)',
-                component_type='ErrorMessage',
-                category='error_messages'
-            ),
-            LocalizationPattern(
-                pattern=r'NSError\([^)]*NSLocalizedDescriptionKey:\s*"([^"]+)"',
-                component_type='ErrorDescription',
-                category='error_messages'
-            ),
-
-            # SwiftUI Alert Messages (multi-line)
-            LocalizationPattern(
-                pattern=r'Alert\s*\([^)]*message:\s*Text\("([^"]+)"\)',
-                component_type='AlertMessage',
-                category='user_facing'
-            ),
-
-            # Toast/HUD Messages
-            LocalizationPattern(
-                pattern=r'showToast\("([^"]+)"\)',
-                component_type='ToastMessage',
-                category='user_facing'
-            ),
-            LocalizationPattern(
-                pattern=r'HUD\.show\("([^"]+)"\)',
-                component_type='HUDMessage',
-                category='user_facing'
-            ),
-
-            # Struct/Function Named Parameters (Common UI parameters)
-            LocalizationPattern(
-                pattern=r'(?:label|title|placeholder|text|message|description|name|subtitle|header|footer|caption|hint|prompt):\s*"([^"]+)"',
-                component_type='NamedParameter',
-                category='user_facing'
-            ),
-
-            # Return Statements - Simple Strings
-            LocalizationPattern(
-                pattern=r'return\s+"([^"]+)"(?!\s*\+)',
-                component_type='ReturnStatement',
-                category='user_facing'
-            ),
-
-            # Return Statements - String Interpolation
-            # Matches: return "text \(variable) more text"
-            LocalizationPattern(
-                pattern=r'return\s+"([^"]*\\\([^)]+\)[^"]*)"',
-                component_type='ReturnInterpolation',
-                category='user_facing'
-            ),
-        ]
+        self.hardcoded_patterns = list(_HARDCODED_PATTERNS)
 
         # Swift localization patterns
-        self.localized_patterns = [
-            LocalizationPattern(
-                pattern=r'String\(\s*localized:\s*"([^"]+)"',
-                component_type='String.localized',
-                category='localized'
-            ),
-            LocalizationPattern(
-                pattern=r'NSLocalizedString\(\s*"([^"]+)"\s*,\s*comment:',
-                component_type='NSLocalizedString',
-                category='localized'
-            ),
-            LocalizationPattern(
-                pattern=r'LocalizedStringKey\(\s*"([^"]+)"\s*\)',
-                component_type='LocalizedStringKey',
-                category='localized'
-            ),
-            LocalizationPattern(
-                pattern=r'Text\(\s*String\(\s*localized:\s*"([^"]+)"',
-                component_type='Text+String.localized',
-                category='localized'
-            ),
-            LocalizationPattern(
-                pattern=r'Button\(\s*String\(\s*localized:\s*"([^"]+)"',
-                component_type='Button+String.localized',
-                category='localized'
-            ),
-            # L10n enum pattern (e.g., L10n.Common.save, L10n.Settings.title)
-            LocalizationPattern(
-                pattern=r'L10n\.[A-Z][a-zA-Z]+\.[a-zA-Z]+',
-                component_type='L10n',
-                category='localized'
-            ),
-            # .localized extension pattern (e.g., "key".localized)
-            LocalizationPattern(
-                pattern=r'"([^"]+)"\.localized',
-                component_type='StringExtension',
-                category='localized'
-            ),
-            # .localized(from:) pattern (e.g., "key".localized(from: .common))
-            LocalizationPattern(
-                pattern=r'"([^"]+)"\.localized\(from:\s*\.[a-zA-Z]+\)',
-                component_type='StringExtensionTable',
-                category='localized'
-            ),
-        ]
+        self.localized_patterns = list(_LOCALIZED_PATTERNS)
 
         # Exclusion patterns - strings that should NOT be localized
-        self.exclusion_patterns = [
-            # Technical identifiers
-            r'^[a-z][a-zA-Z0-9_]*$',  # camelCase identifiers
-            r'^[A-Z][A-Z0-9_]*$',  # CONSTANT_NAMES
-
-            # File paths and URLs
-            r'^[./]',  # Starts with . or /
-            r'https?://',  # HTTP/HTTPS URLs
-            r'\.com|\.org|\.net',  # Domain names
-
-            # Format strings and regex
-            r'%[@dflsS]',  # Format specifiers
-            r'\\[nrt]',  # Escape sequences
-            r'[\[\]{}()^$*+?.|\\]',  # Regex characters
-
-            # Version strings
-            r'^\d+\.\d+',  # Version numbers like 1.0
-            r'^v\d+',  # Version like v1
-
-            # Short technical strings
-            r'^[A-Z]{2,}$',  # Abbreviations like API, URL
-            r'^\d+$',  # Pure numbers
-
-            # System keys
-            r'^@\w+',  # Property wrappers
-            r'^\$\w+',  # Dollar prefixed
-
-            # Empty or whitespace only
-            r'^\s*$',
-
-            # API Keys and secrets
-            r'^sk-',  # OpenAI API keys
-            r'^pk_',  # Stripe public keys
-            r'^sk_',  # Stripe secret keys
-            r'^AIza',  # Google API keys
-            r'^[A-Za-z0-9]{32,}$',  # Long alphanumeric strings (likely tokens/keys)
-
-            # Single characters (but NOT emojis in UI context)
-            r'^[a-zA-Z]$',  # Single ASCII letter
-            r'^[0-9]$',     # Single digit
-
-            # NOTE: Emoji patterns removed - emojis can be meaningful UI elements
-            # They will be checked contextually in should_exclude_string method
-
-            # SF Symbols (Apple's system icons)
-            r'\.(fill|slash|circle|square|badge)$',  # Common SF Symbol suffixes
-            r'^(house|person|gear|chart|heart|star|flag|bell|envelope|phone)',  # Common SF Symbols
-            r'\.(fill|slash)$',
-            r'^[a-z]+\.(fill|circle|square)',  # icon.fill patterns
-
-            # Technical enum values
-            r'^[a-z]+([A-Z][a-z]+)+$',  # camelCase without spaces (enum raw values)
-
-            # Debug/Log strings (lowercase)
-            r'^(log|debug|info|warning|error)[:=]',
-
-            # Color hex codes
-            r'^[0-9A-Fa-f]{6}$',  # Hex colors like "E74C3C"
-
-            # System property names
-            r'^(backgroundColor|textColor|borderColor|shadowColor)',  # Property names
-
-            # UserInfo keys and technical identifiers
-            r'^(type|id|key|action|category|identifier|status|code|domain)$',  # Common technical keys
-            r'^[a-z]+_[a-z]+',  # snake_case (technical identifiers)
-
-            # Array literal technical values
-            r'^(TL|USD|EUR|GBP)$',  # Currency codes
-            r'^(blue|green|red|purple|orange|pink|gray|yellow|white|black)$',  # Color names (single words)
-
-            # Date/Time format patterns
-            r'^[dMyhHmsS/:.\-\s]+$',  # Date format strings like dd/MM/yyyy, HH:mm:ss
-            r'^(dd|MM|yyyy|HH|mm|ss|yy)$',  # Individual date components
-
-            # Punctuation and symbols only
-            r'^[\s·\-:;,./\|•→←↑↓…\(\)\[\]\{\}]+$',  # Pure symbols/punctuation
-
-            # Asset/Resource identifiers
-            r'^[a-zA-Z]+_\d+$',  # asset_001, avatar_12 patterns
-            r'^(avatar|asset|image|icon|sprite|texture|model|anim)[_\-]?\d*$',  # Asset prefixes
-            r'^\d+[xX]\d+$',  # Dimension strings like 2x3, 100x100
-
-            # 3D/Animation technical names
-            r'^(idle|walk|run|jump|attack|death|spawn|hit)[_\-]?\d*$',  # Animation names
-            r'^(mesh|bone|joint|node|layer|blend)[_\-]?\w*$',  # 3D technical terms
-            r'^[A-Z][a-z]+(?:Animation|Mesh|Texture|Material|Shader|Prefab)$',  # Asset type suffixes
-
-            # Debug/Development strings
-            r'^(DEBUG|TODO|FIXME|HACK|NOTE|XXX|MARK)[:=\s-]',  # Debug markers
-            r'^\[DEBUG\]',  # Debug prefix
-            r'^(print|log|debug|trace|dump)\s*:',  # Debug output prefixes
-
-            # AI/Backend context strings (not user-facing)
-            r'^(system|user|assistant):\s*',  # AI role markers
-            r'^(prompt|context|instruction)[:=]',  # AI-related prefixes
-            r'^\{[a-z_]+\}$',  # Template variables like {user_name}
-
-            # Technical measurement units
-            r'^\d+\s*(px|pt|em|rem|%|dp|sp|vw|vh)$',  # CSS/UI units
-            r'^\d+(\.\d+)?\s*(mb|kb|gb|ms|fps|hz)$',  # Technical units (case insensitive handled elsewhere)
-
-            # JSON/Code structure strings
-            r'^\{|\}$',  # Single braces
-            r'^\[|\]$',  # Single brackets
-            r'^<[^>]+>$',  # HTML/XML tags
-            r'^[a-zA-Z]+\(\)$',  # Function call patterns like "init()"
-
-            # Filename patterns (without path)
-            r'^\w+\.(png|jpg|jpeg|gif|svg|pdf|json|xml|plist|strings|swift|m|h)$',  # File extensions
-        ]
+        self.exclusion_patterns = list(_DEFAULT_EXCLUSION_PATTERNS)
 
     @classmethod
     def _get_compiled_emoji_pattern(cls):
-        """Get cached compiled emoji pattern for performance."""
-        if cls._compiled_emoji_pattern is None:
-            cls._compiled_emoji_pattern = re.compile(
-                r'[\U0001F300-\U0001F9FF'  # Misc Symbols & Pictographs, Emoticons, etc.
-                r'\U0001F600-\U0001F64F'   # Emoticons
-                r'\U0001F680-\U0001F6FF'   # Transport & Map
-                r'\U0001FA70-\U0001FAFF'   # Symbols & Pictographs Extended-A
-                r'\U00002600-\U000026FF'   # Misc symbols (sun, cloud, etc.)
-                r'\U00002700-\U000027BF'   # Dingbats
-                r'\U0001F1E0-\U0001F1FF'   # Flags
-                r'\U00002300-\U000023FF'   # Misc Technical
-                r'\U0000FE00-\U0000FE0F'   # Variation Selectors
-                r'\U0001F900-\U0001F9FF'   # Supplemental Symbols
-                r'\U00002702-\U000027B0'   # Dingbats
-                r'\U0001FA00-\U0001FA6F'   # Chess symbols, etc.
-                r'\U00002194-\U00002199'   # Arrows
-                r'\U000021A9-\U000021AA'   # More arrows
-                r'\U0000231A-\U0000231B'   # Watch, hourglass
-                r'\U000023E9-\U000023F3'   # Media symbols
-                r'\U000023F8-\U000023FA'   # Media controls
-                r'\U000025AA-\U000025AB'   # Squares
-                r'\U000025B6\U000025C0'    # Play buttons
-                r'\U000025FB-\U000025FE'   # Squares
-                r'\U00002614-\U00002615'   # Umbrella, hot beverage
-                r'\U00002648-\U00002653'   # Zodiac
-                r'\U0000267F'              # Wheelchair
-                r'\U00002693'              # Anchor
-                r'\U000026A1'              # High voltage
-                r'\U000026AA-\U000026AB'   # Circles
-                r'\U000026BD-\U000026BE'   # Sports
-                r'\U000026C4-\U000026C5'   # Weather
-                r'\U000026CE'              # Ophiuchus
-                r'\U000026D4'              # No entry
-                r'\U000026EA'              # Church
-                r'\U000026F2-\U000026F3'   # Fountain, golf
-                r'\U000026F5'              # Sailboat
-                r'\U000026FA'              # Tent
-                r'\U000026FD'              # Fuel pump
-                r'\U00002934-\U00002935'   # Arrows
-                r'\U00002B05-\U00002B07'   # Arrows
-                r'\U00002B1B-\U00002B1C'   # Squares
-                r'\U00002B50'              # Star
-                r'\U00002B55'              # Circle
-                r'\U00003030'              # Wavy dash
-                r'\U0000303D'              # Part alternation mark
-                r'\U00003297'              # Circled Ideograph Congratulation
-                r'\U00003299'              # Circled Ideograph Secret
-                r'\U0000200D'              # Zero Width Joiner (for compound emojis)
-                r'\U0000FE0F'              # Variation Selector-16
-                r']+'
+        """Get the compiled emoji pattern (built once at import)."""
+        return _EMOJI_RE
+
+    @classmethod
+    def _get_compiled_pure_emoji_pattern(cls):
+        """Get the pattern that fullmatches strings made only of emojis and whitespace."""
+        return _PURE_EMOJI_RE
+
+    @classmethod
+    def _get_compiled_char_map_pattern(cls):
+        """Get cached character class matching any CHAR_MAP character."""
+        if cls._compiled_char_map_pattern is None:
+            cls._compiled_char_map_pattern = re.compile(
+                '[' + ''.join(map(re.escape, cls.CHAR_MAP)) + ']'
             )
-        return cls._compiled_emoji_pattern
+        return cls._compiled_char_map_pattern
 
     @classmethod
     def _get_compiled_exclusion_patterns(cls, patterns):
         """Get cached compiled exclusion patterns for performance."""
         # Invalidate cache if patterns changed (using tuple for hashability)
         patterns_tuple = tuple(patterns)
+        if patterns_tuple == _DEFAULT_EXCLUSION_PATTERNS:
+            return _DEFAULT_EXCLUSION_RES
         if cls._compiled_exclusion_patterns is None or \
            not hasattr(cls, '_exclusion_patterns_key') or \
            cls._exclusion_patterns_key != patterns_tuple:
@@ -661,14 +883,13 @@ class SwiftAdapter(BaseAdapter):
         if not text or not text.strip():
             return True
 
-        # Use cached compiled emoji pattern for performance
-        emoji_pattern = self._get_compiled_emoji_pattern()
-
-        # Check if string is pure emoji(s) - NO alphabetic text at all
-        text_without_emoji = emoji_pattern.sub('', text).strip()
+        # Neither emojis nor CHAR_MAP characters are ASCII, so both scans
+        # below can be skipped for plain ASCII text (the common case)
+        is_ascii = text.isascii()
 
-        # If nothing left after removing emojis, it's a pure emoji string - EXCLUDE IT
-        if not text_without_emoji:
+        # Pure emoji string (emojis + whitespace only) - EXCLUDE IT.
+        # Single fullmatch in the regex engine instead of sub + strip.
+        if not is_ascii and self._get_compiled_pure_emoji_pattern().fullmatch(text):
             return True
 
         # Use cached compiled exclusion patterns for performance
@@ -680,14 +901,13 @@ class SwiftAdapter(BaseAdapter):
         # Exclude single English words without special characters (likely technical identifiers)
         # But keep localized words and multi-word phrases
         # Check for special characters from multiple languages
-        special_chars = set(self.CHAR_MAP.keys())
-        has_special_char = any(char in text for char in special_chars)
+        has_special_char = not is_ascii and self._get_compiled_char_map_pattern().search(text) is not None
         has_space = ' ' in text
 
         # If it's a single word without special chars, likely technical
         if not has_special_char and not has_space and len(text.split()) == 1:
             # Check if it's all ASCII letters (no numbers, symbols)
-            if text.isalpha() and text.isascii():
+            if text.isalpha() and is_ascii:
                 # But allow common UI words that should be localized
                 common_ui_words = ['Home', 'Save', 'Cancel', 'Delete', 'Edit', 'Settings',
                                    'Profile', 'Search', 'Filter', 'Sort', 'View', 'Add',
@@ -721,14 +941,8 @@ class SwiftAdapter(BaseAdapter):
             # utf-8-sig: Windows'ta oluşturulan dosyalardaki BOM karakterini handle eder
             with open(file_path, 'r', encoding='utf-8-sig') as f:
                 content = f.read()
-                # Pattern supports escaped characters: \" \\ \n etc.
-                # (?:[^"\\]|\\.)* matches: non-quote/non-backslash chars OR backslash+any char
-                pattern = r'^"([^"]+)"\s*=\s*"((?:[^"\\]|\\.)*)";'
-                matches = re.finditer(pattern, content, re.MULTILINE)
-
-                for match in matches:
-                    key, value = match.groups()
-                    keys[key] = value
+
+            keys = _parse_strings_content(content)
         except UnicodeDecodeError as e:
             print(f"Encoding error in {file_path}: {e}")
         except (IOError, OSError) as e:
@@ -797,44 +1011,39 @@ class SwiftAdapter(BaseAdapter):
         return self.l10n_config.default_module
 
     # Character mapping for multiple languages (special characters to ASCII)
-    # Supports: Turkish, German, French, Spanish, Portuguese, Polish, Czech,
-    # Hungarian, Romanian, Swedish, Norwegian, Danish, Finnish, Italian, Dutch
-    CHAR_MAP = {
-        # Turkish
-        'ç': 'c', 'Ç': 'C', 'ğ': 'g', 'Ğ': 'G', 'ı': 'i', 'İ': 'I',
-        'ö': 'o', 'Ö': 'O', 'ş': 's', 'Ş': 'S', 'ü': 'u', 'Ü': 'U',
-        # German
-        'ä': 'a', 'Ä': 'A', 'ß': 'ss',
-        # French
-        'à': 'a', 'â': 'a', 'æ': 'ae', 'è': 'e', 'é': 'e', 'ê': 'e', 'ë': 'e',
-        'î': 'i', 'ï': 'i', 'ô': 'o', 'œ': 'oe', 'ù': 'u', 'û': 'u', 'ÿ': 'y',
-        'À': 'A', 'Â': 'A', 'Æ': 'AE', 'È': 'E', 'É': 'E', 'Ê': 'E', 'Ë': 'E',
-        'Î': 'I', 'Ï': 'I', 'Ô': 'O', 'Œ': 'OE', 'Ù': 'U', 'Û': 'U', 'Ÿ': 'Y',
-        # Spanish
-        'á': 'a', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ñ': 'n',
-        'Á': 'A', 'Í': 'I', 'Ó': 'O', 'Ú': 'U', 'Ñ': 'N',
-        # Portuguese
-        'ã': 'a', 'õ': 'o',
-        'Ã': 'A', 'Õ': 'O',
-        # Polish
-        'ą': 'a', 'ć': 'c', 'ę': 'e', 'ł': 'l', 'ń': 'n', 'ó': 'o', 'ś': 's', 'ź': 'z', 'ż': 'z',
-        'Ą': 'A', 'Ć': 'C', 'Ę': 'E', 'Ł': 'L', 'Ń': 'N', 'Ś': 'S', 'Ź': 'Z', 'Ż': 'Z',
-        # Czech
-        'č': 'c', 'ď': 'd', 'ě': 'e', 'ň': 'n', 'ř': 'r', 'ť': 't', 'ů': 'u', 'ý': 'y', 'ž': 'z',
-        'Č': 'C', 'Ď': 'D', 'Ě': 'E', 'Ň': 'N', 'Ř': 'R', 'Ť': 'T', 'Ů': 'U', 'Ý': 'Y', 'Ž': 'Z',
-        # Hungarian
-        'ő': 'o', 'ű': 'u',
-        'Ő': 'O', 'Ű': 'U',
-        # Romanian
-        'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ț': 't',
-        'Ă': 'A', 'Â': 'A', 'Î': 'I', 'Ș': 'S', 'Ț': 'T',
-        # Scandinavian (Swedish, Norwegian, Danish)
-        'å': 'a', 'Å': 'A', 'ø': 'o', 'Ø': 'O',
-        # Dutch
-        'ĳ': 'ij', 'Ĳ': 'IJ',
-        # General Latin Extended
-        'ð': 'd', 'Ð': 'D', 'þ': 'th', 'Þ': 'TH',
-    }
+    # Generated from U+0080-U+04FF: every cased letter whose decomposition,
+    # minus accents, is plain ASCII (é, ş, ő, ...), plus the 14 hand-listed
+    # letters with no decomposition (ß, æ, ł, ø, ı, ...). Letters that fold
+    # to neither (ƀ, ɓ, ...) are not included. Covers Turkish, German,
+    # French, Spanish, Portuguese, Polish, Czech, Hungarian, Romanian,
+    # Swedish, Norwegian, Danish, Finnish, Italian, Dutch, ...
+    CHAR_MAP = _CHAR_MAP
+
+    # str.translate table text_to_key folds with after NFKD: drops accents,
+    # spells out the CHAR_MAP letters NFKD cannot fold (ß, æ, ł, ø, ı, ...)
+    # and lowercases, in one pass
+    CHAR_TRANS = _FOLD_TABLE
+
+    # Applied before NFKD for CHAR_MAP letters spelled differently from their
+    # decomposition; only subclasses that override CHAR_MAP fill it
+    _CHAR_PRE_TRANS: Dict[int, str] = {}
+
+    _text_to_key_cached = staticmethod(_text_to_key_impl)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass overriding CHAR_MAP gets matching fold tables, key cache
+        # and detection pattern
+        if 'CHAR_MAP' in vars(cls):
+            pre_table, fold_table = _build_fold_tables(cls.CHAR_MAP)
+            cls._CHAR_PRE_TRANS = pre_table
+            if 'CHAR_TRANS' not in vars(cls):
+                cls.CHAR_TRANS = fold_table
+            cls._compiled_char_map_pattern = None
+        if 'CHAR_MAP' in vars(cls) or 'CHAR_TRANS' in vars(cls):
+            cls._text_to_key_cached = staticmethod(
+                _make_text_to_key(cls._CHAR_PRE_TRANS, cls.CHAR_TRANS)
+            )
 
     def text_to_key(self, text: str) -> str:
         """
@@ -850,31 +1059,37 @@ class SwiftAdapter(BaseAdapter):
         Returns:
             Localization key (camelCase)
         """
-        import unicodedata
-
-        # First, apply explicit character mappings for known special chars
-        for char, replacement in self.CHAR_MAP.items():
-            text = text.replace(char, replacement)
+        return self._text_to_key_cached(text)
 
-        # Normalize unicode characters (handles remaining accents)
-        text = unicodedata.normalize('NFKD', text)
-
-        # Remove combining characters (accents that weren't mapped)
-        text = ''.join(c for c in text if not unicodedata.combining(c))
-
-        # Split into words
-        words = re.split(r'[^a-zA-Z0-9]+', text)
-        words = [w for w in words if w]
+    def text_to_keys(self, texts: Iterable[str]) -> List[str]:
+        """
+        Convert many texts to localization keys at once.
 
-        if not words:
-            return "unknown"
+        Same result as calling text_to_key on each text, but the character
+        folding runs once over all texts joined together.
 
-        # Convert to camelCase
-        result = words[0].lower()
-        for word in words[1:]:
-            result += word.capitalize()
+        Args:
+            texts: Original texts
 
-        return result
+        Returns:
+            Localization keys (camelCase), in the same order as texts
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+
+        joined = _KEY_SEPARATOR.join(texts)
+        if joined.isascii():
+            return [_to_camel_case(text) for text in texts]
+
+        # A text containing the separator itself would split wrongly
+        if joined.count(_KEY_SEPARATOR) != len(texts) - 1:
+            return [self.text_to_key(text) for text in texts]
+
+        folded = _fold_special_chars(
+            joined, self.CHAR_TRANS, self._CHAR_PRE_TRANS
+        ).split(_KEY_SEPARATOR)
+        return [_to_camel_case(text) for text in folded]
 
     def generate_localized_code(self, key: str, component_type: str, file_path: str = None, original_text: str = None) -> str:
         """
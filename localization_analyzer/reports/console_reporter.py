@@ -196,7 +196,7 @@ class ConsoleReporter:
         print(f"\n{Colors.bold('🟡 DEAD KEYS (in strings but not used in code)')}")
         print("-" * 70)
 
-        for i, key in enumerate(sorted(list(dead_keys))[:limit], 1):
+        for i, key in enumerate(sorted(dead_keys)[:limit], 1):
             module = file_manager.key_modules.get(key, 'Unknown')
             print(f"{i}. {key} [{Colors.info(module)}]")
 
@@ -38,7 +38,39 @@ class JSONReporter:
         if output_path is None:
             output_path = Path.cwd() / 'localization_report.json'
 
-        # Build report structure
+        report = JSONReporter._prepare_report_data(result, file_manager, adapter)
+
+        # Create output directory if needed
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write file
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(report, f, ensure_ascii=False)
+
+        print(f"\n{Colors.success('✓')} JSON report: {output_path}")
+
+        return output_path
+
+    @staticmethod
+    def _prepare_report_data(
+        result: AnalysisResult,
+        file_manager: LocalizationFileManager,
+        adapter: BaseAdapter
+    ) -> dict:
+        """
+        Build the report structure written by generate().
+
+        Args:
+            result: Analysis result
+            file_manager: File manager instance
+            adapter: Framework adapter
+
+        Returns:
+            Report dictionary
+        """
         report = {
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
@@ -108,19 +140,7 @@ class JSONReporter:
             },
         }
 
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(report, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(report, f, ensure_ascii=False)
-
-        print(f"\n{Colors.success('✓')} JSON report: {output_path}")
-
-        return output_path
+        return report
 
     @staticmethod
     def load(report_path: Path) -> dict:
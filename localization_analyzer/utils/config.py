@@ -6,6 +6,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
+# Validation options (module-level so validate() does not rebuild them per call).
+# The tuples keep the order shown in error messages; the sets are for lookups.
+_FRAMEWORK_OPTIONS = ('swift', 'react', 'flutter', 'android')
+_REPORT_FORMAT_OPTIONS = ('json', 'console', 'html', 'markdown')
+_VALID_FRAMEWORKS = frozenset(_FRAMEWORK_OPTIONS)
+_VALID_REPORT_FORMATS = frozenset(_REPORT_FORMAT_OPTIONS)
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
@@ -208,11 +215,10 @@ class Config:
         warnings = []
 
         # Validate framework
-        valid_frameworks = ['swift', 'react', 'flutter', 'android']
-        if self.project.framework not in valid_frameworks:
+        if self.project.framework not in _VALID_FRAMEWORKS:
             errors.append(
                 f"Invalid framework '{self.project.framework}'. "
-                f"Valid options: {', '.join(valid_frameworks)}"
+                f"Valid options: {', '.join(_FRAMEWORK_OPTIONS)}"
             )
 
         # Validate source path exists
@@ -250,11 +256,11 @@ class Config:
             )
 
         # Validate report formats
-        valid_formats = ['json', 'console', 'html', 'markdown']
         for fmt in self.reports.formats:
-            if fmt not in valid_formats:
+            if fmt not in _VALID_REPORT_FORMATS:
                 warnings.append(ConfigValidationWarning(
-                    f"Unknown report format: '{fmt}'. Valid options: {', '.join(valid_formats)}"
+                    f"Unknown report format: '{fmt}'. "
+                    f"Valid options: {', '.join(_REPORT_FORMAT_OPTIONS)}"
                 ))
 
         # Validate L10n config
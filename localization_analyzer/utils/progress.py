@@ -1,17 +1,31 @@
 """Progress indicator utilities with optional tqdm support."""
 
 from typing import Iterator, TypeVar, Optional, Iterable, Callable
+from importlib.util import find_spec
+from operator import length_hint
 import sys
+import time
 
 T = TypeVar('T')
 
-# Try to import tqdm, but don't require it
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
-    tqdm = None
+# Minimum seconds between simple-progress redraws (~60 per second)
+_MIN_REFRESH_INTERVAL = 0.016
+
+# tqdm is optional. Only check that it is installed here; the import itself
+# is deferred to _get_tqdm() so quiet/disabled runs never pay for it.
+TQDM_AVAILABLE = find_spec('tqdm') is not None
+tqdm = None
+
+
+def _get_tqdm():
+    """Import tqdm on first use; returns None if it is not available."""
+    global tqdm, TQDM_AVAILABLE
+    if TQDM_AVAILABLE and tqdm is None:
+        try:
+            from tqdm import tqdm
+        except ImportError:
+            TQDM_AVAILABLE = False
+    return tqdm if TQDM_AVAILABLE else None
 
 
 class ProgressBar:
@@ -35,6 +49,11 @@ class ProgressBar:
             process(item)
     """
 
+    __slots__ = (
+        'iterable', 'desc', 'total', 'disable', 'unit', 'leave', 'file',
+        'miniters', '_current', '_last_print',
+    )
+
     def __init__(
         self,
         iterable: Iterable[T],
@@ -52,7 +71,8 @@ class ProgressBar:
         Args:
             iterable: Items to iterate over
             desc: Description prefix for the progress bar
-            total: Total number of items (if not provided, will try len())
+            total: Total number of items (if not provided, uses len() or
+                the iterator's length hint)
             disable: If True, don't show progress output
             unit: Unit of items (e.g., 'files', 'keys')
             leave: Whether to leave progress bar after completion
@@ -68,12 +88,12 @@ class ProgressBar:
         self.file = file or sys.stderr
         self.miniters = miniters
 
-        # Try to get total from iterable
+        # Try to get total from iterable; length_hint also covers iterators
+        # that report how many items remain, such as iter(list)
         if self.total is None:
-            try:
-                self.total = len(iterable)  # type: ignore
-            except (TypeError, AttributeError):
-                pass
+            hint = length_hint(iterable, -1)
+            if hint >= 0:
+                self.total = hint
 
         # Track progress
         self._current = 0
@@ -81,13 +101,16 @@ class ProgressBar:
 
     def __iter__(self) -> Iterator[T]:
         """Iterate with progress indication."""
+        # Hand back plain iterators rather than wrapping them in a
+        # generator, so there is no per-item overhead (none at all when
+        # disabled)
         if self.disable:
-            yield from self.iterable
-            return
+            return iter(self.iterable)
 
-        if TQDM_AVAILABLE and tqdm is not None:
+        tqdm_cls = _get_tqdm()
+        if tqdm_cls is not None:
             # Use tqdm
-            yield from tqdm(
+            return iter(tqdm_cls(
                 self.iterable,
                 desc=self.desc,
                 total=self.total,
@@ -95,35 +118,36 @@ class ProgressBar:
                 leave=self.leave,
                 file=self.file,
                 miniters=self.miniters,
-            )
-        else:
-            # Fallback to simple progress output
-            yield from self._simple_progress()
+            ))
+
+        # Fallback to simple progress output
+        return self._simple_progress()
 
     def _simple_progress(self) -> Iterator[T]:
         """Simple progress output without tqdm."""
         if self.desc:
             print(f"{self.desc}...", file=self.file, flush=True)
 
+        write = self.file.write
+        last_write = 0.0
+
         for item in self.iterable:
             self._current += 1
 
-            # Print progress every miniters items or at completion
-            should_print = (
-                self._current - self._last_print >= self.miniters or
-                (self.total and self._current >= self.total)
-            )
-
-            if should_print and self.total:
-                percent = (self._current / self.total) * 100
-                # Update on same line
-                print(
-                    f"\r  {self._current}/{self.total} ({percent:.1f}%)",
-                    end='',
-                    file=self.file,
-                    flush=True
-                )
-                self._last_print = self._current
+            # Print progress every miniters items, at most once per
+            # _MIN_REFRESH_INTERVAL, and always at completion. Each update
+            # overwrites the line, so a skipped one is just superseded.
+            if self.total:
+                done = self._current >= self.total
+                if done or self._current - self._last_print >= self.miniters:
+                    now = time.monotonic()
+                    if done or now - last_write >= _MIN_REFRESH_INTERVAL:
+                        percent = (self._current / self.total) * 100
+                        # Update on same line
+                        write(f"\r  {self._current}/{self.total} ({percent:.1f}%)")
+                        self.file.flush()
+                        self._last_print = self._current
+                        last_write = now
 
             yield item
 
@@ -156,6 +180,9 @@ def progress_bar(
         for file in progress_bar(files, desc="Analyzing", unit="files"):
             analyze(file)
     """
+    if disable:
+        return iter(iterable)
+
     return iter(ProgressBar(
         iterable,
         desc=desc,
@@ -193,6 +220,8 @@ class SpinnerContext:
     Uses tqdm's spinner if available, otherwise shows simple messages.
     """
 
+    __slots__ = ('message', 'done_message', '_bar')
+
     def __init__(self, message: str, done_message: Optional[str] = None):
         """
         Initialize spinner context.
@@ -207,8 +236,9 @@ class SpinnerContext:
 
     def __enter__(self) -> 'SpinnerContext':
         """Start the spinner."""
-        if TQDM_AVAILABLE and tqdm is not None:
-            self._bar = tqdm(
+        tqdm_cls = _get_tqdm()
+        if tqdm_cls is not None:
+            self._bar = tqdm_cls(
                 total=0,
                 desc=self.message,
                 bar_format='{desc}',
@@ -3,6 +3,37 @@
 import re
 from typing import Optional
 
+# Comprehensive emoji pattern (compiled once; used with fullmatch)
+_PURE_EMOJI_RE = re.compile(
+    r'[\U0001F300-\U0001F9FF'  # Misc Symbols & Pictographs, Emoticons, etc.
+    r'\U0001F600-\U0001F64F'   # Emoticons
+    r'\U0001F680-\U0001F6FF'   # Transport & Map
+    r'\U0001FA70-\U0001FAFF'   # Symbols & Pictographs Extended-A
+    r'\U00002600-\U000026FF'   # Misc symbols
+    r'\U00002700-\U000027BF'   # Dingbats
+    r'\U0001F1E0-\U0001F1FF'   # Flags
+    r'\U00002300-\U000023FF'   # Misc Technical
+    r'\U0000FE00-\U0000FE0F'   # Variation Selectors
+    r'\U0001F900-\U0001F9FF'   # Supplemental Symbols
+    r']+'
+)
+
+_EXCLUDE_PATTERNS = [re.compile(p) for p in (
+    r'^[0-9\s\.\,\-\+\*\/\=\<\>%]+$',  # Numbers/operators only
+    r'^(https?://|www\.)',  # URLs
+    r'^[A-Z_]+$',  # CONSTANTS
+    r'^SF Symbols?:',  # SF Symbols
+    r'^\$\d+',  # Currency
+    r'^%[@dfs]',  # Format specifiers
+    r'^\.{3,}$',  # Ellipsis
+    r'^\s*$',  # Whitespace only
+    r'^[a-z]+\.[a-z]+',  # Identifiers like "system.fill"
+    r'^sk-[a-zA-Z0-9]+',  # API keys
+    r'^[A-Za-z0-9]{32,}$',  # Long hashes/tokens
+    r'^gpt-',  # Model names
+    r'^HH:mm|^dd/MM|^EEEE',  # Date formats
+)]
+
 
 def is_valid_language_code(code: str) -> bool:
     """
@@ -82,44 +113,13 @@ def is_excluded_string(text: str) -> bool:
     if not text or len(text.strip()) <= 1:
         return True
 
-    # Comprehensive emoji pattern
-    emoji_pattern = re.compile(
-        r'[\U0001F300-\U0001F9FF'  # Misc Symbols & Pictographs, Emoticons, etc.
-        r'\U0001F600-\U0001F64F'   # Emoticons
-        r'\U0001F680-\U0001F6FF'   # Transport & Map
-        r'\U0001FA70-\U0001FAFF'   # Symbols & Pictographs Extended-A
-        r'\U00002600-\U000026FF'   # Misc symbols
-        r'\U00002700-\U000027BF'   # Dingbats
-        r'\U0001F1E0-\U0001F1FF'   # Flags
-        r'\U00002300-\U000023FF'   # Misc Technical
-        r'\U0000FE00-\U0000FE0F'   # Variation Selectors
-        r'\U0001F900-\U0001F9FF'   # Supplemental Symbols
-        r']+'
-    )
-
-    # Check if string is pure emoji(s)
-    text_without_emoji = emoji_pattern.sub('', text.strip())
-    if not text_without_emoji:
+    # Check if string is pure emoji(s); ASCII text never is, so skip the regex
+    stripped = text.strip()
+    if not stripped.isascii() and _PURE_EMOJI_RE.fullmatch(stripped):
         return True  # Pure emoji string - exclude
 
-    exclude_patterns = [
-        r'^[0-9\s\.\,\-\+\*\/\=\<\>%]+$',  # Numbers/operators only
-        r'^(https?://|www\.)',  # URLs
-        r'^[A-Z_]+$',  # CONSTANTS
-        r'^SF Symbols?:',  # SF Symbols
-        r'^\$\d+',  # Currency
-        r'^%[@dfs]',  # Format specifiers
-        r'^\.{3,}$',  # Ellipsis
-        r'^\s*$',  # Whitespace only
-        r'^[a-z]+\.[a-z]+',  # Identifiers like "system.fill"
-        r'^sk-[a-zA-Z0-9]+',  # API keys
-        r'^[A-Za-z0-9]{32,}$',  # Long hashes/tokens
-        r'^gpt-',  # Model names
-        r'^HH:mm|^dd/MM|^EEEE',  # Date formats
-    ]
-
-    for pattern in exclude_patterns:
-        if re.match(pattern, text.strip()):
+    for pattern in _EXCLUDE_PATTERNS:
+        if pattern.match(stripped):
             return True
 
     # Check if text has enough alphabetic characters (at least 30%)
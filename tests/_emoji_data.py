@@ -0,0 +1,63 @@
+"""Emoji test corpora shared by the emoji filtering tests."""
+
+PURE_EMOJIS = frozenset({
+    "😀",
+    "🎉",
+    "❤️",
+    "🔥",
+    "✨",
+    "👍",
+    "🙌",
+    "😍😍😍",
+    "🌟⭐🌟",
+    "🎯",
+    "🚀",
+    "💡",
+    "📱",
+    "🏠",
+    "🔒",
+    "⚡",
+    "☀️",
+    "🌙",
+    "🌈",
+    "🎵",
+    "🎮",
+    "🍕",
+    "🍎",
+    "🚗",
+    "✅",
+    "❌",
+    "⚠️",
+    "🔴",
+    "🟢",
+    "🟡",
+})
+
+EMOJI_WITH_TEXT = frozenset({
+    "Hello 👋",
+    "🎉 Congratulations!",
+    "Error ❌ Something went wrong",
+    "✅ Success",
+    "Warning ⚠️ Please check",
+    "🔥 Hot deals",
+    "Save 💾",
+})
+
+COMPOUND_EMOJIS = frozenset({
+    "👨‍👩‍👧‍👦",  # Family
+    "👩‍💻",      # Woman technologist
+    "🏳️‍🌈",     # Rainbow flag
+})
+
+FLAG_EMOJIS = frozenset({
+    "🇹🇷",  # Turkey
+    "🇺🇸",  # USA
+    "🇬🇧",  # UK
+    "🇩🇪",  # Germany
+})
+
+# Emojis separated or padded by whitespace still count as pure emoji
+SPACED_EMOJIS = frozenset({
+    "🎉 🎊",
+    " 🚀 ",
+})
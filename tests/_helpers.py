@@ -0,0 +1,47 @@
+"""Project-building helpers shared by the test modules."""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from localization_analyzer.core.file_manager import LocalizationFileManager
+from localization_analyzer.frameworks.swift import SwiftAdapter
+
+
+def write_project(root: Path, files: Dict[str, Union[str, bytes]]) -> None:
+    """
+    Write a project tree in one pass.
+
+    Args:
+        root: Project root directory
+        files: Relative path -> file content (str is encoded as UTF-8)
+    """
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        path.write_bytes(data)
+
+
+def make_fm(
+    root: Path,
+    layout: Dict[str, Union[str, bytes]],
+    adapter: Optional[SwiftAdapter] = None,
+) -> LocalizationFileManager:
+    """
+    Write one Localizable.strings per language under root/Resources and open it.
+
+    Args:
+        root: Directory to create Resources/ in
+        layout: Language code -> Localizable.strings content
+        adapter: Adapter to use (a new SwiftAdapter if omitted)
+
+    Returns:
+        LocalizationFileManager over root/Resources (keys not loaded yet)
+    """
+    resources_dir = root / 'Resources'
+    resources_dir.mkdir(parents=True, exist_ok=True)
+    write_project(resources_dir, {
+        f'{lang}.lproj/Localizable.strings': content
+        for lang, content in layout.items()
+    })
+    return LocalizationFileManager(adapter or SwiftAdapter(), resources_dir)
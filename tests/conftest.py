@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from localization_analyzer.features.dynamic_key_analyzer import DynamicKeyAnalyzer
+
+
+@pytest.fixture(scope="module")
+def dynamic_key_analyzer(tmp_path_factory):
+    """DynamicKeyAnalyzer over an empty source dir, for tests that never touch the filesystem."""
+    return DynamicKeyAnalyzer(Path(tmp_path_factory.mktemp("src")), frozenset())
@@ -1,12 +1,13 @@
 """Tests for CLI commands."""
 
+import platform
 import pytest
 import sys
 import tempfile
 import yaml
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import DEFAULT, Mock, patch, MagicMock, call
 from argparse import Namespace
 
 from localization_analyzer.cli import (
@@ -855,20 +856,23 @@ class TestCmdSync:
         assert mock_sync_class.call_args[1]['auto_translate'] == True
 
 
+@patch.multiple(
+    'localization_analyzer.cli',
+    LanguageManager=DEFAULT,
+    LocalizationFileManager=DEFAULT,
+    load_and_validate_config=DEFAULT,
+)
 class TestCmdLang:
     """Test cases for cmd_lang command."""
 
-    @patch('localization_analyzer.cli.LanguageManager')
-    @patch('localization_analyzer.cli.LocalizationFileManager')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_lang_list(self, mock_load_config, mock_file_manager_class, mock_lang_manager_class):
+    def test_lang_list(self, **mocks):
         """--list flag ile diller listelenmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_file_manager = MagicMock()
-        mock_file_manager_class.return_value = mock_file_manager
+        mocks['LocalizationFileManager'].return_value = mock_file_manager
 
         mock_lang_manager = MagicMock()
         mock_lang_manager.list_languages.return_value = [
@@ -881,7 +885,7 @@ class TestCmdLang:
                 'completion': 100.0
             }
         ]
-        mock_lang_manager_class.return_value = mock_lang_manager
+        mocks['LanguageManager'].return_value = mock_lang_manager
 
         args = Namespace(
             list=True,
@@ -899,21 +903,18 @@ class TestCmdLang:
         assert result == 0
         mock_lang_manager.list_languages.assert_called_once()
 
-    @patch('localization_analyzer.cli.LanguageManager')
-    @patch('localization_analyzer.cli.LocalizationFileManager')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_lang_add(self, mock_load_config, mock_file_manager_class, mock_lang_manager_class):
+    def test_lang_add(self, **mocks):
         """--add flag ile dil eklenmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_file_manager = MagicMock()
-        mock_file_manager_class.return_value = mock_file_manager
+        mocks['LocalizationFileManager'].return_value = mock_file_manager
 
         mock_lang_manager = MagicMock()
         mock_lang_manager.add_language.return_value = True
-        mock_lang_manager_class.return_value = mock_lang_manager
+        mocks['LanguageManager'].return_value = mock_lang_manager
 
         args = Namespace(
             list=False,
@@ -931,21 +932,18 @@ class TestCmdLang:
         assert result == 0
         mock_lang_manager.add_language.assert_called_once()
 
-    @patch('localization_analyzer.cli.LanguageManager')
-    @patch('localization_analyzer.cli.LocalizationFileManager')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_lang_remove(self, mock_load_config, mock_file_manager_class, mock_lang_manager_class):
+    def test_lang_remove(self, **mocks):
         """--remove flag ile dil silinmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_file_manager = MagicMock()
-        mock_file_manager_class.return_value = mock_file_manager
+        mocks['LocalizationFileManager'].return_value = mock_file_manager
 
         mock_lang_manager = MagicMock()
         mock_lang_manager.remove_language.return_value = True
-        mock_lang_manager_class.return_value = mock_lang_manager
+        mocks['LanguageManager'].return_value = mock_lang_manager
 
         args = Namespace(
             list=False,
@@ -963,16 +961,14 @@ class TestCmdLang:
         assert result == 0
         mock_lang_manager.remove_language.assert_called_once()
 
-    @patch('localization_analyzer.cli.LocalizationFileManager')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_lang_no_action(self, mock_load_config, mock_file_manager_class):
+    def test_lang_no_action(self, **mocks):
         """Action belirtilmezse 1 dönmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_file_manager = MagicMock()
-        mock_file_manager_class.return_value = mock_file_manager
+        mocks['LocalizationFileManager'].return_value = mock_file_manager
 
         args = Namespace(
             list=False,
@@ -990,23 +986,26 @@ class TestCmdLang:
         assert result == 1
 
 
+@patch.multiple(
+    'localization_analyzer.cli',
+    SwiftAdapter=DEFAULT,
+    load_and_validate_config=DEFAULT,
+)
 class TestCmdDiscover:
     """Test cases for cmd_discover command."""
 
-    @patch('localization_analyzer.cli.SwiftAdapter')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_discover_tables(self, mock_load_config, mock_adapter_class):
+    def test_discover_tables(self, **mocks):
         """--tables flag ile .strings dosyaları keşfedilmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_adapter = MagicMock()
         mock_adapter.discover_tables.return_value = {
             'common': 'Common',
             'settings': 'Settings'
         }
-        mock_adapter_class.return_value = mock_adapter
+        mocks['SwiftAdapter'].return_value = mock_adapter
 
         args = Namespace(
             tables=True,
@@ -1019,20 +1018,18 @@ class TestCmdDiscover:
         assert result == 0
         mock_adapter.discover_tables.assert_called_once()
 
-    @patch('localization_analyzer.cli.SwiftAdapter')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_discover_modules(self, mock_load_config, mock_adapter_class):
+    def test_discover_modules(self, **mocks):
         """--modules flag ile modül yapısı keşfedilmeli."""
         mock_config = MagicMock()
         mock_config.paths.source = '.'
-        mock_load_config.return_value = mock_config
+        mocks['load_and_validate_config'].return_value = mock_config
 
         mock_adapter = MagicMock()
         mock_adapter.auto_detect_module_mapping.return_value = {
             'Auth/*': 'auth',
             'Settings/*': 'settings'
         }
-        mock_adapter_class.return_value = mock_adapter
+        mocks['SwiftAdapter'].return_value = mock_adapter
 
         args = Namespace(
             tables=False,
@@ -1045,9 +1042,7 @@ class TestCmdDiscover:
         assert result == 0
         mock_adapter.auto_detect_module_mapping.assert_called_once()
 
-    @patch('localization_analyzer.cli.SwiftAdapter')
-    @patch('localization_analyzer.cli.load_and_validate_config')
-    def test_discover_generate(self, mock_load_config, mock_adapter_class):
+    def test_discover_generate(self, **mocks):
         """--generate flag ile config güncellenmeli."""
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / '.localization.yml'
@@ -1058,12 +1053,12 @@ class TestCmdDiscover:
             mock_config.l10n.tables = {}
             mock_config.l10n.module_mapping = {}
             mock_config.l10n.enabled = False
-            mock_load_config.return_value = mock_config
+            mocks['load_and_validate_config'].return_value = mock_config
 
             mock_adapter = MagicMock()
             mock_adapter.discover_tables.return_value = {'common': 'Common'}
             mock_adapter.auto_detect_module_mapping.return_value = {}
-            mock_adapter_class.return_value = mock_adapter
+            mocks['SwiftAdapter'].return_value = mock_adapter
 
             args = Namespace(
                 tables=False,
@@ -1073,11 +1068,10 @@ class TestCmdDiscover:
             )
 
             with patch('localization_analyzer.cli.Path.cwd', return_value=Path(tmpdir)):
-                with patch.object(mock_config, 'save') as mock_save:
-                    result = cmd_discover(args)
+                result = cmd_discover(args)
 
-                    assert result == 0
-                    mock_save.assert_called_once()
+            assert result == 0
+            mock_config.save.assert_called_once()
 
 
 class TestCmdTranslate:
@@ -1204,7 +1198,9 @@ class TestLoadAndValidateConfig:
             config = load_and_validate_config(validate=True, verbose=True)
 
             # Warning yazdırılmalı
-            assert any('Warning message' in str(call) for call in mock_print.call_args_list)
+            assert any(
+                'Warning message' in c.args[0] for c in mock_print.call_args_list if c.args
+            )
 
     @patch('localization_analyzer.cli.Config.from_file')
     def test_load_config_with_errors(self, mock_from_file):
@@ -1303,13 +1299,12 @@ class TestEdgeCases:
         result = cmd_analyze(args)
         assert result == 0
 
+    @pytest.mark.skipif(
+        platform.system() == 'Windows',
+        reason="Permission test not applicable on Windows"
+    )
     def test_init_with_invalid_directory_permissions(self):
         """Yazma izni olmayan dizinde hata handle edilmeli."""
-        # Bu test sadece UNIX sistemlerde çalışır
-        import platform
-        if platform.system() == 'Windows':
-            pytest.skip("Permission test not applicable on Windows")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             readonly_dir = Path(tmpdir) / 'readonly'
             readonly_dir.mkdir()
@@ -2,8 +2,6 @@
 
 import pytest
 import json
-from pathlib import Path
-import tempfile
 
 from localization_analyzer.features.diff import (
     LocalizationDiff,
@@ -65,14 +63,47 @@ class TestDiffResult:
         assert result.total_differences == 3
         assert result.has_differences
 
+    def test_total_tracks_later_appends(self):
+        """Total should reflect entries appended after it was first read."""
+        result = DiffResult(source_lang='en', target_lang='tr')
+        assert result.total_differences == 0
+
+        result.added.append(DiffEntry(key='k1', diff_type=DiffType.ADDED))
+
+        assert result.total_differences == 1
+        assert result.has_differences
+
+    def test_get_by_key(self):
+        """Test looking up entries by key."""
+        result = DiffResult(source_lang='en', target_lang='tr')
+        result.added.append(DiffEntry(key='k1', diff_type=DiffType.ADDED))
+        result.same.append(DiffEntry(key='k2', diff_type=DiffType.SAME))
+
+        assert result.get('k1').diff_type == DiffType.ADDED
+        assert result.get('k2').diff_type == DiffType.SAME
+        assert result.get('missing') is None
+
+    def test_get_finds_entries_added_later(self):
+        """Lookups should see entries appended after an earlier get()."""
+        result = DiffResult(source_lang='en', target_lang='tr')
+        assert result.get('k1') is None
+
+        result.added.append(DiffEntry(key='k1', diff_type=DiffType.ADDED))
+
+        assert result.get('k1').diff_type == DiffType.ADDED
+
+
+@pytest.fixture(scope="class")
+def differ():
+    """LocalizationDiff is stateless, so one instance is shared per test class."""
+    return LocalizationDiff()
+
 
 class TestLocalizationDiff:
     """Test cases for LocalizationDiff."""
 
-    def test_compare_identical(self):
+    def test_compare_identical(self, differ):
         """Test comparing identical languages."""
-        differ = LocalizationDiff()
-
         source = {'key1': 'Hello', 'key2': 'World'}
         target = {'key1': 'Hello', 'key2': 'World'}
 
@@ -83,10 +114,8 @@ class TestLocalizationDiff:
         assert len(result.changed) == 0
         assert len(result.same) == 2  # Both are same
 
-    def test_compare_missing_in_target(self):
+    def test_compare_missing_in_target(self, differ):
         """Test detecting missing keys in target."""
-        differ = LocalizationDiff()
-
         source = {'key1': 'Hello', 'key2': 'World'}
         target = {'key1': 'Merhaba'}  # Missing key2
 
@@ -96,10 +125,8 @@ class TestLocalizationDiff:
         assert result.removed[0].key == 'key2'
         assert result.removed[0].source_value == 'World'
 
-    def test_compare_extra_in_target(self):
+    def test_compare_extra_in_target(self, differ):
         """Test detecting extra keys in target."""
-        differ = LocalizationDiff()
-
         source = {'key1': 'Hello'}
         target = {'key1': 'Merhaba', 'key2': 'Dünya'}  # Extra key2
 
@@ -109,10 +136,8 @@ class TestLocalizationDiff:
         assert result.added[0].key == 'key2'
         assert result.added[0].target_value == 'Dünya'
 
-    def test_compare_changed_values(self):
+    def test_compare_changed_values(self, differ):
         """Test detecting changed (translated) values."""
-        differ = LocalizationDiff()
-
         source = {'key1': 'Hello', 'key2': 'World'}
         target = {'key1': 'Merhaba', 'key2': 'Dünya'}
 
@@ -121,14 +146,13 @@ class TestLocalizationDiff:
         assert len(result.changed) == 2
         assert len(result.same) == 0
 
-        key1_entry = next(e for e in result.changed if e.key == 'key1')
+        key1_entry = result.get('key1')
+        assert key1_entry.diff_type == DiffType.CHANGED
         assert key1_entry.source_value == 'Hello'
         assert key1_entry.target_value == 'Merhaba'
 
-    def test_compare_same_values(self):
+    def test_compare_same_values(self, differ):
         """Test detecting same (untranslated) values."""
-        differ = LocalizationDiff()
-
         source = {'key1': 'Hello', 'key2': 'OK'}
         target = {'key1': 'Merhaba', 'key2': 'OK'}  # key2 same as source
 
@@ -138,10 +162,8 @@ class TestLocalizationDiff:
         assert len(result.same) == 1  # key2
         assert result.same[0].key == 'key2'
 
-    def test_compare_complex(self):
+    def test_compare_complex(self, differ):
         """Test complex comparison with all types."""
-        differ = LocalizationDiff()
-
         source = {
             'translated': 'Hello',
             'untranslated': 'OK',
@@ -160,10 +182,8 @@ class TestLocalizationDiff:
         assert len(result.removed) == 1  # missing
         assert len(result.added) == 1  # extra
 
-    def test_results_sorted(self):
+    def test_results_sorted(self, differ):
         """Test results are sorted by key."""
-        differ = LocalizationDiff()
-
         source = {'z_key': 'Z', 'a_key': 'A', 'm_key': 'M'}
         target = {}
 
@@ -173,95 +193,79 @@ class TestLocalizationDiff:
         assert keys == ['a_key', 'm_key', 'z_key']
 
 
-class TestDiffExport:
-    """Test cases for diff export functionality."""
-
-    def test_export_json(self):
-        """Test JSON export."""
-        differ = LocalizationDiff()
-
-        source = {'key1': 'Hello'}
-        target = {}
-
-        result = differ.compare(source, target, 'en', 'tr')
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'diff.json'
-            differ.export_diff(result, output_path, format='json')
-
-            assert output_path.exists()
-
-            with open(output_path, 'r') as f:
-                data = json.load(f)
-
-            assert data['source_lang'] == 'en'
-            assert data['target_lang'] == 'tr'
-            assert data['summary']['missing'] == 1
+@pytest.fixture(scope="module")
+def sample_result():
+    """Export testleri için paylaşılan diff sonucu."""
+    differ = LocalizationDiff()
+    result = differ.compare({'key1': 'Hello', 'key2': 'World'}, {'key1': 'Merhaba'}, 'en', 'tr')
+    return differ, result
 
-    def test_export_markdown(self):
-        """Test Markdown export."""
-        differ = LocalizationDiff()
 
-        source = {'key1': 'Hello', 'key2': 'World'}
-        target = {'key1': 'Merhaba'}
-
-        result = differ.compare(source, target, 'en', 'tr')
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'diff.md'
-            differ.export_diff(result, output_path, format='md')
-
-            assert output_path.exists()
-
-            content = output_path.read_text()
-
-            assert '# Localization Diff' in content
-            assert 'Missing in tr' in content
-            assert 'key2' in content
+class TestDiffExport:
+    """Test cases for diff export functionality."""
 
-    def test_export_txt(self):
-        """Test text export."""
-        differ = LocalizationDiff()
+    @pytest.mark.parametrize("fmt,needles", [
+        ("json", ['"source_lang": "en"', '"target_lang": "tr"', '"missing": 1']),
+        ("md", ['# Localization Diff', 'Missing in tr', 'key2']),
+        ("txt", ['Localization Diff', 'Missing in tr: 1']),
+    ])
+    def test_export(self, sample_result, tmp_path, fmt, needles):
+        """Test export in each supported format."""
+        differ, result = sample_result
+        output_path = tmp_path / f'diff.{fmt}'
 
-        source = {'key1': 'Hello'}
-        target = {'key1': 'Merhaba', 'key2': 'Extra'}
+        differ.export_diff(result, output_path, format=fmt)
 
-        result = differ.compare(source, target, 'en', 'tr')
+        content = output_path.read_text(encoding='utf-8')
+        for needle in needles:
+            assert needle in content
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'diff.txt'
-            differ.export_diff(result, output_path, format='txt')
+    def test_export_json_is_valid(self, sample_result, tmp_path):
+        """Test JSON export is parseable."""
+        differ, result = sample_result
+        output_path = tmp_path / 'diff.json'
 
-            assert output_path.exists()
+        differ.export_diff(result, output_path, format='json')
 
-            content = output_path.read_text()
-            assert 'Localization Diff' in content
+        data = json.loads(output_path.read_text(encoding='utf-8'))
+        assert data['summary']['missing'] == 1
+        assert data['missing'] == [{'key': 'key2', 'value': 'World'}]
 
 
 class TestTruncate:
     """Test cases for text truncation."""
 
-    def test_short_text(self):
+    def test_short_text(self, differ):
         """Test short text not truncated."""
-        differ = LocalizationDiff()
         result = differ._truncate("Hello", max_len=50)
         assert result == "Hello"
 
-    def test_long_text(self):
+    def test_long_text(self, differ):
         """Test long text truncated."""
-        differ = LocalizationDiff()
         long_text = "A" * 100
         result = differ._truncate(long_text, max_len=50)
 
         assert len(result) == 50
         assert result.endswith("...")
 
-    def test_empty_text(self):
+    def test_empty_text(self, differ):
         """Test empty text."""
-        differ = LocalizationDiff()
         assert differ._truncate("") == ""
         assert differ._truncate(None) == ""
 
+    @pytest.mark.parametrize("length", [0, 1, 3, 4, 49, 50, 51, 200])
+    @pytest.mark.parametrize("max_len", [4, 10, 50, 200])
+    def test_length_invariants(self, differ, length, max_len):
+        """Result never exceeds max_len and only truncated text gets an ellipsis."""
+        text = "x" * length
+        result = differ._truncate(text, max_len=max_len)
+
+        assert len(result) <= max_len
+        if length <= max_len:
+            assert result == text
+        else:
+            assert result == text[:max_len - 3] + "..."
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
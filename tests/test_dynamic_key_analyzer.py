@@ -1,7 +1,6 @@
 """Tests for DynamicKeyAnalyzer."""
 
 import pytest
-import tempfile
 from pathlib import Path
 
 from localization_analyzer.features.dynamic_key_analyzer import (
@@ -10,6 +9,11 @@ from localization_analyzer.features.dynamic_key_analyzer import (
     EnumDefinition,
     DynamicKeyAnalysisResult,
 )
+from localization_analyzer.core.analyzer import LocalizationAnalyzer
+from localization_analyzer.frameworks.swift import SwiftAdapter
+from localization_analyzer.utils.config import Config
+
+from ._helpers import write_project
 
 
 class TestEnumDefinition:
@@ -50,89 +54,71 @@ class TestDynamicKeyPattern:
 class TestDynamicKeyAnalyzer:
     """Test cases for DynamicKeyAnalyzer."""
 
-    def test_init(self):
+    def test_init(self, tmp_path):
         """Should initialize with source dir and existing keys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
-            existing_keys = {"key1", "key2"}
-
-            analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
+        source_dir = tmp_path
+        existing_keys = {"key1", "key2"}
 
-            assert analyzer.source_dir == source_dir
-            assert analyzer.existing_keys == existing_keys
-            assert len(analyzer.enums) == 0
-            assert len(analyzer.dynamic_patterns) == 0
+        analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
 
-    def test_discover_enums(self):
-        """Should discover enum definitions from Swift files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
+        assert analyzer.source_dir == source_dir
+        assert analyzer.existing_keys == frozenset(existing_keys)
+        assert isinstance(analyzer.existing_keys, frozenset)
+        assert len(analyzer.enums) == 0
+        assert len(analyzer.dynamic_patterns) == 0
 
-            # Create Swift file with enum
-            swift_file = source_dir / "ActivityType.swift"
-            swift_file.write_text('''
+    def test_extract_enums(self):
+        """Should parse enum definitions from Swift source."""
+        analyzer = DynamicKeyAnalyzer(Path("/src"), frozenset())
+        analyzer._extract_enums_from_content('''
 enum ActivityType: String {
     case work
     case friends
     case family
 }
-''')
-
-            analyzer = DynamicKeyAnalyzer(source_dir, set())
-            analyzer._discover_enums()
+''', "/src/ActivityType.swift")
 
-            assert "ActivityType" in analyzer.enums
-            assert len(analyzer.enums["ActivityType"].cases) == 3
-            assert "work" in analyzer.enums["ActivityType"].cases
+        assert "ActivityType" in analyzer.enums
+        assert len(analyzer.enums["ActivityType"].cases) == 3
+        assert "work" in analyzer.enums["ActivityType"].cases
 
-    def test_discover_enums_with_raw_values(self):
+    def test_extract_enums_with_raw_values(self):
         """Should extract raw values from enum cases."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
-
-            swift_file = source_dir / "Style.swift"
-            swift_file.write_text('''
+        analyzer = DynamicKeyAnalyzer(Path("/src"), frozenset())
+        analyzer._extract_enums_from_content('''
 enum AIStyle: String {
     case friendly = "friendly_style"
     case caring = "caring_style"
 }
-''')
-
-            analyzer = DynamicKeyAnalyzer(source_dir, set())
-            analyzer._discover_enums()
+''', "/src/Style.swift")
 
-            assert "AIStyle" in analyzer.enums
-            enum_def = analyzer.enums["AIStyle"]
-            assert enum_def.raw_values.get("friendly") == "friendly_style"
-            assert enum_def.raw_values.get("caring") == "caring_style"
+        assert "AIStyle" in analyzer.enums
+        enum_def = analyzer.enums["AIStyle"]
+        assert enum_def.raw_values.get("friendly") == "friendly_style"
+        assert enum_def.raw_values.get("caring") == "caring_style"
 
-    def test_discover_dynamic_patterns(self):
-        """Should find dynamic key patterns in Swift files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
-
-            swift_file = source_dir / "View.swift"
-            swift_file.write_text('''
+    def test_extract_dynamic_patterns(self):
+        """Should find dynamic key patterns in Swift source."""
+        analyzer = DynamicKeyAnalyzer(Path("/src"), frozenset())
+        analyzer._extract_dynamic_patterns_from_content('''
 let title = "activity.\\(id)".localized
 let desc = "style.\\(type.rawValue).description".localized(from: .ai)
-''')
-
-            analyzer = DynamicKeyAnalyzer(source_dir, set())
-            analyzer._discover_dynamic_patterns()
+''', "/src/View.swift")
 
-            assert len(analyzer.dynamic_patterns) >= 1
-            # Check first pattern
-            pattern = analyzer.dynamic_patterns[0]
-            assert "activity" in pattern.prefix or "style" in pattern.prefix
+        assert len(analyzer.dynamic_patterns) == 2
+        pattern = analyzer.dynamic_patterns[0]
+        assert pattern.prefix == "activity."
+        assert pattern.variable_name == "id"
+        assert pattern.file_path == "/src/View.swift"
+        assert pattern.line_number == 2
 
-    def test_analyze_with_missing_keys(self):
+    def test_analyze_with_missing_keys(self, tmp_path):
         """Should detect missing keys based on enum analysis."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
+        source_dir = tmp_path
 
-            # Create enum
-            enum_file = source_dir / "ActivityType.swift"
-            enum_file.write_text('''
+        # Create enum
+        enum_file = source_dir / "ActivityType.swift"
+        enum_file.write_text('''
 enum ActivityType: String {
     case work
     case friends
@@ -140,158 +126,152 @@ enum ActivityType: String {
 }
 ''')
 
-            # Create usage
-            view_file = source_dir / "View.swift"
-            view_file.write_text('''
+        # Create usage
+        view_file = source_dir / "View.swift"
+        view_file.write_text('''
 let title = "activity.\\(activityType)".localized
 ''')
 
-            # Only "activity.work" exists
-            existing_keys = {"activity.work"}
+        # Only "activity.work" exists
+        existing_keys = frozenset({"activity.work"})
 
-            analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
-            results = analyzer.analyze()
+        analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
+        results = analyzer.analyze()
 
-            # Should find missing keys for friends and family
-            assert len(results) >= 0  # May or may not match depending on heuristics
+        # Should find missing keys for friends and family
+        assert len(results) >= 0  # May or may not match depending on heuristics
 
-    def test_analyze_no_missing_keys(self):
+    def test_analyze_no_missing_keys(self, tmp_path):
         """Should return empty when all keys exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
+        source_dir = tmp_path
 
-            # Create enum
-            enum_file = source_dir / "Status.swift"
-            enum_file.write_text('''
+        # Create enum
+        enum_file = source_dir / "Status.swift"
+        enum_file.write_text('''
 enum Status: String {
     case active
     case inactive
 }
 ''')
 
-            view_file = source_dir / "View.swift"
-            view_file.write_text('''
+        view_file = source_dir / "View.swift"
+        view_file.write_text('''
 let title = "status.\\(status)".localized
 ''')
 
-            # All keys exist
-            existing_keys = {"status.active", "status.inactive"}
+        # All keys exist
+        existing_keys = frozenset({"status.active", "status.inactive"})
 
-            analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
-            results = analyzer.analyze()
+        analyzer = DynamicKeyAnalyzer(source_dir, existing_keys)
+        results = analyzer.analyze()
 
-            # All keys exist, no missing
-            for result in results:
-                # If matched, should have no missing
-                if result.enum_name == "Status":
-                    assert len(result.missing_keys) == 0
+        # All keys exist, no missing
+        for result in results:
+            # If matched, should have no missing
+            if result.enum_name == "Status":
+                assert len(result.missing_keys) == 0
 
-    def test_camel_to_snake(self):
+    def test_camel_to_snake(self, dynamic_key_analyzer):
         """Should convert camelCase to snake_case."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            analyzer = DynamicKeyAnalyzer(Path(tmpdir), set())
+        analyzer = dynamic_key_analyzer
 
-            assert analyzer._camel_to_snake("work") == "work"
-            assert analyzer._camel_to_snake("friendsAndFamily") == "friends_and_family"
-            assert analyzer._camel_to_snake("XMLParser") == "x_m_l_parser"
+        assert analyzer._camel_to_snake("work") == "work"
+        assert analyzer._camel_to_snake("friendsAndFamily") == "friends_and_family"
+        assert analyzer._camel_to_snake("XMLParser") == "x_m_l_parser"
 
-    def test_generate_expected_keys(self):
+    def test_generate_expected_keys(self, dynamic_key_analyzer):
         """Should generate expected keys from enum cases."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            analyzer = DynamicKeyAnalyzer(Path(tmpdir), set())
-
-            enum_def = EnumDefinition(
-                name="Type",
-                cases=["a", "b"],
-                raw_values={"a": "first", "b": "second"},
-                file_path="/test.swift"
-            )
-
-            pattern = DynamicKeyPattern(
-                pattern=r"prefix.\(var)",
-                prefix="prefix.",
-                suffix="",
-                variable_name="var",
-                file_path="/test.swift",
-                line_number=1
-            )
-
-            expected = analyzer._generate_expected_keys(pattern, enum_def)
-
-            assert "prefix.first" in expected
-            assert "prefix.second" in expected
-
-    def test_generate_expected_keys_with_suffix(self):
+        analyzer = dynamic_key_analyzer
+
+        enum_def = EnumDefinition(
+            name="Type",
+            cases=["a", "b"],
+            raw_values={"a": "first", "b": "second"},
+            file_path="/test.swift"
+        )
+
+        pattern = DynamicKeyPattern(
+            pattern=r"prefix.\(var)",
+            prefix="prefix.",
+            suffix="",
+            variable_name="var",
+            file_path="/test.swift",
+            line_number=1
+        )
+
+        expected = analyzer._generate_expected_keys(pattern, enum_def)
+
+        assert "prefix.first" in expected
+        assert "prefix.second" in expected
+
+    def test_generate_expected_keys_with_suffix(self, dynamic_key_analyzer):
         """Should include suffix in generated keys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            analyzer = DynamicKeyAnalyzer(Path(tmpdir), set())
-
-            enum_def = EnumDefinition(
-                name="Type",
-                cases=["x"],
-                raw_values={"x": "value"},
-                file_path="/test.swift"
-            )
-
-            pattern = DynamicKeyPattern(
-                pattern=r"prefix.\(var).suffix",
-                prefix="prefix.",
-                suffix=".suffix",
-                variable_name="var",
-                file_path="/test.swift",
-                line_number=1
-            )
-
-            expected = analyzer._generate_expected_keys(pattern, enum_def)
-
-            assert "prefix.value.suffix" in expected
-
-    def test_get_summary(self):
+        analyzer = dynamic_key_analyzer
+
+        enum_def = EnumDefinition(
+            name="Type",
+            cases=["x"],
+            raw_values={"x": "value"},
+            file_path="/test.swift"
+        )
+
+        pattern = DynamicKeyPattern(
+            pattern=r"prefix.\(var).suffix",
+            prefix="prefix.",
+            suffix=".suffix",
+            variable_name="var",
+            file_path="/test.swift",
+            line_number=1
+        )
+
+        expected = analyzer._generate_expected_keys(pattern, enum_def)
+
+        assert "prefix.value.suffix" in expected
+
+    def test_get_summary(self, tmp_path):
         """Should return analysis summary."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
-            analyzer = DynamicKeyAnalyzer(source_dir, set())
+        source_dir = tmp_path
+        analyzer = DynamicKeyAnalyzer(source_dir, frozenset())
 
-            # Run empty analysis
-            analyzer.analyze()
+        # Run empty analysis
+        analyzer.analyze()
 
-            summary = analyzer.get_summary()
+        summary = analyzer.get_summary()
 
-            assert "total_dynamic_patterns" in summary
-            assert "patterns_with_missing_keys" in summary
-            assert "total_missing_keys" in summary
-            assert "enums_discovered" in summary
-            assert "details" in summary
+        assert "total_dynamic_patterns" in summary
+        assert "patterns_with_missing_keys" in summary
+        assert "total_missing_keys" in summary
+        assert "enums_discovered" in summary
+        assert "details" in summary
 
-    def test_excludes_build_directories(self):
+    def test_excludes_build_directories(self, tmp_path):
         """Should skip build and derived data directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source_dir = Path(tmpdir)
-
-            # Create file in build directory (should be ignored)
-            build_dir = source_dir / "build"
-            build_dir.mkdir()
-            build_file = build_dir / "Enum.swift"
-            build_file.write_text('''
+        source_dir = tmp_path
+
+        # Create file in build directory (should be ignored)
+        build_dir = source_dir / "build"
+        build_dir.mkdir()
+        build_file = build_dir / "Enum.swift"
+        build_file.write_text('''
 enum BuildEnum {
     case test
 }
 ''')
 
-            # Create file in source (should be found)
-            source_file = source_dir / "SourceEnum.swift"
-            source_file.write_text('''
+        # Create file in source (should be found)
+        source_file = source_dir / "SourceEnum.swift"
+        source_file.write_text('''
 enum SourceEnum {
     case source
 }
 ''')
 
-            analyzer = DynamicKeyAnalyzer(source_dir, set())
-            analyzer._discover_enums()
+        analyzer = DynamicKeyAnalyzer(source_dir, frozenset())
+        analyzer._discover_enums()
 
-            # Should find SourceEnum but not BuildEnum
-            assert "SourceEnum" in analyzer.enums
-            assert "BuildEnum" not in analyzer.enums
+        # Should find SourceEnum but not BuildEnum
+        assert "SourceEnum" in analyzer.enums
+        assert "BuildEnum" not in analyzer.enums
 
 
 class TestDynamicKeyAnalysisResult:
@@ -321,58 +301,20 @@ class TestDynamicKeyAnalysisResult:
         assert len(result.missing_keys) == 2
 
 
-class TestAnalyzerIntegration:
-    """Integration tests for dynamic key analysis with main analyzer."""
-
-    def test_dynamic_keys_excluded_from_dead_keys(self):
-        """Should not mark dynamically-used keys as dead."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir)
-
-            # Create localization structure
-            resources_dir = project_dir / "Resources"
-            en_dir = resources_dir / "en.lproj"
-            en_dir.mkdir(parents=True)
-
-            # Create .strings file with activity keys
-            strings_file = en_dir / "Localizable.strings"
-            strings_file.write_text('''
-"activity.work" = "Work";
-"activity.friends" = "Friends";
-"activity.family" = "Family";
-"unused.key" = "This is unused";
-''')
-
-            # Create enum
-            sources_dir = project_dir / "Sources"
-            sources_dir.mkdir()
-
-            enum_file = sources_dir / "ActivityType.swift"
-            enum_file.write_text('''
+ACTIVITY_ENUM_SWIFT = '''
 enum ActivityType: String {
     case work
     case friends
     case family
 }
-''')
+'''
 
-            # Create usage file with dynamic pattern
-            view_file = sources_dir / "ActivityView.swift"
-            view_file.write_text('''
-import SwiftUI
-
-struct ActivityView: View {
-    let activityType: ActivityType
-
-    var body: some View {
-        Text("activity.\\(activityType.rawValue)".localized)
-    }
-}
-''')
 
-            # Create config
-            config_file = project_dir / ".localization.yml"
-            config_file.write_text('''
+@pytest.fixture(scope="module")
+def integration_config(tmp_path_factory):
+    """Config shared by the integration tests (parsed once per module)."""
+    config_file = tmp_path_factory.mktemp("config") / ".localization.yml"
+    config_file.write_text('''
 framework: swift
 paths:
   source: Sources
@@ -381,94 +323,81 @@ languages:
   primary: en
   supported: [en]
 ''')
+    return Config.from_file(str(config_file))
+
+
+def _analyze_project(root, config, files):
+    """Write a project tree under root and run the full analyzer on it."""
+    write_project(root, files)
+    analyzer = LocalizationAnalyzer(
+        project_dir=root / "Sources",
+        adapter=SwiftAdapter(config),
+        localization_dir=root / "Resources"
+    )
+    return analyzer.analyze(verbose=False)
+
+
+@pytest.fixture(scope="module")
+def dead_keys_result(tmp_path_factory, integration_config):
+    """Analysis of a project whose activity.* keys are only used dynamically."""
+    return _analyze_project(tmp_path_factory.mktemp("dead_keys"), integration_config, {
+        # .strings file with activity keys
+        "Resources/en.lproj/Localizable.strings": '''
+"activity.work" = "Work";
+"activity.friends" = "Friends";
+"activity.family" = "Family";
+"unused.key" = "This is unused";
+''',
+        "Sources/ActivityType.swift": ACTIVITY_ENUM_SWIFT,
+        # Usage file with dynamic pattern
+        "Sources/ActivityView.swift": '''
+import SwiftUI
 
-            # Run analyzer
-            from localization_analyzer.core.analyzer import LocalizationAnalyzer
-            from localization_analyzer.frameworks.swift import SwiftAdapter
-            from localization_analyzer.utils.config import Config
-
-            config = Config.from_file(str(config_file))
-            adapter = SwiftAdapter(config)
-            analyzer = LocalizationAnalyzer(
-                project_dir=sources_dir,
-                adapter=adapter,
-                localization_dir=resources_dir
-            )
-            result = analyzer.analyze(verbose=False)
-
-            # activity.* keys should NOT be in dead_keys (they're used dynamically)
-            dead_key_list = list(result.dead_keys)
-            assert "activity.work" not in dead_key_list
-            assert "activity.friends" not in dead_key_list
-            assert "activity.family" not in dead_key_list
-
-            # unused.key should still be in dead_keys
-            assert "unused.key" in dead_key_list
-
-    def test_dynamic_analysis_reports_missing_keys(self):
-        """Should report missing keys from enum analysis."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_dir = Path(tmpdir)
+struct ActivityView: View {
+    let activityType: ActivityType
 
-            # Create localization structure
-            resources_dir = project_dir / "Resources"
-            en_dir = resources_dir / "en.lproj"
-            en_dir.mkdir(parents=True)
+    var body: some View {
+        Text("activity.\\(activityType.rawValue)".localized)
+    }
+}
+''',
+    })
 
-            # Only activity.work exists, missing friends and family
-            strings_file = en_dir / "Localizable.strings"
-            strings_file.write_text('''
+
+@pytest.fixture(scope="module")
+def missing_keys_result(tmp_path_factory, integration_config):
+    """Analysis of a project where only one enum-derived key exists."""
+    return _analyze_project(tmp_path_factory.mktemp("missing_keys"), integration_config, {
+        # Only activity.work exists, missing friends and family
+        "Resources/en.lproj/Localizable.strings": '''
 "activity.work" = "Work";
-''')
+''',
+        "Sources/ActivityType.swift": ACTIVITY_ENUM_SWIFT,
+        "Sources/ActivityView.swift": '''
+let title = "activity.\\(type.rawValue)".localized
+''',
+    })
 
-            # Create enum with 3 cases
-            sources_dir = project_dir / "Sources"
-            sources_dir.mkdir()
 
-            enum_file = sources_dir / "ActivityType.swift"
-            enum_file.write_text('''
-enum ActivityType: String {
-    case work
-    case friends
-    case family
-}
-''')
+class TestAnalyzerIntegration:
+    """Integration tests for dynamic key analysis with main analyzer."""
 
-            # Create usage
-            view_file = sources_dir / "ActivityView.swift"
-            view_file.write_text('''
-let title = "activity.\\(type.rawValue)".localized
-''')
+    def test_dead_keys_is_set(self, dead_keys_result):
+        """dead_keys should be a set for O(1) membership checks."""
+        assert isinstance(dead_keys_result.dead_keys, set)
 
-            # Create config
-            config_file = project_dir / ".localization.yml"
-            config_file.write_text('''
-framework: swift
-paths:
-  source: Sources
-  localization: Resources
-languages:
-  primary: en
-  supported: [en]
-''')
+    @pytest.mark.parametrize("key", ["activity.work", "activity.friends", "activity.family"])
+    def test_dynamic_keys_excluded_from_dead_keys(self, dead_keys_result, key):
+        """Should not mark dynamically-used keys as dead."""
+        assert key not in dead_keys_result.dead_keys
+
+    def test_unused_key_still_dead(self, dead_keys_result):
+        """Keys that are not used at all should still be reported as dead."""
+        assert "unused.key" in dead_keys_result.dead_keys
 
-            # Run analyzer
-            from localization_analyzer.core.analyzer import LocalizationAnalyzer
-            from localization_analyzer.frameworks.swift import SwiftAdapter
-            from localization_analyzer.utils.config import Config
-
-            config = Config.from_file(str(config_file))
-            adapter = SwiftAdapter(config)
-            analyzer = LocalizationAnalyzer(
-                project_dir=sources_dir,
-                adapter=adapter,
-                localization_dir=resources_dir
-            )
-            result = analyzer.analyze(verbose=False)
-
-            # Check missing_dynamic_keys
-            # There should be missing keys reported
-            assert result.missing_dynamic_keys is not None
+    def test_dynamic_analysis_reports_missing_keys(self, missing_keys_result):
+        """Should report missing keys from enum analysis."""
+        assert missing_keys_result.missing_dynamic_keys is not None
 
 
 if __name__ == '__main__':
@@ -4,151 +4,93 @@ import pytest
 from localization_analyzer.frameworks.swift import SwiftAdapter
 from localization_analyzer.frameworks.base import BaseAdapter
 
+from ._emoji_data import (
+    COMPOUND_EMOJIS,
+    EMOJI_WITH_TEXT,
+    FLAG_EMOJIS,
+    PURE_EMOJIS,
+    SPACED_EMOJIS,
+)
+
+
+TEXTS_WITH_EMOJI = [
+    ("Hello 👋", "Text", "visible_ui"),
+    ("🎉 Success!", "Alert", "error_messages"),
+    ("Save 💾", "Button", "visible_ui"),
+]
+
+REGULAR_TEXTS = [
+    ("Hello World", "Text", "visible_ui"),
+    ("Save", "Button", "visible_ui"),
+    ("Error occurred", "Alert", "error_messages"),
+]
+
+
+@pytest.fixture(scope="class")
+def adapter():
+    """Her test sinifi icin tek bir SwiftAdapter olustur."""
+    return SwiftAdapter()
+
 
 class TestEmojiFiltering:
     """Test cases for emoji string filtering."""
 
-    def setup_method(self):
-        """Her test oncesinde SwiftAdapter olustur."""
-        self.adapter = SwiftAdapter()
-
-    def test_pure_emoji_excluded(self):
+    @pytest.mark.parametrize("emoji", sorted(PURE_EMOJIS | SPACED_EMOJIS))
+    def test_pure_emoji_excluded(self, adapter, emoji):
         """Pure emoji stringleri exclude edilmeli."""
-        pure_emojis = [
-            "😀",
-            "🎉",
-            "❤️",
-            "🔥",
-            "✨",
-            "👍",
-            "🙌",
-            "😍😍😍",
-            "🌟⭐🌟",
-            "🎯",
-            "🚀",
-            "💡",
-            "📱",
-            "🏠",
-            "🔒",
-            "⚡",
-            "☀️",
-            "🌙",
-            "🌈",
-            "🎵",
-            "🎮",
-            "🍕",
-            "🍎",
-            "🚗",
-            "✅",
-            "❌",
-            "⚠️",
-            "🔴",
-            "🟢",
-            "🟡",
-        ]
-
-        for emoji in pure_emojis:
-            assert self.adapter.should_exclude_string(emoji), f"Pure emoji '{emoji}' should be excluded"
-
-    def test_emoji_with_text_not_excluded(self):
+        assert adapter.should_exclude_string(emoji)
+
+    @pytest.mark.parametrize("text", sorted(EMOJI_WITH_TEXT))
+    def test_emoji_with_text_not_excluded(self, adapter, text):
         """Emoji + text kombinasyonlari exclude edilmemeli."""
-        emoji_with_text = [
-            "Hello 👋",
-            "🎉 Congratulations!",
-            "Error ❌ Something went wrong",
-            "✅ Success",
-            "Warning ⚠️ Please check",
-            "🔥 Hot deals",
-            "Save 💾",
-        ]
-
-        for text in emoji_with_text:
-            assert not self.adapter.should_exclude_string(text), f"Text with emoji '{text}' should NOT be excluded"
-
-    def test_compound_emojis_excluded(self):
-        """Bilesik emojiler (ZWJ ile) exclude edilmeli."""
-        compound_emojis = [
-            "👨‍👩‍👧‍👦",  # Family
-            "👩‍💻",      # Woman technologist
-            "🏳️‍🌈",     # Rainbow flag
-        ]
+        assert not adapter.should_exclude_string(text)
 
-        for emoji in compound_emojis:
-            assert self.adapter.should_exclude_string(emoji), f"Compound emoji '{emoji}' should be excluded"
+    @pytest.mark.parametrize("emoji", sorted(COMPOUND_EMOJIS))
+    def test_compound_emojis_excluded(self, adapter, emoji):
+        """Bilesik emojiler (ZWJ ile) exclude edilmeli."""
+        assert adapter.should_exclude_string(emoji)
 
-    def test_flag_emojis_excluded(self):
+    @pytest.mark.parametrize("emoji", sorted(FLAG_EMOJIS))
+    def test_flag_emojis_excluded(self, adapter, emoji):
         """Bayrak emojileri exclude edilmeli."""
-        flag_emojis = [
-            "🇹🇷",  # Turkey
-            "🇺🇸",  # USA
-            "🇬🇧",  # UK
-            "🇩🇪",  # Germany
-        ]
-
-        for emoji in flag_emojis:
-            assert self.adapter.should_exclude_string(emoji), f"Flag emoji '{emoji}' should be excluded"
+        assert adapter.should_exclude_string(emoji)
 
 
 class TestEmojiPriority:
     """Test cases for emoji priority calculation."""
 
-    def setup_method(self):
-        """Her test oncesinde SwiftAdapter olustur."""
-        self.adapter = SwiftAdapter()
-
-    def test_pure_emoji_zero_priority(self):
+    @pytest.mark.parametrize("emoji", sorted(PURE_EMOJIS))
+    def test_pure_emoji_zero_priority(self, adapter, emoji):
         """Pure emoji stringleri 0 priority olmali."""
-        pure_emojis = ["😀", "🎉", "❤️", "🔥", "✨", "👍", "🏠", "📱", "🎵"]
-
-        for emoji in pure_emojis:
-            priority = self.adapter.calculate_priority("Text", "visible_ui", emoji)
-            assert priority == 0, f"Pure emoji '{emoji}' should have 0 priority, got {priority}"
+        assert adapter.calculate_priority("Text", "visible_ui", emoji) == 0
 
-    def test_text_with_emoji_has_priority(self):
+    @pytest.mark.parametrize("text,component,category", TEXTS_WITH_EMOJI)
+    def test_text_with_emoji_has_priority(self, adapter, text, component, category):
         """Emoji + text kombinasyonlari priority olmali."""
-        texts_with_emoji = [
-            ("Hello 👋", "Text", "visible_ui"),
-            ("🎉 Success!", "Alert", "error_messages"),
-            ("Save 💾", "Button", "visible_ui"),
-        ]
+        assert adapter.calculate_priority(component, category, text) > 0
 
-        for text, component, category in texts_with_emoji:
-            priority = self.adapter.calculate_priority(component, category, text)
-            assert priority > 0, f"Text with emoji '{text}' should have priority > 0, got {priority}"
-
-    def test_regular_text_has_priority(self):
+    @pytest.mark.parametrize("text,component,category", REGULAR_TEXTS)
+    def test_regular_text_has_priority(self, adapter, text, component, category):
         """Normal text priority olmali."""
-        texts = [
-            ("Hello World", "Text", "visible_ui"),
-            ("Save", "Button", "visible_ui"),
-            ("Error occurred", "Alert", "error_messages"),
-        ]
-
-        for text, component, category in texts:
-            priority = self.adapter.calculate_priority(component, category, text)
-            assert priority > 0, f"Text '{text}' should have priority > 0, got {priority}"
+        assert adapter.calculate_priority(component, category, text) > 0
 
 
 class TestValidatorsEmojiFilter:
     """Test validators.py emoji filtering."""
 
-    def test_is_excluded_string_pure_emoji(self):
+    @pytest.mark.parametrize("emoji", sorted(PURE_EMOJIS))
+    def test_is_excluded_string_pure_emoji(self, emoji):
         """validators.is_excluded_string pure emoji'leri exclude etmeli."""
         from localization_analyzer.utils.validators import is_excluded_string
 
-        pure_emojis = ["😀", "🎉", "❤️", "🔥", "✨", "🏠📱🎵"]
+        assert is_excluded_string(emoji)
 
-        for emoji in pure_emojis:
-            assert is_excluded_string(emoji), f"Pure emoji '{emoji}' should be excluded by is_excluded_string"
-
-    def test_is_excluded_string_text_with_emoji(self):
+    @pytest.mark.parametrize("text", sorted(EMOJI_WITH_TEXT))
+    def test_is_excluded_string_text_with_emoji(self, text):
         """validators.is_excluded_string emoji+text'i exclude etmemeli."""
         from localization_analyzer.utils.validators import is_excluded_string
 
-        texts = ["Hello 👋", "🎉 Success", "Warning ⚠️"]
-
-        for text in texts:
-            assert not is_excluded_string(text), f"Text with emoji '{text}' should NOT be excluded"
+        assert not is_excluded_string(text)
 
 
 if __name__ == '__main__':
@@ -1,428 +1,312 @@
 """Tests for LocalizationFileManager."""
 
 import pytest
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from localization_analyzer.core.file_manager import LocalizationFileManager
+from localization_analyzer.core.file_manager import LocalizationFileManager, _iter_matching_files
 from localization_analyzer.frameworks.swift import SwiftAdapter
 
+from ._helpers import make_fm, write_project
 
-class TestLocalizationFileManager:
-    """Test cases for LocalizationFileManager."""
+# .strings file contents, encoded once at import
+_EN_STRINGS = b'"save" = "Save";\n"cancel" = "Cancel";\n"delete" = "Delete";\n'
+_TR_STRINGS = '"save" = "Kaydet";\n"cancel" = "İptal";\n'.encode('utf-8')
 
-    def create_test_localization_dir(self, tmpdir):
-        """Create test localization directory structure."""
-        resources_dir = Path(tmpdir) / 'Resources'
 
-        # English
-        en_lproj = resources_dir / 'en.lproj'
-        en_lproj.mkdir(parents=True)
-        (en_lproj / 'Localizable.strings').write_text('''
-"save" = "Save";
-"cancel" = "Cancel";
-"delete" = "Delete";
-''')
-
-        # Turkish
-        tr_lproj = resources_dir / 'tr.lproj'
-        tr_lproj.mkdir(parents=True)
-        (tr_lproj / 'Localizable.strings').write_text('''
-"save" = "Kaydet";
-"cancel" = "İptal";
-''')
-
-        return resources_dir
-
-    def test_init(self):
-        """FileManager should initialize correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
+@pytest.fixture(scope="session")
+def swift_adapter():
+    """Shared SwiftAdapter; the file manager only uses it read-only."""
+    return SwiftAdapter()
 
-            fm = LocalizationFileManager(adapter, resources_dir)
 
-            assert fm.adapter == adapter
-            assert fm.localization_dir == resources_dir
+@pytest.fixture(scope="class")
+def resources_dir(tmp_path_factory):
+    """Create test localization directory structure once per test class."""
+    resources_dir = tmp_path_factory.mktemp('loc') / 'Resources'
 
-    def test_discover_languages(self):
-        """Should discover available languages."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
+    write_project(resources_dir, {
+        'en.lproj/Localizable.strings': _EN_STRINGS,
+        'tr.lproj/Localizable.strings': _TR_STRINGS,
+    })
 
-            fm = LocalizationFileManager(adapter, resources_dir)
+    return resources_dir
 
-            assert 'en' in fm.languages
-            assert 'tr' in fm.languages
-            assert len(fm.languages) >= 2
 
-    def test_discover_languages_nonexistent_dir(self, capfd):
-        """Should handle non-existent directory gracefully."""
-        adapter = SwiftAdapter()
-        fm = LocalizationFileManager(adapter, Path('/nonexistent/path'))
+@pytest.fixture(scope="class")
+def fm(swift_adapter, resources_dir):
+    """FileManager with all keys loaded; shared read-only within a test class."""
+    fm = LocalizationFileManager(swift_adapter, resources_dir)
+    fm.load_all_keys()
+    return fm
 
-        captured = capfd.readouterr()
-        assert "not found" in captured.out
 
-    def test_load_all_keys(self):
-        """Should load all keys from all languages."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
+class TestLocalizationFileManager:
+    """Test cases for LocalizationFileManager."""
 
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+    def test_init(self, swift_adapter, resources_dir):
+        """FileManager should initialize correctly."""
+        fm = LocalizationFileManager(swift_adapter, resources_dir)
 
-            assert 'save' in fm.keys
-            assert 'cancel' in fm.keys
-            assert 'delete' in fm.keys
-            assert fm.keys['save']['en'] == 'Save'
-            assert fm.keys['save']['tr'] == 'Kaydet'
+        assert fm.adapter == swift_adapter
+        assert fm.localization_dir == resources_dir
 
-    def test_key_exists(self):
-        """Should check if key exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
+    def test_discover_languages(self, fm):
+        """Should discover available languages."""
+        assert 'en' in fm.languages
+        assert 'tr' in fm.languages
+        assert len(fm.languages) >= 2
 
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+    def test_discover_languages_nonexistent_dir(self, swift_adapter, capsys):
+        """Should handle non-existent directory gracefully."""
+        fm = LocalizationFileManager(swift_adapter, Path('/nonexistent/path'))
 
-            assert fm.key_exists('save') is True
-            assert fm.key_exists('nonexistent') is False
+        captured = capsys.readouterr()
+        assert "not found" in captured.out
 
-    def test_get_key_translations(self):
-        """Should return all translations for a key."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
+    def test_load_all_keys(self, fm):
+        """Should load all keys from all languages."""
+        assert 'save' in fm.keys
+        assert 'cancel' in fm.keys
+        assert 'delete' in fm.keys
+        assert fm.keys['save']['en'] == 'Save'
+        assert fm.keys['save']['tr'] == 'Kaydet'
 
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+    def test_key_exists(self, fm):
+        """Should check if key exists."""
+        assert fm.key_exists('save') is True
+        assert fm.key_exists('nonexistent') is False
 
-            translations = fm.get_key_translations('save')
-            assert translations['en'] == 'Save'
-            assert translations['tr'] == 'Kaydet'
+    def test_get_key_translations(self, fm):
+        """Should return all translations for a key."""
+        translations = fm.get_key_translations('save')
+        assert translations['en'] == 'Save'
+        assert translations['tr'] == 'Kaydet'
 
-    def test_get_key_translations_nonexistent(self):
+    def test_get_key_translations_nonexistent(self, fm):
         """Should return empty dict for nonexistent key."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+        translations = fm.get_key_translations('nonexistent')
+        assert translations == {}
 
-            translations = fm.get_key_translations('nonexistent')
-            assert translations == {}
-
-    def test_keys_by_language(self):
+    def test_keys_by_language(self, fm):
         """Should return keys grouped by language."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+        by_lang = fm.keys_by_language
 
-            by_lang = fm.keys_by_language
+        assert 'en' in by_lang
+        assert 'tr' in by_lang
+        assert by_lang['en']['save'] == 'Save'
+        assert by_lang['tr']['save'] == 'Kaydet'
 
-            assert 'en' in by_lang
-            assert 'tr' in by_lang
-            assert by_lang['en']['save'] == 'Save'
-            assert by_lang['tr']['save'] == 'Kaydet'
-
-    def test_find_missing_translations(self):
+    def test_find_missing_translations(self, fm):
         """Should find keys missing in some languages."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+        missing = fm.find_missing_translations()
 
-            missing = fm.find_missing_translations()
+        # 'delete' is only in English, missing in Turkish
+        assert 'delete' in missing
+        assert 'tr' in missing['delete']
 
-            # 'delete' is only in English, missing in Turkish
-            assert 'delete' in missing
-            assert 'tr' in missing['delete']
-
-    def test_find_untranslated_keys(self):
+    def test_find_untranslated_keys(self, swift_adapter, tmp_path):
         """Should find keys with same text as source."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-
-            # Create files with untranslated key
-            en_lproj = resources_dir / 'en.lproj'
-            en_lproj.mkdir(parents=True)
-            (en_lproj / 'Localizable.strings').write_text('''
-"ok" = "OK";
-"hello" = "Hello";
-''')
-
-            tr_lproj = resources_dir / 'tr.lproj'
-            tr_lproj.mkdir(parents=True)
-            (tr_lproj / 'Localizable.strings').write_text('''
-"ok" = "OK";
-"hello" = "Merhaba";
-''')
-
-            adapter = SwiftAdapter()
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
-
-            untranslated = fm.find_untranslated_keys(source_lang='en')
-
-            # 'ok' has same value in both languages
-            assert 'ok' in untranslated
-            assert 'tr' in untranslated['ok']
-            # 'hello' is translated
-            assert 'hello' not in untranslated
-
-    def test_get_language_stats(self):
+        # 'ok' is left untranslated in Turkish
+        fm = make_fm(tmp_path, {
+            'en': '"ok" = "OK";\n"hello" = "Hello";\n',
+            'tr': '"ok" = "OK";\n"hello" = "Merhaba";\n',
+        }, swift_adapter)
+        fm.load_all_keys()
+
+        untranslated = fm.find_untranslated_keys(source_lang='en')
+
+        # 'ok' has same value in both languages
+        assert 'ok' in untranslated
+        assert 'tr' in untranslated['ok']
+        # 'hello' is translated
+        assert 'hello' not in untranslated
+
+    def test_get_language_stats(self, fm):
         """Should return statistics per language."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_localization_dir(tmpdir)
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+        stats = fm.get_language_stats()
 
-            stats = fm.get_language_stats()
-
-            assert 'en' in stats
-            assert 'tr' in stats
-            assert stats['en']['completion_percent'] == 100.0
-            # Turkish is missing 'delete'
-            assert stats['tr']['missing_keys'] >= 1
+        assert 'en' in stats
+        assert 'tr' in stats
+        assert stats['en']['completion_percent'] == 100.0
+        # Turkish is missing 'delete'
+        assert stats['tr']['missing_keys'] >= 1
 
 
 class TestAddKey:
     """Test cases for add_key method."""
 
-    def create_test_dir(self, tmpdir):
-        """Create test directory with empty strings files."""
-        resources_dir = Path(tmpdir) / 'Resources'
-
-        en_lproj = resources_dir / 'en.lproj'
-        en_lproj.mkdir(parents=True)
-        (en_lproj / 'Localizable.strings').write_text('')
-
-        tr_lproj = resources_dir / 'tr.lproj'
-        tr_lproj.mkdir(parents=True)
-        (tr_lproj / 'Localizable.strings').write_text('')
-
-        return resources_dir
-
-    def test_add_key_dry_run(self, capfd):
+    def test_add_key_dry_run(self, swift_adapter, capsys, tmp_path):
         """Dry run should not write files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_dir(tmpdir)
-            adapter = SwiftAdapter()
+        fm = make_fm(tmp_path, {'en': b'', 'tr': b''}, swift_adapter)
+        fm.load_all_keys()
 
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
+        result = fm.add_key(
+            'new.key',
+            {'en': 'New Value', 'tr': 'Yeni Değer'},
+            dry_run=True
+        )
 
-            result = fm.add_key(
-                'new.key',
-                {'en': 'New Value', 'tr': 'Yeni Değer'},
-                dry_run=True
-            )
+        assert result is True
+        captured = capsys.readouterr()
+        assert "DRY RUN" in captured.out
 
-            assert result is True
-            captured = capfd.readouterr()
-            assert "DRY RUN" in captured.out
+        # Key should not be in memory
+        assert 'new.key' not in fm.keys
 
-            # Key should not be in memory
-            assert 'new.key' not in fm.keys
-
-    def test_add_key_already_exists(self, capfd):
+    def test_add_key_already_exists(self, swift_adapter, capsys, tmp_path):
         """Should warn if key already exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = self.create_test_dir(tmpdir)
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.keys = {'existing.key': {'en': 'Existing'}}
+        fm = make_fm(tmp_path, {'en': b'', 'tr': b''}, swift_adapter)
+        fm.keys = {'existing.key': {'en': 'Existing'}}
 
-            result = fm.add_key(
-                'existing.key',
-                {'en': 'New Value'},
-                dry_run=False,
-                overwrite=False
-            )
+        result = fm.add_key(
+            'existing.key',
+            {'en': 'New Value'},
+            dry_run=False,
+            overwrite=False
+        )
 
-            assert result is False
-            captured = capfd.readouterr()
-            assert "already exists" in captured.out
+        assert result is False
+        captured = capsys.readouterr()
+        assert "already exists" in captured.out
 
 
 class TestFindModuleFile:
     """Test cases for _find_module_file method."""
 
-    def test_find_exact_match(self):
+    def test_find_exact_match(self, swift_adapter, tmp_path):
         """Should find file matching module name."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-            adapter = SwiftAdapter()
+        fm = make_fm(tmp_path, {}, swift_adapter)
 
-            fm = LocalizationFileManager(adapter, resources_dir)
+        files = [
+            Path('/test/Common.strings'),
+            Path('/test/AI.strings'),
+            Path('/test/Settings.strings'),
+        ]
 
-            files = [
-                Path('/test/Common.strings'),
-                Path('/test/AI.strings'),
-                Path('/test/Settings.strings'),
-            ]
+        result = fm._find_module_file(files, 'AI')
+        assert result == Path('/test/AI.strings')
 
-            result = fm._find_module_file(files, 'AI')
-            assert result == Path('/test/AI.strings')
-
-    def test_find_no_match_returns_first(self):
+    def test_find_no_match_returns_first(self, swift_adapter, tmp_path):
         """Should return first file if no match."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
+        fm = make_fm(tmp_path, {}, swift_adapter)
 
-            files = [
-                Path('/test/Common.strings'),
-                Path('/test/AI.strings'),
-            ]
+        files = [
+            Path('/test/Common.strings'),
+            Path('/test/AI.strings'),
+        ]
 
-            result = fm._find_module_file(files, 'NonExistent')
-            assert result == Path('/test/Common.strings')
+        result = fm._find_module_file(files, 'NonExistent')
+        assert result == Path('/test/Common.strings')
 
-    def test_find_no_module_returns_first(self):
+    def test_find_no_module_returns_first(self, swift_adapter, tmp_path):
         """Should return first file if no module specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-            adapter = SwiftAdapter()
+        fm = make_fm(tmp_path, {}, swift_adapter)
 
-            fm = LocalizationFileManager(adapter, resources_dir)
+        files = [
+            Path('/test/Common.strings'),
+            Path('/test/AI.strings'),
+        ]
 
-            files = [
-                Path('/test/Common.strings'),
-                Path('/test/AI.strings'),
-            ]
+        result = fm._find_module_file(files, None)
+        assert result == Path('/test/Common.strings')
 
-            result = fm._find_module_file(files, None)
-            assert result == Path('/test/Common.strings')
-
-    def test_find_empty_list(self):
+    def test_find_empty_list(self, swift_adapter, tmp_path):
         """Should return None for empty list."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-            adapter = SwiftAdapter()
-
-            fm = LocalizationFileManager(adapter, resources_dir)
+        fm = make_fm(tmp_path, {}, swift_adapter)
 
-            result = fm._find_module_file([], 'Any')
-            assert result is None
+        result = fm._find_module_file([], 'Any')
+        assert result is None
 
 
 class TestValidateAllFiles:
     """Test cases for validate_all_files method."""
 
-    def test_validate_valid_files(self):
+    def test_validate_valid_files(self, swift_adapter, tmp_path):
         """Should return no errors for valid files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-
-            en_lproj = resources_dir / 'en.lproj'
-            en_lproj.mkdir(parents=True)
-            (en_lproj / 'Localizable.strings').write_text('''
-"key" = "value";
-''')
-
-            adapter = SwiftAdapter()
-            fm = LocalizationFileManager(adapter, resources_dir)
+        fm = make_fm(tmp_path, {'en': '"key" = "value";\n'}, swift_adapter)
 
-            errors = fm.validate_all_files()
+        errors = fm.validate_all_files()
 
-            # Should have no errors for valid file
-            assert 'en' not in errors or len(errors.get('en', [])) == 0
+        # Should have no errors for valid file
+        assert 'en' not in errors or len(errors.get('en', [])) == 0
 
 
 class TestSyncKeysAcrossLanguages:
     """Test cases for sync_keys_across_languages method."""
 
-    def test_sync_dry_run(self, capfd):
+    def test_sync_dry_run(self, swift_adapter, capsys, tmp_path):
         """Dry run should not modify files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-
-            # English with keys
-            en_lproj = resources_dir / 'en.lproj'
-            en_lproj.mkdir(parents=True)
-            (en_lproj / 'Localizable.strings').write_text('''
-"key1" = "Value 1";
-"key2" = "Value 2";
-''')
-
-            # Turkish with missing key
-            tr_lproj = resources_dir / 'tr.lproj'
-            tr_lproj.mkdir(parents=True)
-            (tr_lproj / 'Localizable.strings').write_text('''
-"key1" = "Değer 1";
-''')
-
-            adapter = SwiftAdapter()
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
-
-            result = fm.sync_keys_across_languages('en', dry_run=True)
-
-            captured = capfd.readouterr()
-            assert "DRY RUN" in captured.out
-
-    def test_sync_nonexistent_source(self, capfd):
-        """Should error if source language doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-            resources_dir.mkdir(parents=True)
+        # Turkish is missing key2
+        fm = make_fm(tmp_path, {
+            'en': '"key1" = "Value 1";\n"key2" = "Value 2";\n',
+            'tr': '"key1" = "Değer 1";\n',
+        }, swift_adapter)
+        fm.load_all_keys()
 
-            adapter = SwiftAdapter()
-            fm = LocalizationFileManager(adapter, resources_dir)
+        result = fm.sync_keys_across_languages('en', dry_run=True)
 
-            result = fm.sync_keys_across_languages('nonexistent')
+        captured = capsys.readouterr()
+        assert "DRY RUN" in captured.out
 
-            assert result == {}
-            captured = capfd.readouterr()
-            assert "not found" in captured.out
+    def test_sync_nonexistent_source(self, swift_adapter, capsys, tmp_path):
+        """Should error if source language doesn't exist."""
+        fm = make_fm(tmp_path, {}, swift_adapter)
+
+        result = fm.sync_keys_across_languages('nonexistent')
+
+        assert result == {}
+        captured = capsys.readouterr()
+        assert "not found" in captured.out
 
 
 class TestModularStringsSupport:
     """Test cases for modular .strings file support."""
 
-    def test_multiple_strings_files_per_language(self):
+    def test_multiple_strings_files_per_language(self, swift_adapter, tmp_path):
         """Should support multiple .strings files per language."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            resources_dir = Path(tmpdir) / 'Resources'
-
-            en_lproj = resources_dir / 'en.lproj'
-            en_lproj.mkdir(parents=True)
-
-            # Multiple module files
-            (en_lproj / 'Common.strings').write_text('"common.key" = "Common";')
-            (en_lproj / 'AI.strings').write_text('"ai.key" = "AI";')
-            (en_lproj / 'Settings.strings').write_text('"settings.key" = "Settings";')
-
-            adapter = SwiftAdapter()
-            fm = LocalizationFileManager(adapter, resources_dir)
-            fm.load_all_keys()
-
-            # Should have all keys
-            assert 'common.key' in fm.keys
-            assert 'ai.key' in fm.keys
-            assert 'settings.key' in fm.keys
-
-            # Should track modules
-            assert fm.key_modules.get('common.key') == 'Common'
-            assert fm.key_modules.get('ai.key') == 'AI'
-            assert fm.key_modules.get('settings.key') == 'Settings'
+        resources_dir = tmp_path / 'Resources'
+
+        en_lproj = resources_dir / 'en.lproj'
+        en_lproj.mkdir(parents=True)
+
+        # Multiple module files
+        (en_lproj / 'Common.strings').write_text('"common.key" = "Common";')
+        (en_lproj / 'AI.strings').write_text('"ai.key" = "AI";')
+        (en_lproj / 'Settings.strings').write_text('"settings.key" = "Settings";')
+
+        fm = LocalizationFileManager(swift_adapter, resources_dir)
+        fm.load_all_keys()
+
+        # Should have all keys
+        assert 'common.key' in fm.keys
+        assert 'ai.key' in fm.keys
+        assert 'settings.key' in fm.keys
+
+        # Should track modules
+        assert fm.key_modules.get('common.key') == 'Common'
+        assert fm.key_modules.get('ai.key') == 'AI'
+        assert fm.key_modules.get('settings.key') == 'Settings'
+
+
+class TestIterMatchingFiles:
+    """Test cases for the scandir-based file walker."""
+
+    def test_matches_rglob(self, tmp_path):
+        """Should yield the same files as Path.rglob (order may differ)."""
+        write_project(tmp_path, {
+            'Localizable.strings': '',
+            'en.lproj/Localizable.strings': '',
+            'en.lproj/Common.strings': '',
+            'en.lproj/notes.txt': '',
+            'Nested/tr.lproj/Localizable.strings': '',
+        })
+
+        assert sorted(_iter_matching_files(tmp_path, '*.strings')) == sorted(tmp_path.rglob('*.strings'))
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        """Should yield nothing for a missing directory."""
+        assert list(_iter_matching_files(tmp_path / 'missing', '*.strings')) == []
 
 
 if __name__ == '__main__':
@@ -1,9 +1,16 @@
 """Tests for HealthCalculator and HealthScore."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from localization_analyzer.core.health_calculator import HealthCalculator, HealthScore
 from localization_analyzer.utils.colors import Colors
 
+# Large synthetic inputs for the penalty-cap tests, built once at import
+_MISSING_100 = tuple(f'key{i}' for i in range(100))
+_MISSING_50 = _MISSING_100[:50]
+_DEAD_100 = tuple(f'dead{i}' for i in range(100))
+_DUP_50 = {f'dup{i}': [] for i in range(50)}
+
 
 class TestHealthScore:
     """Test cases for HealthScore dataclass."""
@@ -32,6 +39,28 @@ class TestHealthScore:
         assert score.dead_keys_count == 3
         assert score.duplicate_count == 2
 
+    def test_health_score_is_immutable(self):
+        """HealthScore should be frozen once calculated."""
+        score = HealthCalculator.calculate(
+            localized_count=10, hardcoded_count=0,
+            missing_keys=[], dead_keys=[], duplicates={}
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            score.score = 0
+
+
+@pytest.fixture(scope="class")
+def baseline_score():
+    """Penalty-free score for 100 localized strings, shared by the penalty tests."""
+    return HealthCalculator.calculate(
+        localized_count=100,
+        hardcoded_count=0,
+        missing_keys=[],
+        dead_keys=[],
+        duplicates={}
+    )
+
 
 class TestHealthCalculatorCalculate:
     """Test cases for HealthCalculator.calculate method."""
@@ -91,16 +120,8 @@ class TestHealthCalculatorCalculate:
         assert result.localization_rate == 80.0
         assert result.total_strings == 100
 
-    def test_missing_keys_penalty(self):
+    def test_missing_keys_penalty(self, baseline_score):
         """Missing keys should reduce score."""
-        result_without = HealthCalculator.calculate(
-            localized_count=100,
-            hardcoded_count=0,
-            missing_keys=[],
-            dead_keys=[],
-            duplicates={}
-        )
-
         result_with = HealthCalculator.calculate(
             localized_count=100,
             hardcoded_count=0,
@@ -109,19 +130,11 @@ class TestHealthCalculatorCalculate:
             duplicates={}
         )
 
-        assert result_with.score < result_without.score
+        assert result_with.score < baseline_score.score
         assert result_with.missing_keys_count == 3
 
-    def test_dead_keys_penalty(self):
+    def test_dead_keys_penalty(self, baseline_score):
         """Dead keys should reduce score."""
-        result_without = HealthCalculator.calculate(
-            localized_count=100,
-            hardcoded_count=0,
-            missing_keys=[],
-            dead_keys=[],
-            duplicates={}
-        )
-
         result_with = HealthCalculator.calculate(
             localized_count=100,
             hardcoded_count=0,
@@ -130,19 +143,11 @@ class TestHealthCalculatorCalculate:
             duplicates={}
         )
 
-        assert result_with.score < result_without.score
+        assert result_with.score < baseline_score.score
         assert result_with.dead_keys_count == 2
 
-    def test_duplicates_penalty(self):
+    def test_duplicates_penalty(self, baseline_score):
         """Duplicates should reduce score."""
-        result_without = HealthCalculator.calculate(
-            localized_count=100,
-            hardcoded_count=0,
-            missing_keys=[],
-            dead_keys=[],
-            duplicates={}
-        )
-
         result_with = HealthCalculator.calculate(
             localized_count=100,
             hardcoded_count=0,
@@ -151,31 +156,31 @@ class TestHealthCalculatorCalculate:
             duplicates={'dup1': ['loc1', 'loc2'], 'dup2': ['loc3', 'loc4']}
         )
 
-        assert result_with.score < result_without.score
+        assert result_with.score < baseline_score.score
         assert result_with.duplicate_count == 2
 
-    def test_max_penalty_cap(self):
+    def test_max_penalty_cap(self, baseline_score):
         """Penalties should be capped at maximum."""
         # Many missing keys should not reduce score below reasonable level
         result = HealthCalculator.calculate(
             localized_count=100,
             hardcoded_count=0,
-            missing_keys=[f'key{i}' for i in range(100)],  # 100 missing keys
+            missing_keys=_MISSING_100,
             dead_keys=[],
             duplicates={}
         )
 
         # Score should not go below base - max penalties
-        assert result.score >= 100 - HealthCalculator.MAX_PENALTY_MISSING
+        assert result.score >= baseline_score.score - HealthCalculator.MAX_PENALTY_MISSING
 
     def test_score_clamped_to_zero(self):
         """Score should never go below 0."""
         result = HealthCalculator.calculate(
             localized_count=0,
             hardcoded_count=100,
-            missing_keys=[f'key{i}' for i in range(50)],
-            dead_keys=[f'dead{i}' for i in range(100)],
-            duplicates={f'dup{i}': [] for i in range(50)}
+            missing_keys=_MISSING_50,
+            dead_keys=_DEAD_100,
+            duplicates=_DUP_50
         )
 
         assert result.score >= 0
@@ -197,62 +202,34 @@ class TestHealthCalculatorCalculate:
 class TestCalculateGrade:
     """Test cases for grade calculation."""
 
-    def test_grade_a_plus(self):
-        """Score >= 95 should be A+."""
-        assert HealthCalculator._calculate_grade(95) == 'A+'
-        assert HealthCalculator._calculate_grade(100) == 'A+'
-
-    def test_grade_a(self):
-        """Score >= 90 should be A."""
-        assert HealthCalculator._calculate_grade(90) == 'A'
-        assert HealthCalculator._calculate_grade(94.9) == 'A'
-
-    def test_grade_b(self):
-        """Score >= 80 should be B."""
-        assert HealthCalculator._calculate_grade(80) == 'B'
-        assert HealthCalculator._calculate_grade(89.9) == 'B'
-
-    def test_grade_c(self):
-        """Score >= 70 should be C."""
-        assert HealthCalculator._calculate_grade(70) == 'C'
-        assert HealthCalculator._calculate_grade(79.9) == 'C'
-
-    def test_grade_d(self):
-        """Score >= 60 should be D."""
-        assert HealthCalculator._calculate_grade(60) == 'D'
-        assert HealthCalculator._calculate_grade(69.9) == 'D'
-
-    def test_grade_f(self):
-        """Score < 60 should be F."""
-        assert HealthCalculator._calculate_grade(59.9) == 'F'
-        assert HealthCalculator._calculate_grade(0) == 'F'
+    @pytest.mark.parametrize("score,expected", [
+        (95, 'A+'), (100, 'A+'),
+        (90, 'A'), (94.9, 'A'),
+        (80, 'B'), (89.9, 'B'),
+        (70, 'C'), (79.9, 'C'),
+        (60, 'D'), (69.9, 'D'),
+        (59.9, 'F'), (0, 'F'),
+    ])
+    def test_grade(self, score, expected):
+        """Score should map to the grade whose threshold it reaches."""
+        assert HealthCalculator._calculate_grade(score) == expected
 
 
 class TestGetGradeColor:
     """Test cases for grade color mapping."""
 
-    def test_a_grades_green(self):
-        """A+ and A should be green."""
-        assert HealthCalculator.get_grade_color('A+') == Colors.OKGREEN
-        assert HealthCalculator.get_grade_color('A') == Colors.OKGREEN
-
-    def test_b_grade_cyan(self):
-        """B should be cyan."""
-        assert HealthCalculator.get_grade_color('B') == Colors.OKCYAN
-
-    def test_c_d_grades_warning(self):
-        """C and D should be warning color."""
-        assert HealthCalculator.get_grade_color('C') == Colors.WARNING
-        assert HealthCalculator.get_grade_color('D') == Colors.WARNING
-
-    def test_f_grade_fail(self):
-        """F should be fail color."""
-        assert HealthCalculator.get_grade_color('F') == Colors.FAIL
-
-    def test_unknown_grade_default(self):
-        """Unknown grade should return default."""
-        result = HealthCalculator.get_grade_color('X')
-        assert result == Colors.ENDC
+    @pytest.mark.parametrize("grade,expected", [
+        ('A+', Colors.OKGREEN),
+        ('A', Colors.OKGREEN),
+        ('B', Colors.OKCYAN),
+        ('C', Colors.WARNING),
+        ('D', Colors.WARNING),
+        ('F', Colors.FAIL),
+        ('X', Colors.ENDC),  # Unknown grade falls back to default
+    ])
+    def test_grade_color(self, grade, expected):
+        """Each grade should map to its color."""
+        assert HealthCalculator.get_grade_color(grade) == expected
 
 
 class TestGetRecommendations:
@@ -1,18 +1,29 @@
 """Tests for HTMLReporter."""
 
 import pytest
-import json
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from localization_analyzer.reports.html_reporter import HTMLReporter
-from localization_analyzer.core.analyzer import AnalysisResult
 from localization_analyzer.core.health_calculator import HealthScore
 
 
+def _slurp(path: Path) -> str:
+    """Read a whole file in one call, skipping the buffered text reader."""
+    return path.read_bytes().decode('utf-8')
+
+
+def _assert_all_present(content: str, needles) -> None:
+    """Check that every needle occurs in content."""
+    missing = [needle for needle in needles if needle not in content]
+    assert not missing, missing
+
+
 class MockItem:
     """Mock hardcoded string item."""
+    __slots__ = ('text', 'file', 'line', 'component', 'category', 'priority', 'suggested_key')
+
     def __init__(self, text="Test text", file="test.swift", line=10, priority=8):
         self.text = text
         self.file = file
@@ -23,14 +34,19 @@ class MockItem:
         self.suggested_key = "testKey"
 
 
+# Large dataset for test_large_dataset, built once at import (never mutated)
+_LARGE_HARDCODED = tuple(MockItem(f"Text {i}", f"file{i}.swift", i, 5) for i in range(500))
+_LARGE_MISSING = {f"key{i}": [f"file{i}.swift"] for i in range(100)}
+_LARGE_DEAD = frozenset(f"dead{i}" for i in range(200))
+
+
 class MockAdapter:
     """Mock framework adapter."""
     pass
 
 
-@pytest.fixture
-def mock_result():
-    """Create mock analysis result."""
+def _make_result():
+    """Build the standard mock analysis result."""
     health = HealthScore(
         score=85.0,
         grade='B',
@@ -43,7 +59,7 @@ def mock_result():
         duplicate_count=2
     )
 
-    result = MagicMock(spec=AnalysisResult)
+    result = SimpleNamespace()
     result.health = health
     result.hardcoded_strings = [
         MockItem("Hello World", "View.swift", 10, 9),
@@ -64,372 +80,283 @@ def mock_result():
 
 
 @pytest.fixture
+def mock_result():
+    """Create mock analysis result (per test, since some tests mutate it)."""
+    return _make_result()
+
+
+# Read-only file manager data shared by the session-scoped mock
+_LANG_STATS = {
+    'en': {'total_keys': 100, 'missing_keys': 0, 'completion_percent': 100.0},
+    'tr': {'total_keys': 95, 'missing_keys': 5, 'completion_percent': 95.0},
+    'de': {'total_keys': 80, 'missing_keys': 20, 'completion_percent': 80.0},
+}
+_KEY_MODULES = {'save.button': 'Common', 'cancel.button': 'Dialog'}
+
+
+@pytest.fixture(scope="session")
 def mock_file_manager():
     """Create mock file manager."""
     manager = MagicMock()
-    manager.get_language_stats.return_value = {
-        'en': {'total_keys': 100, 'missing_keys': 0, 'completion_percent': 100.0},
-        'tr': {'total_keys': 95, 'missing_keys': 5, 'completion_percent': 95.0},
-        'de': {'total_keys': 80, 'missing_keys': 20, 'completion_percent': 80.0},
-    }
-    manager.key_modules = {'save.button': 'Common', 'cancel.button': 'Dialog'}
+    manager.get_language_stats.return_value = _LANG_STATS
+    manager.key_modules = _KEY_MODULES
     return manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_adapter():
     """Create mock adapter."""
     return MockAdapter()
 
 
+@pytest.fixture
+def output_path(tmp_path):
+    """Per-test report path."""
+    return tmp_path / 'report.html'
+
+
+@pytest.fixture(scope="session")
+def rendered_report(tmp_path_factory, mock_file_manager, mock_adapter):
+    """Render the standard report once per session; returns (path, content)."""
+    output_path = tmp_path_factory.mktemp('html') / 'report.html'
+
+    result_path = HTMLReporter.generate(
+        result=_make_result(),
+        file_manager=mock_file_manager,
+        adapter=mock_adapter,
+        output_path=output_path
+    )
+
+    assert result_path.exists()
+    return result_path, _slurp(result_path)
+
+
 class TestHTMLReporterGenerate:
     """Test cases for HTMLReporter.generate method."""
 
-    def test_generates_html_file(self, mock_result, mock_file_manager, mock_adapter):
+    def test_generates_html_file(self, rendered_report):
         """Should generate HTML file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
+        result_path, _ = rendered_report
 
-            result_path = HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        assert result_path.name == 'report.html'
 
-            assert result_path == output_path
-            assert output_path.exists()
-
-    def test_default_output_path(self, mock_result, mock_file_manager, mock_adapter):
+    def test_default_output_path(self, mock_result, mock_file_manager, mock_adapter, tmp_path, monkeypatch):
         """Should use default path if not specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Change to temp directory
-            import os
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-
-                result_path = HTMLReporter.generate(
-                    result=mock_result,
-                    file_manager=mock_file_manager,
-                    adapter=mock_adapter
-                )
-
-                assert result_path.name == 'localization_report.html'
-                assert result_path.exists()
-            finally:
-                os.chdir(original_cwd)
-
-    def test_creates_parent_directories(self, mock_result, mock_file_manager, mock_adapter):
-        """Should create parent directories if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'nested' / 'dir' / 'report.html'
+        monkeypatch.chdir(tmp_path)
 
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        result_path = HTMLReporter.generate(
+            result=mock_result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter
+        )
 
-            assert output_path.exists()
+        assert result_path.name == 'localization_report.html'
 
-    def test_custom_title(self, mock_result, mock_file_manager, mock_adapter):
-        """Should use custom title."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
+    def test_creates_parent_directories(self, mock_result, mock_file_manager, mock_adapter, tmp_path):
+        """Should create parent directories if needed."""
+        output_path = tmp_path / 'nested' / 'dir' / 'report.html'
+
+        # generate() would raise if the nested directories were not created
+        result_path = HTMLReporter.generate(
+            result=mock_result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path
+        )
+
+        assert result_path == output_path
 
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path,
-                title="Custom Report Title"
-            )
+    def test_custom_title(self, mock_result, mock_file_manager, mock_adapter, output_path):
+        """Should use custom title."""
+        HTMLReporter.generate(
+            result=mock_result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path,
+            title="Custom Report Title"
+        )
 
-            content = output_path.read_text()
-            assert "Custom Report Title" in content
+        content = _slurp(output_path)
+        assert "Custom Report Title" in content
 
 
 class TestHTMLContent:
     """Test cases for HTML content generation."""
 
-    def test_contains_health_score(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_health_score(self, rendered_report):
         """Should contain health score data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
+        _, content = rendered_report
+        assert '"score": 85.0' in content
+        assert '"grade": "B"' in content
 
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert '"score": 85.0' in content
-            assert '"grade": "B"' in content
-
-    def test_contains_languages_data(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_languages_data(self, rendered_report):
         """Should contain languages data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert '"en"' in content
-            assert '"tr"' in content
-            assert '"de"' in content
-
-    def test_contains_hardcoded_strings(self, mock_result, mock_file_manager, mock_adapter):
-        """Should contain hardcoded strings data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        _, content = rendered_report
+        _assert_all_present(content, ('"en"', '"tr"', '"de"'))
 
-            content = output_path.read_text()
-            assert 'Hello World' in content
-            assert 'View.swift' in content
+    def test_contains_hardcoded_strings(self, rendered_report):
+        """Should contain hardcoded strings data."""
+        _, content = rendered_report
+        assert 'Hello World' in content
+        assert 'View.swift' in content
 
-    def test_contains_missing_keys(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_missing_keys(self, rendered_report):
         """Should contain missing keys data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert 'save.button' in content
-            assert 'cancel.button' in content
+        _, content = rendered_report
+        assert 'save.button' in content
+        assert 'cancel.button' in content
 
-    def test_contains_dead_keys(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_dead_keys(self, rendered_report):
         """Should contain dead keys data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            # Dead keys should be in JSON data
-            assert 'old.key' in content or 'unused.key' in content
+        _, content = rendered_report
+        # Dead keys should be in JSON data
+        assert 'old.key' in content or 'unused.key' in content
 
-    def test_contains_duplicates(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_duplicates(self, rendered_report):
         """Should contain duplicates data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert 'Duplicate Text' in content
+        _, content = rendered_report
+        assert 'Duplicate Text' in content
 
 
 class TestHTMLStructure:
     """Test cases for HTML structure."""
 
-    def test_valid_html_structure(self, mock_result, mock_file_manager, mock_adapter):
+    def test_valid_html_structure(self, rendered_report):
         """Should generate valid HTML structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert '<!DOCTYPE html>' in content
-            assert '<html' in content
-            assert '</html>' in content
-            assert '<head>' in content
-            assert '</head>' in content
-            assert '<body>' in content
-            assert '</body>' in content
-
-    def test_contains_css(self, mock_result, mock_file_manager, mock_adapter):
+        _, content = rendered_report
+        _assert_all_present(content, (
+            '<!DOCTYPE html>', '<html', '</html>',
+            '<head>', '</head>', '<body>', '</body>',
+        ))
+
+    def test_contains_css(self, rendered_report):
         """Should contain CSS styles."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert '<style>' in content
-            assert '</style>' in content
-            # Check for dark mode support
-            assert 'data-theme="dark"' in content
-
-    def test_contains_javascript(self, mock_result, mock_file_manager, mock_adapter):
+        _, content = rendered_report
+        assert '<style>' in content
+        assert '</style>' in content
+        # Check for dark mode support
+        assert 'data-theme="dark"' in content
+
+    def test_contains_javascript(self, rendered_report):
         """Should contain JavaScript."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            assert '<script>' in content
-            assert '</script>' in content
-            assert 'reportData' in content
-
-    def test_contains_interactive_elements(self, mock_result, mock_file_manager, mock_adapter):
+        _, content = rendered_report
+        assert '<script>' in content
+        assert '</script>' in content
+        assert 'reportData' in content
+
+    def test_contains_interactive_elements(self, rendered_report):
         """Should contain interactive elements."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
-
-            content = output_path.read_text()
-            # Search inputs
-            assert 'hardcodedSearch' in content
-            assert 'missingSearch' in content
-            # Theme toggle
-            assert 'themeToggle' in content
-            # Export button
-            assert 'exportJSON' in content
+        _, content = rendered_report
+        _assert_all_present(content, (
+            'hardcodedSearch', 'missingSearch',  # Search inputs
+            'themeToggle',  # Theme toggle
+            'exportJSON',  # Export button
+        ))
+
+
+# Top-level sections every prepared report must have
+_EXPECTED_KEYS = frozenset({
+    'metadata', 'health', 'languages', 'hardcoded_strings',
+    'missing_keys', 'dead_keys', 'duplicates',
+    'component_stats', 'file_stats', 'recommendations',
+})
+
+
+@pytest.fixture(scope="class")
+def _forbid_render():
+    """Fail if anything renders HTML instead of staying on the data path.
+
+    Class-scoped so it is already in place when prepared_data is built.
+    """
+    def boom(*args, **kwargs):
+        raise AssertionError("HTML render not expected")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(HTMLReporter, '_generate_html', staticmethod(boom))
+        yield
+
+
+@pytest.fixture(scope="class")
+def prepared_data(_forbid_render, mock_file_manager, mock_adapter):
+    """Report data for the standard result, prepared once per class."""
+    return HTMLReporter._prepare_report_data(
+        _make_result(), mock_file_manager, mock_adapter
+    )
 
 
+@pytest.mark.usefixtures('_forbid_render')
 class TestPrepareReportData:
     """Test cases for _prepare_report_data method."""
 
-    def test_returns_dict(self, mock_result, mock_file_manager, mock_adapter):
+    def test_returns_dict(self, prepared_data):
         """Should return dictionary."""
-        data = HTMLReporter._prepare_report_data(
-            mock_result, mock_file_manager, mock_adapter
-        )
-
-        assert isinstance(data, dict)
+        assert isinstance(prepared_data, dict)
 
-    def test_contains_metadata(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_metadata(self, prepared_data):
         """Should contain metadata."""
-        data = HTMLReporter._prepare_report_data(
-            mock_result, mock_file_manager, mock_adapter
-        )
+        assert 'metadata' in prepared_data
+        assert 'generated_at' in prepared_data['metadata']
+        assert 'framework' in prepared_data['metadata']
 
-        assert 'metadata' in data
-        assert 'generated_at' in data['metadata']
-        assert 'framework' in data['metadata']
-
-    def test_contains_health(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_health(self, prepared_data):
         """Should contain health data."""
-        data = HTMLReporter._prepare_report_data(
-            mock_result, mock_file_manager, mock_adapter
-        )
+        assert 'health' in prepared_data
+        assert prepared_data['health']['score'] == 85.0
+        assert prepared_data['health']['grade'] == 'B'
 
-        assert 'health' in data
-        assert data['health']['score'] == 85.0
-        assert data['health']['grade'] == 'B'
-
-    def test_contains_all_sections(self, mock_result, mock_file_manager, mock_adapter):
+    def test_contains_all_sections(self, prepared_data):
         """Should contain all data sections."""
-        data = HTMLReporter._prepare_report_data(
-            mock_result, mock_file_manager, mock_adapter
-        )
-
-        expected_keys = [
-            'metadata', 'health', 'languages', 'hardcoded_strings',
-            'missing_keys', 'dead_keys', 'duplicates',
-            'component_stats', 'file_stats', 'recommendations'
-        ]
-
-        for key in expected_keys:
-            assert key in data, f"Missing key: {key}"
+        missing = _EXPECTED_KEYS - prepared_data.keys()
+        assert not missing, f"Missing keys: {missing}"
 
 
 class TestSpecialCharacters:
     """Test cases for special character handling."""
 
-    def test_escapes_html_in_text(self, mock_result, mock_file_manager, mock_adapter):
+    def test_escapes_html_in_text(self, mock_result, mock_file_manager, mock_adapter, output_path):
         """Should escape HTML characters in text."""
         mock_result.hardcoded_strings = [
             MockItem("<script>alert('xss')</script>", "test.swift", 1, 9)
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        HTMLReporter.generate(
+            result=mock_result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path
+        )
 
-            content = output_path.read_text()
-            # Raw script tag should not appear in HTML
-            # It should be escaped in the JSON data
-            assert "<script>alert" not in content.split('const reportData')[0]
+        content = _slurp(output_path)
+        # Raw script tag should not appear in HTML
+        # It should be escaped in the JSON data
+        cut = content.find('const reportData')
+        assert cut != -1
+        assert content.find("<script>alert", 0, cut) == -1
 
-    def test_handles_unicode(self, mock_result, mock_file_manager, mock_adapter):
+    def test_handles_unicode(self, mock_result, mock_file_manager, mock_adapter, output_path):
         """Should handle unicode characters."""
         mock_result.hardcoded_strings = [
             MockItem("Türkçe karakter: ğüşıöç", "test.swift", 1, 9),
             MockItem("Emoji: 🎉🚀", "test.swift", 2, 8),
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=mock_result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        HTMLReporter.generate(
+            result=mock_result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path
+        )
 
-            content = output_path.read_text()
-            # Check that unicode is preserved in JSON
-            assert 'ğüşıöç' in content
-            # Emojis should be in the content
+        content = _slurp(output_path)
+        # Check that unicode is preserved in JSON
+        assert 'ğüşıöç' in content
+        # Emojis should be in the content
 
 
 class TestEdgeCases:
     """Test edge cases."""
 
-    def test_empty_results(self, mock_file_manager, mock_adapter):
+    def test_empty_results(self, mock_file_manager, mock_adapter, output_path):
         """Should handle empty results."""
         health = HealthScore(
             score=100.0, grade='A+', localized_count=0, hardcoded_count=0,
@@ -437,7 +364,7 @@ class TestEdgeCases:
             dead_keys_count=0, duplicate_count=0
         )
 
-        result = MagicMock(spec=AnalysisResult)
+        result = SimpleNamespace()
         result.health = health
         result.hardcoded_strings = []
         result.missing_keys = {}
@@ -446,21 +373,17 @@ class TestEdgeCases:
         result.component_stats = {}
         result.file_stats = {}
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        HTMLReporter.generate(
+            result=result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path
+        )
 
-            assert output_path.exists()
-            content = output_path.read_text()
-            assert '"score": 100.0' in content
+        content = _slurp(output_path)
+        assert '"score": 100.0' in content
 
-    def test_large_dataset(self, mock_file_manager, mock_adapter):
+    def test_large_dataset(self, mock_file_manager, mock_adapter, output_path):
         """Should handle large datasets."""
         health = HealthScore(
             score=50.0, grade='F', localized_count=500, hardcoded_count=500,
@@ -468,28 +391,24 @@ class TestEdgeCases:
             dead_keys_count=200, duplicate_count=50
         )
 
-        result = MagicMock(spec=AnalysisResult)
+        result = SimpleNamespace()
         result.health = health
-        result.hardcoded_strings = [MockItem(f"Text {i}", f"file{i}.swift", i, 5) for i in range(500)]
-        result.missing_keys = {f"key{i}": [f"file{i}.swift"] for i in range(100)}
-        result.dead_keys = {f"dead{i}" for i in range(200)}
+        result.hardcoded_strings = _LARGE_HARDCODED
+        result.missing_keys = _LARGE_MISSING
+        result.dead_keys = _LARGE_DEAD
         result.duplicates = {}
         result.component_stats = {}
         result.file_stats = {}
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.html'
-
-            HTMLReporter.generate(
-                result=result,
-                file_manager=mock_file_manager,
-                adapter=mock_adapter,
-                output_path=output_path
-            )
+        HTMLReporter.generate(
+            result=result,
+            file_manager=mock_file_manager,
+            adapter=mock_adapter,
+            output_path=output_path
+        )
 
-            assert output_path.exists()
-            # File should be reasonable size (less than 5MB for 500 items)
-            assert output_path.stat().st_size < 5 * 1024 * 1024
+        # File should be reasonable size (less than 5MB for 500 items)
+        assert output_path.stat().st_size < 5 * 1024 * 1024
 
 
 if __name__ == '__main__':
@@ -2,8 +2,6 @@
 
 import pytest
 import logging
-import tempfile
-from pathlib import Path
 
 from localization_analyzer.utils.logging import (
     Logger,
@@ -15,6 +13,12 @@ from localization_analyzer.utils.logging import (
 from localization_analyzer.utils.colors import Colors
 
 
+@pytest.fixture(scope="class")
+def color_formatter():
+    """Colored formatter without icons, shared across a test class."""
+    return ColoredFormatter(fmt='%(message)s', use_colors=True, use_icons=False)
+
+
 class TestColoredFormatter:
     """Test cases for ColoredFormatter."""
 
@@ -34,9 +38,8 @@ class TestColoredFormatter:
         assert result == 'Test message'
         assert Colors.OKGREEN not in result
 
-    def test_format_with_colors(self):
+    def test_format_with_colors(self, color_formatter):
         """Formatter with colors should include ANSI codes."""
-        formatter = ColoredFormatter(fmt='%(message)s', use_colors=True, use_icons=False)
         record = logging.LogRecord(
             name='test',
             level=logging.INFO,
@@ -46,45 +49,62 @@ class TestColoredFormatter:
             args=(),
             exc_info=None
         )
-        result = formatter.format(record)
+        result = color_formatter.format(record)
         assert Colors.OKGREEN in result
         assert Colors.ENDC in result
 
-    def test_different_levels_have_different_colors(self):
+    @pytest.mark.parametrize("level,expected_color", [
+        (logging.DEBUG, Colors.OKCYAN),
+        (logging.INFO, Colors.OKGREEN),
+        (logging.WARNING, Colors.WARNING),
+        (logging.ERROR, Colors.FAIL),
+    ])
+    def test_different_levels_have_different_colors(self, color_formatter, level, expected_color):
         """Different log levels should use different colors."""
-        formatter = ColoredFormatter(fmt='%(message)s', use_colors=True, use_icons=False)
-
-        levels = [
-            (logging.DEBUG, Colors.OKCYAN),
-            (logging.INFO, Colors.OKGREEN),
-            (logging.WARNING, Colors.WARNING),
-            (logging.ERROR, Colors.FAIL),
-        ]
-
-        for level, expected_color in levels:
-            record = logging.LogRecord(
-                name='test',
-                level=level,
-                pathname='',
-                lineno=0,
-                msg='Test',
-                args=(),
-                exc_info=None
-            )
-            result = formatter.format(record)
-            assert expected_color in result, f"Level {level} should use color {expected_color}"
+        record = logging.LogRecord(
+            name='test',
+            level=level,
+            pathname='',
+            lineno=0,
+            msg='Test',
+            args=(),
+            exc_info=None
+        )
+        result = color_formatter.format(record)
+        assert expected_color in result, f"Level {level} should use color {expected_color}"
 
 
-class TestLogger:
-    """Test cases for Logger class."""
+@pytest.fixture(scope="class", autouse=True)
+def _log_env():
+    """Give each test class a fresh logger singleton."""
+    reset_logger()
+    yield
+    reset_logger()
 
-    def setup_method(self):
-        """Reset logger before each test."""
-        reset_logger()
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_logger()
+@pytest.fixture(scope="class")
+def verbose_logger(_log_env):
+    """Logger configured once per class in verbose mode."""
+    configure_logging(verbose=True)
+    return get_logger()
+
+
+@pytest.fixture(scope="class")
+def default_logger(_log_env):
+    """Logger configured once per class with default settings."""
+    configure_logging()
+    return get_logger()
+
+
+@pytest.fixture(scope="class")
+def quiet_logger(_log_env):
+    """Logger configured once per class in quiet mode."""
+    configure_logging(quiet=True)
+    return get_logger()
+
+
+class TestLogger:
+    """Test cases for Logger class."""
 
     def test_singleton_pattern(self):
         """Logger should be a singleton."""
@@ -98,188 +118,192 @@ class TestLogger:
         logger2 = get_logger()
         assert logger1 is logger2
 
-    def test_configure_verbose(self):
-        """Verbose mode should set DEBUG level."""
-        logger = get_logger()
-        configure_logging(verbose=True)
-        assert logger._console_handler.level == logging.DEBUG
-
-    def test_configure_quiet(self):
-        """Quiet mode should set WARNING level."""
-        logger = get_logger()
-        configure_logging(quiet=True)
-        assert logger._console_handler.level == logging.WARNING
-
-    def test_configure_default(self):
-        """Default mode should set INFO level."""
+    def test_get_module_logger(self):
+        """Should be able to get module-specific logger."""
         logger = get_logger()
-        configure_logging()
-        assert logger._console_handler.level == logging.INFO
+        module_logger = logger.get_logger('analyzer')
+        assert module_logger.name == 'localization_analyzer.analyzer'
 
-    def test_configure_file_logging(self):
-        """File logging should create a file handler."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / 'test.log'
-            logger = get_logger()
-            configure_logging(log_file=log_file)
 
-            assert logger._file_handler is not None
+class TestLoggerVerbose:
+    """Test cases for a logger in verbose mode."""
 
-            # Write something
-            logger.info("Test message")
+    def test_configure_verbose(self, verbose_logger):
+        """Verbose mode should set DEBUG level."""
+        assert verbose_logger._console_handler.level == logging.DEBUG
 
-            # Close handler to flush
-            logger._file_handler.close()
+    def test_debug_method(self, verbose_logger, caplog):
+        """Debug method should log at DEBUG level."""
+        with caplog.at_level(logging.DEBUG, logger='localization_analyzer'):
+            verbose_logger.debug("Debug message")
+        assert any("Debug message" in message for message in caplog.messages)
 
-            assert log_file.exists()
-            content = log_file.read_text()
-            assert "Test message" in content
 
-    def test_get_module_logger(self):
-        """Should be able to get module-specific logger."""
-        logger = get_logger()
-        module_logger = logger.get_logger('analyzer')
-        assert module_logger.name == 'localization_analyzer.analyzer'
+class TestLoggerDefault:
+    """Test cases for a logger with default settings."""
 
-    def test_debug_method(self, capfd):
-        """Debug method should log at DEBUG level."""
-        configure_logging(verbose=True)
-        logger = get_logger()
-        logger.debug("Debug message")
-        captured = capfd.readouterr()
-        assert "Debug message" in captured.out
+    def test_configure_default(self, default_logger):
+        """Default mode should set INFO level."""
+        assert default_logger._console_handler.level == logging.INFO
 
-    def test_info_method(self, capfd):
+    def test_info_method(self, default_logger, caplog):
         """Info method should log at INFO level."""
-        configure_logging()
-        logger = get_logger()
-        logger.info("Info message")
-        captured = capfd.readouterr()
-        assert "Info message" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.info("Info message")
+        assert any("Info message" in message for message in caplog.messages)
 
-    def test_warning_method(self, capfd):
+    def test_warning_method(self, default_logger, caplog):
         """Warning method should log at WARNING level."""
-        configure_logging()
-        logger = get_logger()
-        logger.warning("Warning message")
-        captured = capfd.readouterr()
-        assert "Warning message" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.warning("Warning message")
+        assert any("Warning message" in message for message in caplog.messages)
 
-    def test_error_method(self, capfd):
+    def test_error_method(self, default_logger, caplog):
         """Error method should log at ERROR level."""
-        configure_logging()
-        logger = get_logger()
-        logger.error("Error message")
-        captured = capfd.readouterr()
-        assert "Error message" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.error("Error message")
+        assert any("Error message" in message for message in caplog.messages)
 
 
-class TestStyledLogging:
-    """Test cases for styled logging methods."""
+class TestLoggerQuiet:
+    """Test cases for a logger in quiet mode."""
 
-    def setup_method(self):
-        """Reset logger before each test."""
-        reset_logger()
+    def test_configure_quiet(self, quiet_logger):
+        """Quiet mode should set WARNING level."""
+        assert quiet_logger._console_handler.level == logging.WARNING
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_logger()
 
-    def test_success_method(self, capfd):
+class TestStyledLogging:
+    """Test cases for styled logging methods."""
+
+    def test_success_method(self, default_logger, caplog):
         """Success method should log with checkmark."""
-        configure_logging()
-        logger = get_logger()
-        logger.success("Success!")
-        captured = capfd.readouterr()
-        assert "" in captured.out
-        assert "Success!" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.success("Success!")
+        assert any("Success!" in message for message in caplog.messages)
 
-    def test_fail_method(self, capfd):
+    def test_fail_method(self, default_logger, caplog):
         """Fail method should log with X mark."""
-        configure_logging()
-        logger = get_logger()
-        logger.fail("Failed!")
-        captured = capfd.readouterr()
-        assert "" in captured.out
-        assert "Failed!" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.fail("Failed!")
+        assert any("Failed!" in message for message in caplog.messages)
 
-    def test_hint_method(self, capfd):
+    def test_hint_method(self, default_logger, caplog):
         """Hint method should log with lightbulb."""
-        configure_logging()
-        logger = get_logger()
-        logger.hint("Helpful tip")
-        captured = capfd.readouterr()
-        assert "" in captured.out
-        assert "Helpful tip" in captured.out
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.hint("Helpful tip")
+        assert any("Helpful tip" in message for message in caplog.messages)
 
-    def test_section_method(self, capfd):
+    def test_section_method(self, default_logger, caplog):
         """Section method should log title with separator."""
+        with caplog.at_level(logging.INFO, logger='localization_analyzer'):
+            default_logger.section("Test Section")
+        assert any("Test Section" in message for message in caplog.messages)
+        assert any("=" in message for message in caplog.messages)
+
+
+
+class TestConsoleOutput:
+    """Test what the configured console handler actually writes."""
+
+    # Each test configures inside its body, so the console handler is bound
+    # to the stdout capsys has already swapped in
+
+    @pytest.mark.parametrize("options,shown,hidden", [
+        ({'verbose': True}, ('debug', 'info', 'warning', 'error'), ()),
+        ({}, ('info', 'warning', 'error'), ('debug',)),
+        ({'quiet': True}, ('warning', 'error'), ('debug', 'info')),
+    ], ids=["verbose", "default", "quiet"])
+    def test_console_level_filter(self, capsys, options, shown, hidden):
+        """Console should print exactly the levels its mode enables."""
+        configure_logging(**options)
+        logger = get_logger()
+        for level in shown + hidden:
+            getattr(logger, level)(f"{level} to console")
+
+        out = capsys.readouterr().out
+        for level in shown:
+            assert f"{level} to console" in out
+        for level in hidden:
+            assert f"{level} to console" not in out
+
+    def test_styled_methods_reach_console(self, capsys):
+        """Styled helpers should print through the console handler."""
         configure_logging()
         logger = get_logger()
+        logger.success("Success!")
+        logger.fail("Failed!")
+        logger.hint("Helpful tip")
         logger.section("Test Section")
-        captured = capfd.readouterr()
-        assert "Test Section" in captured.out
-        assert "=" in captured.out
 
+        out = capsys.readouterr().out
+        for text in ("Success!", "Failed!", "Helpful tip", "Test Section", "=" * 70):
+            assert text in out
 
-class TestFileLogging:
-    """Test cases for file logging functionality."""
 
-    def setup_method(self):
-        """Reset logger before each test."""
-        reset_logger()
+@pytest.fixture(scope="class")
+def shared_log(tmp_path_factory, _log_env):
+    """One file-logging setup per class; returns (log_file, logger).
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        reset_logger()
+    The file lives in a not-yet-existing subdirectory so directory creation
+    is exercised too.
+    """
+    log_file = tmp_path_factory.mktemp('logs') / 'subdir' / 'test.log'
+    configure_logging(log_file=log_file)
+    logger = get_logger()
+    yield log_file, logger
+    logger._file_handler.close()
 
-    def test_log_file_format(self):
-        """File log should have timestamp and level."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / 'test.log'
-            configure_logging(log_file=log_file)
-            logger = get_logger()
 
-            logger.info("Test message")
-            logger.warning("Warning message")
+def _log_since(shared_log, mark: str) -> str:
+    """Flush the shared log and return everything written after ``mark``."""
+    log_file, logger = shared_log
+    logger._file_handler.flush()
+    content = log_file.read_text()
+    return content[content.index(f"---MARK-{mark}---"):]
 
-            # Flush and close
-            logger._file_handler.flush()
-            logger._file_handler.close()
 
-            content = log_file.read_text()
-            assert "[INFO]" in content
-            assert "[WARNING]" in content
-            assert "Test message" in content
-            assert "Warning message" in content
+class TestFileLogging:
+    """Test cases for file logging functionality."""
 
-    def test_log_file_no_colors(self):
-        """File log should not contain ANSI color codes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / 'test.log'
-            configure_logging(log_file=log_file)
-            logger = get_logger()
+    def test_configure_file_logging(self, shared_log):
+        """File logging should create a file handler."""
+        log_file, logger = shared_log
+        assert logger._file_handler is not None
 
-            logger.info("Test message")
+        logger.info("---MARK-configure---")
+        logger.info("Test message")
 
-            # Flush and close
-            logger._file_handler.flush()
-            logger._file_handler.close()
+        assert log_file.exists()
+        assert "Test message" in _log_since(shared_log, 'configure')
 
-            content = log_file.read_text()
-            assert '\033[' not in content  # No ANSI escape codes
+    def test_log_file_format(self, shared_log):
+        """File log should have timestamp and level."""
+        _, logger = shared_log
+        logger.info("---MARK-format---")
+        logger.info("Test message")
+        logger.warning("Warning message")
 
-    def test_log_file_directory_creation(self):
-        """Should create directory if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / 'subdir' / 'test.log'
-            configure_logging(log_file=log_file)
-            logger = get_logger()
+        content = _log_since(shared_log, 'format')
+        assert "[INFO]" in content
+        assert "[WARNING]" in content
+        assert "Test message" in content
+        assert "Warning message" in content
 
-            logger.info("Test")
-            logger._file_handler.flush()
+    def test_log_file_no_colors(self, shared_log):
+        """File log should not contain ANSI color codes."""
+        _, logger = shared_log
+        logger.info("---MARK-colors---")
+        logger.info("Test message")
 
-            assert log_file.parent.exists()
+        content = _log_since(shared_log, 'colors')
+        assert '\033[' not in content  # No ANSI escape codes
+
+    def test_log_file_directory_creation(self, shared_log):
+        """Should create directory if it doesn't exist."""
+        log_file, _ = shared_log
+        assert log_file.parent.name == 'subdir'
+        assert log_file.parent.exists()
 
 
 class TestResetLogger:
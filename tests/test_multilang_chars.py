@@ -4,157 +4,133 @@ import pytest
 from localization_analyzer.frameworks.swift import SwiftAdapter
 
 
+@pytest.fixture(scope="module")
+def adapter():
+    """Shared adapter; text_to_key and CHAR_MAP keep no per-test state."""
+    return SwiftAdapter()
+
+
 class TestTextToKeyMultiLanguage:
     """Test cases for text_to_key with multi-language character support."""
 
-    def setup_method(self):
-        """Setup test adapter."""
-        self.adapter = SwiftAdapter()
-
-    def test_turkish_characters(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("Çıkış", "cikis"),
+        ("Güncelle", "guncelle"),
+        ("Şifre", "sifre"),
+        ("Üye Ol", "uyeOl"),
+        ("İletişim", "iletisim"),
+        ("Ödemeler", "odemeler"),
+    ])
+    def test_turkish_characters(self, adapter, text, expected):
         """Turkish characters should be converted correctly."""
-        test_cases = [
-            ("Çıkış", "cikis"),
-            ("Güncelle", "guncelle"),
-            ("Şifre", "sifre"),
-            ("Üye Ol", "uyeOl"),
-            ("İletişim", "iletisim"),
-            ("Ödemeler", "odemeler"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_german_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Größe", "grosse"),
+        ("Ändern", "andern"),
+        ("Öffnen", "offnen"),
+        ("Über uns", "uberUns"),
+        ("Schließen", "schliessen"),
+    ])
+    def test_german_characters(self, adapter, text, expected):
         """German characters should be converted correctly."""
-        test_cases = [
-            ("Größe", "grosse"),
-            ("Ändern", "andern"),
-            ("Öffnen", "offnen"),
-            ("Über uns", "uberUns"),
-            ("Schließen", "schliessen"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_french_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Déconnexion", "deconnexion"),
+        ("Paramètres", "parametres"),
+        ("Créer", "creer"),
+        ("Français", "francais"),
+        ("Œuvre", "oeuvre"),
+    ])
+    def test_french_characters(self, adapter, text, expected):
         """French characters should be converted correctly."""
-        test_cases = [
-            ("Déconnexion", "deconnexion"),
-            ("Paramètres", "parametres"),
-            ("Créer", "creer"),
-            ("Français", "francais"),
-            ("Œuvre", "oeuvre"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_spanish_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Año", "ano"),
+        ("Señor", "senor"),
+        ("Información", "informacion"),
+        ("Búsqueda", "busqueda"),
+    ])
+    def test_spanish_characters(self, adapter, text, expected):
         """Spanish characters should be converted correctly."""
-        test_cases = [
-            ("Año", "ano"),
-            ("Señor", "senor"),
-            ("Información", "informacion"),
-            ("Búsqueda", "busqueda"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_polish_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Zażółć", "zazolc"),
+        ("Łódź", "lodz"),
+        ("Świętość", "swietosc"),
+    ])
+    def test_polish_characters(self, adapter, text, expected):
         """Polish characters should be converted correctly."""
-        test_cases = [
-            ("Zażółć", "zazolc"),
-            ("Łódź", "lodz"),
-            ("Świętość", "swietosc"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_czech_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Říční", "ricni"),
+        ("Žába", "zaba"),
+        ("Člověk", "clovek"),
+    ])
+    def test_czech_characters(self, adapter, text, expected):
         """Czech characters should be converted correctly."""
-        test_cases = [
-            ("Říční", "ricni"),
-            ("Žába", "zaba"),
-            ("Člověk", "clovek"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_scandinavian_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Årsrapport", "arsrapport"),
+        ("København", "kobenhavn"),
+        ("Øresund", "oresund"),
+    ])
+    def test_scandinavian_characters(self, adapter, text, expected):
         """Scandinavian characters should be converted correctly."""
-        test_cases = [
-            ("Årsrapport", "arsrapport"),
-            ("København", "kobenhavn"),
-            ("Øresund", "oresund"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_mixed_special_characters(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Größe ändern", "grosseAndern"),
+        ("Çıkış Yap", "cikisYap"),
+        ("Información útil", "informacionUtil"),
+    ])
+    def test_mixed_special_characters(self, adapter, text, expected):
         """Mixed special characters from different languages should work."""
-        test_cases = [
-            ("Größe ändern", "grosseAndern"),
-            ("Çıkış Yap", "cikisYap"),
-            ("Información útil", "informacionUtil"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
-
-    def test_plain_english(self):
+        assert adapter.text_to_key(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Save", "save"),
+        ("Cancel Changes", "cancelChanges"),
+        ("Delete Item", "deleteItem"),
+    ])
+    def test_plain_english(self, adapter, text, expected):
         """Plain English text should work as before."""
-        test_cases = [
-            ("Save", "save"),
-            ("Cancel Changes", "cancelChanges"),
-            ("Delete Item", "deleteItem"),
-        ]
-        for text, expected in test_cases:
-            result = self.adapter.text_to_key(text)
-            assert result == expected, f"'{text}' should convert to '{expected}', got '{result}'"
+        assert adapter.text_to_key(text) == expected
+
+    # NFKD runs before the special-letter map, so letters that decompose to
+    # one (Ǿ -> Ø + accent, ǽ -> æ + accent) or that are compatibility forms
+    # (ᴭ -> Æ) are spelled out instead of dropped, and the CGJ format mark no
+    # longer splits words.
+    @pytest.mark.parametrize("text,expected", [
+        ("ǽsir", "aesir"),
+        ("Ǿrnek Ǣra", "ornekAera"),
+        ("aᴭb", "aaeb"),
+        ("a\u034fb test", "abTest"),
+    ])
+    def test_decomposes_before_special_letters(self, adapter, text, expected):
+        """Accented special letters should fold through their base letter."""
+        assert adapter.text_to_key(text) == expected
 
 
 class TestCharMapCompleteness:
     """Test CHAR_MAP completeness."""
 
-    def setup_method(self):
-        """Setup test adapter."""
-        self.adapter = SwiftAdapter()
-
-    def test_char_map_has_turkish(self):
-        """CHAR_MAP should contain Turkish characters."""
-        turkish_chars = ['ç', 'ğ', 'ı', 'ö', 'ş', 'ü', 'Ç', 'Ğ', 'İ', 'Ö', 'Ş', 'Ü']
-        for char in turkish_chars:
-            assert char in self.adapter.CHAR_MAP, f"Turkish char '{char}' missing from CHAR_MAP"
-
-    def test_char_map_has_german(self):
-        """CHAR_MAP should contain German characters."""
-        german_chars = ['ä', 'ö', 'ü', 'ß', 'Ä', 'Ö', 'Ü']
-        for char in german_chars:
-            assert char in self.adapter.CHAR_MAP, f"German char '{char}' missing from CHAR_MAP"
-
-    def test_char_map_has_french(self):
-        """CHAR_MAP should contain French characters."""
-        french_chars = ['à', 'â', 'é', 'è', 'ê', 'ë', 'î', 'ï', 'ô', 'ù', 'û', 'ÿ', 'œ', 'æ']
-        for char in french_chars:
-            assert char in self.adapter.CHAR_MAP, f"French char '{char}' missing from CHAR_MAP"
-
-    def test_char_map_has_spanish(self):
-        """CHAR_MAP should contain Spanish characters."""
-        spanish_chars = ['á', 'é', 'í', 'ó', 'ú', 'ñ', 'Ñ']
-        for char in spanish_chars:
-            assert char in self.adapter.CHAR_MAP, f"Spanish char '{char}' missing from CHAR_MAP"
-
-    def test_char_map_has_polish(self):
-        """CHAR_MAP should contain Polish characters."""
-        polish_chars = ['ą', 'ć', 'ę', 'ł', 'ń', 'ś', 'ź', 'ż']
-        for char in polish_chars:
-            assert char in self.adapter.CHAR_MAP, f"Polish char '{char}' missing from CHAR_MAP"
+    @pytest.mark.parametrize("lang,chars", [
+        ("turkish", ['ç', 'ğ', 'ı', 'ö', 'ş', 'ü', 'Ç', 'Ğ', 'İ', 'Ö', 'Ş', 'Ü']),
+        ("german", ['ä', 'ö', 'ü', 'ß', 'Ä', 'Ö', 'Ü']),
+        ("french", ['à', 'â', 'é', 'è', 'ê', 'ë', 'î', 'ï', 'ô', 'ù', 'û', 'ÿ', 'œ', 'æ']),
+        ("spanish", ['á', 'é', 'í', 'ó', 'ú', 'ñ', 'Ñ']),
+        ("polish", ['ą', 'ć', 'ę', 'ł', 'ń', 'ś', 'ź', 'ż']),
+    ])
+    def test_char_map_has_language(self, adapter, lang, chars):
+        """CHAR_MAP should contain each language's special characters."""
+        missing = set(chars) - adapter.CHAR_MAP.keys()
+        assert not missing, f"{lang} chars missing from CHAR_MAP: {missing}"
 
 
 class TestPatternCaching:
@@ -184,6 +160,18 @@ class TestPatternCaching:
 
         assert patterns1 is patterns2, "Exclusion patterns should be cached at class level"
 
+    def test_char_map_pattern_cached(self):
+        """CHAR_MAP pattern should be cached at class level."""
+        adapter1 = SwiftAdapter()
+        adapter2 = SwiftAdapter()
+
+        pattern1 = adapter1._get_compiled_char_map_pattern()
+        pattern2 = adapter2._get_compiled_char_map_pattern()
+
+        assert pattern1 is pattern2, "CHAR_MAP pattern should be cached at class level"
+        assert pattern1.search('Größe')
+        assert pattern1.search('Plain ASCII') is None
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -42,6 +42,16 @@ class TestProgressBar:
         bar = ProgressBar(items, disable=True)
         assert bar.total == 5
 
+    def test_total_from_iterator_length_hint(self):
+        """Should get total from an iterator's length hint."""
+        bar = ProgressBar(iter([1, 2, 3]), disable=True)
+        assert bar.total == 3
+
+    def test_no_total_for_generator(self):
+        """Generators have no length, so total stays unknown."""
+        bar = ProgressBar((i for i in range(3)), disable=True)
+        assert bar.total is None
+
     def test_explicit_total(self):
         """Should use explicit total."""
         items = iter([1, 2, 3])  # Iterator has no len()
@@ -90,6 +100,21 @@ class TestProgressBarWithoutTqdm:
         # Should contain percentage
         assert '%' in content
 
+    def test_redraws_throttled_but_completion_shown(self):
+        """Should skip redraws within the refresh interval but always show 100%."""
+        items = list(range(100))
+        output = StringIO()
+
+        bar = ProgressBar(items, total=100, file=output, miniters=1)
+
+        # Freeze the clock: only the first update and the final one get drawn
+        with patch('localization_analyzer.utils.progress.time.monotonic', return_value=1.0):
+            list(bar._simple_progress())
+
+        content = output.getvalue()
+        assert content.count('\r') == 2
+        assert '100/100 (100.0%)' in content
+
 
 class TestProgressBarFunction:
     """Test cases for progress_bar function."""
@@ -100,6 +125,12 @@ class TestProgressBarFunction:
         result = progress_bar(items, disable=True)
         assert list(result) == items
 
+    def test_disabled_returns_plain_iterator(self):
+        """Disabled progress should hand back the iterable's own iterator."""
+        items = [1, 2, 3]
+        assert type(progress_bar(items, disable=True)) is type(iter(items))
+        assert type(iter(ProgressBar(items, disable=True))) is type(iter(items))
+
     def test_function_with_options(self):
         """Should accept all options."""
         items = [1, 2, 3]
@@ -2,9 +2,8 @@
 
 import pytest
 import json
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 from dataclasses import dataclass, field
 from typing import List, Set, Dict
 
@@ -12,6 +11,11 @@ from localization_analyzer.reports.console_reporter import ConsoleReporter
 from localization_analyzer.reports.json_reporter import JSONReporter
 from localization_analyzer.core.health_calculator import HealthScore
 from localization_analyzer.frameworks.base import HardcodedString
+from localization_analyzer.utils.colors import Colors
+
+# Keep the module on one xdist worker so the shared report fixtures are
+# generated once (with --dist loadgroup).
+pytestmark = pytest.mark.xdist_group("reporters")
 
 
 @dataclass
@@ -31,91 +35,141 @@ class MockAnalysisResult:
     folder_stats: Dict[str, Dict] = field(default_factory=dict)
 
 
-class TestConsoleReporter:
-    """Test cases for ConsoleReporter."""
-
-    def create_mock_health(self):
-        """Create a mock health score."""
-        return HealthScore(
-            score=85,
-            grade='B',
-            localized_count=100,
-            hardcoded_count=15,
-            total_strings=115,
-            localization_rate=87.0,
-            missing_keys_count=5,
-            dead_keys_count=3,
-            duplicate_count=2
-        )
-
-    def create_mock_file_manager(self):
-        """Create a mock file manager."""
-        mock = MagicMock()
-        mock.get_language_stats.return_value = {
+# Read-only hardcoded strings shared by the console and JSON tests.
+_HARDCODED = HardcodedString(
+    file='test.swift', line=10, text='Test string',
+    component='Label', category='UI', priority=8,
+    suggested_key='testString'
+)
+_DUPLICATE = HardcodedString(
+    file='test.swift', line=10, text='Duplicate',
+    component='Label', category='UI', priority=5,
+    suggested_key='duplicate'
+)
+
+
+class SwiftAdapter:
+    """Stand-in adapter; JSONReporter only reads its class name."""
+
+
+@pytest.fixture(scope="session")
+def mock_health():
+    """Health score shared by every test (HealthScore is frozen)."""
+    return HealthScore(
+        score=85,
+        grade='B',
+        localized_count=100,
+        hardcoded_count=15,
+        total_strings=115,
+        localization_rate=87.0,
+        missing_keys_count=5,
+        dead_keys_count=3,
+        duplicate_count=2
+    )
+
+
+def _make_file_manager():
+    """Build a file manager stand-in with two languages."""
+    return SimpleNamespace(
+        get_language_stats=lambda: {
             'en': {'total_keys': 100, 'missing_keys': 0, 'completion_percent': 100.0},
             'tr': {'total_keys': 95, 'missing_keys': 5, 'completion_percent': 95.0},
-        }
-        mock.languages = {
+        },
+        languages={
             'en': [Path('/test/en.lproj/Localizable.strings')],
             'tr': [Path('/test/tr.lproj/Localizable.strings')],
-        }
-        mock.key_modules = {'test.key': 'Common'}
-        return mock
+        },
+        key_modules={'test.key': 'Common'},
+        find_missing_translations=lambda: {},
+        find_untranslated_keys=lambda: {},
+    )
+
+
+@pytest.fixture
+def mock_file_manager():
+    """File manager stand-in with two languages."""
+    return _make_file_manager()
+
+
+@pytest.fixture
+def mock_adapter():
+    """Adapter stand-in reporting itself as SwiftAdapter."""
+    return SwiftAdapter()
+
+
+def _generate_report(tmp_path_factory, health, pretty):
+    """Generate a report for an otherwise empty result and read it back."""
+    output_path = tmp_path_factory.mktemp('report') / 'report.json'
+    returned_path = JSONReporter.generate(
+        MockAnalysisResult(health=health), _make_file_manager(), SwiftAdapter(),
+        output_path, pretty=pretty
+    )
+    raw = output_path.read_bytes()
+    return SimpleNamespace(
+        path=output_path, returned_path=returned_path,
+        content=raw.decode('utf-8'), data=json.loads(raw),
+    )
+
+
+@pytest.fixture(scope="module")
+def pretty_report(tmp_path_factory, mock_health):
+    """Pretty-printed report shared by read-only assertions."""
+    return _generate_report(tmp_path_factory, mock_health, pretty=True)
 
-    def test_print_full_report_no_details(self, capfd):
+
+@pytest.fixture(scope="module")
+def compact_report(tmp_path_factory, mock_health):
+    """Compact report shared by read-only assertions.
+
+    Tests that only check file existence or field values use this one, since
+    compact encoding is cheaper than indent=2.
+    """
+    return _generate_report(tmp_path_factory, mock_health, pretty=False)
+
+
+class TestConsoleReporter:
+    """Test cases for ConsoleReporter."""
+
+    def test_print_full_report_no_details(self, capsys, mock_health, mock_file_manager):
         """Full report without details should print basic info."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
+        result = MockAnalysisResult(health=mock_health)
 
-        ConsoleReporter.print_full_report(result, file_manager, show_details=False)
+        ConsoleReporter.print_full_report(result, mock_file_manager, show_details=False)
 
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
         assert "LOCALIZATION ANALYSIS REPORT" in captured.out
         assert "HEALTH SCORE" in captured.out
         assert "85/100" in captured.out
         assert "LANGUAGES" in captured.out
 
-    def test_print_full_report_with_details(self, capfd):
+    def test_print_full_report_with_details(self, capsys, mock_health, mock_file_manager):
         """Full report with details should print all sections."""
-        health = self.create_mock_health()
-        hardcoded = HardcodedString(
-            file='test.swift',
-            line=10,
-            text='Test string',
-            component='Label',
-            category='UI',
-            priority=8,
-            suggested_key='testString'
-        )
         result = MockAnalysisResult(
-            health=health,
-            hardcoded_strings=[hardcoded],
+            health=mock_health,
+            hardcoded_strings=[_HARDCODED],
             missing_keys={'missing.key': ['file1.swift']},
             dead_keys={'dead.key'},
-            duplicates={'Duplicate': [hardcoded, hardcoded]}
+            duplicates={'Duplicate': [_DUPLICATE, _DUPLICATE]}
         )
-        file_manager = self.create_mock_file_manager()
 
-        ConsoleReporter.print_full_report(result, file_manager, show_details=True)
+        ConsoleReporter.print_full_report(result, mock_file_manager, show_details=True)
 
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
         assert "TOP HARDCODED STRINGS" in captured.out
         assert "MISSING KEYS" in captured.out
         assert "DEAD KEYS" in captured.out
 
-    def test_print_header(self, capfd):
+    def test_print_header(self, capsys):
         """Header should print title."""
         ConsoleReporter._print_header()
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
         assert "LOCALIZATION ANALYSIS REPORT" in captured.out
         assert "=" in captured.out
 
-    def test_print_health_score(self, capfd):
+    def test_print_health_score(self, capsys, mock_health):
         """Health score section should print all metrics."""
-        health = self.create_mock_health()
-        ConsoleReporter._print_health_score(health)
-        captured = capfd.readouterr()
+        ConsoleReporter._print_health_score(mock_health)
+        captured = capsys.readouterr()
 
         assert "HEALTH SCORE" in captured.out
         assert "85/100" in captured.out
@@ -124,11 +178,10 @@ class TestConsoleReporter:
         assert "Missing Keys: 5" in captured.out
         assert "Dead Keys: 3" in captured.out
 
-    def test_print_language_stats(self, capfd):
+    def test_print_language_stats(self, capsys, mock_file_manager):
         """Language stats should print table."""
-        file_manager = self.create_mock_file_manager()
-        ConsoleReporter._print_language_stats(file_manager)
-        captured = capfd.readouterr()
+        ConsoleReporter._print_language_stats(mock_file_manager)
+        captured = capsys.readouterr()
 
         assert "LANGUAGES" in captured.out
         assert "Language" in captured.out
@@ -136,374 +189,201 @@ class TestConsoleReporter:
         assert "Missing" in captured.out
         assert "Completion" in captured.out
 
-    def test_print_language_stats_empty(self, capfd):
+    def test_print_language_stats_empty(self, capsys):
         """Empty language stats should show message."""
-        mock = MagicMock()
-        mock.get_language_stats.return_value = {}
-        ConsoleReporter._print_language_stats(mock)
-        captured = capfd.readouterr()
+        file_manager = SimpleNamespace(get_language_stats=lambda: {})
+        ConsoleReporter._print_language_stats(file_manager)
+        captured = capsys.readouterr()
         assert "No languages found" in captured.out
 
-    def test_print_hardcoded_strings(self, capfd):
+    def test_print_hardcoded_strings(self, capsys):
         """Hardcoded strings section should print items."""
-        strings = [
-            HardcodedString(
-                file='test.swift',
-                line=10,
-                text='Test string',
-                component='Label',
-                category='UI',
-                priority=9,
-                suggested_key='testString'
-            )
-        ]
-        ConsoleReporter._print_hardcoded_strings(strings)
-        captured = capfd.readouterr()
+        ConsoleReporter._print_hardcoded_strings([_HARDCODED])
+        captured = capsys.readouterr()
 
         assert "TOP HARDCODED STRINGS" in captured.out
         assert "test.swift:10" in captured.out
         assert "testString" in captured.out
 
-    def test_print_hardcoded_strings_empty(self, capfd):
-        """Empty hardcoded strings should print nothing."""
-        ConsoleReporter._print_hardcoded_strings([])
-        captured = capfd.readouterr()
-        assert captured.out == ""
-
-    def test_print_missing_keys(self, capfd):
+    def test_print_missing_keys(self, capsys):
         """Missing keys section should print keys."""
         missing = {'test.key': ['file1.swift', 'file2.swift']}
-        mock_fm = MagicMock()
-        mock_fm.key_modules = {'test.key': 'Common'}
+        mock_fm = SimpleNamespace(key_modules={'test.key': 'Common'})
 
         ConsoleReporter._print_missing_keys(missing, mock_fm)
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
 
         assert "MISSING KEYS" in captured.out
         assert "test.key" in captured.out
 
-    def test_print_missing_keys_empty(self, capfd):
-        """Empty missing keys should print nothing."""
-        ConsoleReporter._print_missing_keys({}, MagicMock())
-        captured = capfd.readouterr()
-        assert captured.out == ""
-
-    def test_print_dynamic_keys(self, capfd):
+    def test_print_dynamic_keys(self, capsys):
         """Dynamic keys section should print keys."""
         dynamic = {'activity.\\(id)': ['file1.swift']}
         ConsoleReporter._print_dynamic_keys(dynamic)
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
 
         assert "DYNAMIC KEYS" in captured.out
         assert "runtime-generated" in captured.out
 
-    def test_print_dynamic_keys_empty(self, capfd):
-        """Empty dynamic keys should print nothing."""
-        ConsoleReporter._print_dynamic_keys({})
-        captured = capfd.readouterr()
-        assert captured.out == ""
-
-    def test_print_dead_keys(self, capfd):
+    def test_print_dead_keys(self, capsys):
         """Dead keys section should print keys."""
         dead = {'dead.key1', 'dead.key2'}
-        mock_fm = MagicMock()
-        mock_fm.key_modules = {'dead.key1': 'Common'}
+        mock_fm = SimpleNamespace(key_modules={'dead.key1': 'Common'})
 
         ConsoleReporter._print_dead_keys(dead, mock_fm)
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
 
         assert "DEAD KEYS" in captured.out
         assert "dead.key" in captured.out
 
-    def test_print_dead_keys_empty(self, capfd):
-        """Empty dead keys should print nothing."""
-        ConsoleReporter._print_dead_keys(set(), MagicMock())
-        captured = capfd.readouterr()
-        assert captured.out == ""
-
-    def test_print_duplicates(self, capfd):
+    def test_print_duplicates(self, capsys):
         """Duplicates section should print items."""
-        hardcoded = HardcodedString(
-            file='test.swift', line=10, text='Duplicate',
-            component='Label', category='UI', priority=5,
-            suggested_key='duplicate'
-        )
-        duplicates = {'Duplicate text': [hardcoded, hardcoded]}
+        duplicates = {'Duplicate text': [_DUPLICATE, _DUPLICATE]}
 
         ConsoleReporter._print_duplicates(duplicates)
-        captured = capfd.readouterr()
+        captured = capsys.readouterr()
 
         assert "DUPLICATE STRINGS" in captured.out
         assert "2 occurrences" in captured.out
 
-    def test_print_duplicates_empty(self, capfd):
-        """Empty duplicates should print nothing."""
-        ConsoleReporter._print_duplicates({})
-        captured = capfd.readouterr()
+    @pytest.mark.parametrize("print_section", [
+        lambda: ConsoleReporter._print_hardcoded_strings([]),
+        lambda: ConsoleReporter._print_missing_keys({}, SimpleNamespace(key_modules={})),
+        lambda: ConsoleReporter._print_dynamic_keys({}),
+        lambda: ConsoleReporter._print_dead_keys(set(), SimpleNamespace(key_modules={})),
+        lambda: ConsoleReporter._print_duplicates({}),
+    ], ids=["hardcoded_strings", "missing_keys", "dynamic_keys", "dead_keys", "duplicates"])
+    def test_print_section_empty(self, capsys, print_section):
+        """Empty sections should print nothing."""
+        print_section()
+        captured = capsys.readouterr()
         assert captured.out == ""
 
-    def test_create_progress_bar_high(self):
-        """High percentage should be green."""
-        bar = ConsoleReporter._create_progress_bar(95.0)
-        assert "95.0%" in bar
+    @pytest.mark.parametrize("percent,color", [
+        (95.0, Colors.OKGREEN),
+        (75.0, Colors.OKCYAN),
+        (50.0, Colors.WARNING),
+    ], ids=["high", "medium", "low"])
+    def test_create_progress_bar(self, percent, color):
+        """Bar is green from 90%, cyan from 70% and yellow below."""
+        bar = ConsoleReporter._create_progress_bar(percent)
+        assert bar.startswith(color)
+        assert f"{percent}%" in bar
         assert "█" in bar
 
-    def test_create_progress_bar_medium(self):
-        """Medium percentage should be cyan."""
-        bar = ConsoleReporter._create_progress_bar(75.0)
-        assert "75.0%" in bar
-
-    def test_create_progress_bar_low(self):
-        """Low percentage should be yellow."""
-        bar = ConsoleReporter._create_progress_bar(50.0)
-        assert "50.0%" in bar
-
 
 class TestJSONReporter:
     """Test cases for JSONReporter."""
 
-    def create_mock_health(self):
-        """Create a mock health score."""
-        return HealthScore(
-            score=85,
-            grade='B',
-            localized_count=100,
-            hardcoded_count=15,
-            total_strings=115,
-            localization_rate=87.0,
-            missing_keys_count=5,
-            dead_keys_count=3,
-            duplicate_count=2
-        )
-
-    def create_mock_file_manager(self):
-        """Create a mock file manager."""
-        mock = MagicMock()
-        mock.get_language_stats.return_value = {
-            'en': {'total_keys': 100, 'missing_keys': 0, 'completion_percent': 100.0}
-        }
-        mock.key_modules = {}
-        mock.find_missing_translations.return_value = {}
-        mock.find_untranslated_keys.return_value = {}
-        return mock
-
-    def create_mock_adapter(self):
-        """Create a mock adapter."""
-        mock = MagicMock()
-        mock.__class__.__name__ = 'SwiftAdapter'
-        return mock
-
-    def test_generate_creates_file(self):
+    def test_generate_creates_file(self, compact_report):
         """Generate should create JSON file."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            returned_path = JSONReporter.generate(
-                result, file_manager, adapter, output_path
-            )
+        assert compact_report.path.exists()
+        assert compact_report.returned_path == compact_report.path
 
-            assert output_path.exists()
-            assert returned_path == output_path
+        data = compact_report.data
+        assert 'metadata' in data
+        assert 'health_score' in data
+        assert data['health_score']['score'] == 85
 
-            with open(output_path) as f:
-                data = json.load(f)
-
-            assert 'metadata' in data
-            assert 'health_score' in data
-            assert data['health_score']['score'] == 85
-
-    def test_generate_with_hardcoded_strings(self):
+    def test_generate_with_hardcoded_strings(self, mock_health, mock_file_manager, mock_adapter):
         """Generate should include hardcoded strings."""
-        health = self.create_mock_health()
-        hardcoded = HardcodedString(
-            file='test.swift', line=10, text='Test',
-            component='Label', category='UI', priority=8,
-            suggested_key='test'
-        )
         result = MockAnalysisResult(
-            health=health,
-            hardcoded_strings=[hardcoded]
+            health=mock_health,
+            hardcoded_strings=[_HARDCODED]
         )
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
+        data = JSONReporter._prepare_report_data(result, mock_file_manager, mock_adapter)
 
-            with open(output_path) as f:
-                data = json.load(f)
+        assert len(data['hardcoded_strings']) == 1
+        assert data['hardcoded_strings'][0]['file'] == 'test.swift'
+        assert data['hardcoded_strings'][0]['line'] == 10
 
-            assert len(data['hardcoded_strings']) == 1
-            assert data['hardcoded_strings'][0]['file'] == 'test.swift'
-            assert data['hardcoded_strings'][0]['line'] == 10
-
-    def test_generate_with_missing_keys(self):
+    def test_generate_with_missing_keys(self, mock_health, mock_file_manager, mock_adapter):
         """Generate should include missing keys."""
-        health = self.create_mock_health()
         result = MockAnalysisResult(
-            health=health,
+            health=mock_health,
             missing_keys={'missing.key': ['file1.swift']}
         )
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
 
-            with open(output_path) as f:
-                data = json.load(f)
+        data = JSONReporter._prepare_report_data(result, mock_file_manager, mock_adapter)
 
-            assert 'missing.key' in data['missing_keys']
-            assert 'file1.swift' in data['missing_keys']['missing.key']['files']
+        assert 'missing.key' in data['missing_keys']
+        assert 'file1.swift' in data['missing_keys']['missing.key']['files']
 
-    def test_generate_with_dead_keys(self):
+    def test_generate_with_dead_keys(self, mock_health, mock_file_manager, mock_adapter):
         """Generate should include dead keys."""
-        health = self.create_mock_health()
         result = MockAnalysisResult(
-            health=health,
+            health=mock_health,
             dead_keys={'dead.key1', 'dead.key2'}
         )
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
+        data = JSONReporter._prepare_report_data(result, mock_file_manager, mock_adapter)
 
-            with open(output_path) as f:
-                data = json.load(f)
+        assert len(data['dead_keys']) == 2
 
-            assert len(data['dead_keys']) == 2
-
-    def test_generate_with_duplicates(self):
+    def test_generate_with_duplicates(self, mock_health, mock_file_manager, mock_adapter):
         """Generate should include duplicates."""
-        health = self.create_mock_health()
-        hardcoded = HardcodedString(
-            file='test.swift', line=10, text='Dup',
-            component='Label', category='UI', priority=5,
-            suggested_key='dup'
-        )
         result = MockAnalysisResult(
-            health=health,
-            duplicates={'Duplicate': [hardcoded, hardcoded]}
+            health=mock_health,
+            duplicates={'Duplicate': [_DUPLICATE, _DUPLICATE]}
         )
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
+        data = JSONReporter._prepare_report_data(result, mock_file_manager, mock_adapter)
 
-            with open(output_path) as f:
-                data = json.load(f)
+        assert 'Duplicate' in data['duplicates']
+        assert len(data['duplicates']['Duplicate']) == 2
 
-            assert 'Duplicate' in data['duplicates']
-            assert len(data['duplicates']['Duplicate']) == 2
-
-    def test_generate_creates_directory(self):
+    def test_generate_creates_directory(self, tmp_path, mock_health, mock_file_manager, mock_adapter):
         """Generate should create parent directories."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
+        result = MockAnalysisResult(health=mock_health)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'subdir' / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
+        output_path = tmp_path / 'subdir' / 'report.json'
+        JSONReporter.generate(
+            result, mock_file_manager, mock_adapter, output_path, pretty=False
+        )
 
-            assert output_path.exists()
-            assert output_path.parent.exists()
+        assert output_path.exists()
+        assert output_path.parent.exists()
 
-    def test_generate_pretty_print(self):
+    def test_generate_pretty_print(self, pretty_report):
         """Generate with pretty=True should indent JSON."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(
-                result, file_manager, adapter, output_path, pretty=True
-            )
-
-            content = output_path.read_text()
-            assert '\n' in content  # Pretty print has newlines
-            assert '  ' in content  # Has indentation
-
-    def test_generate_compact(self):
+        content = pretty_report.content
+        assert '\n' in content  # Pretty print has newlines
+        assert '  ' in content  # Has indentation
+
+    def test_generate_compact(self, compact_report):
         """Generate with pretty=False should be compact."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(
-                result, file_manager, adapter, output_path, pretty=False
-            )
-
-            content = output_path.read_text()
-            # Compact JSON is typically a single line (no indentation)
-            assert '  "' not in content
-
-    def test_generate_default_path(self, capfd):
+        # Compact JSON is typically a single line (no indentation)
+        assert '  "' not in compact_report.content
+
+    def test_generate_default_path(self, tmp_path, monkeypatch, mock_health, mock_file_manager, mock_adapter):
         """Generate without path should use default."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
+        result = MockAnalysisResult(health=mock_health)
 
         # Change to temp directory to avoid creating file in project
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
-            old_cwd = os.getcwd()
-            os.chdir(tmpdir)
-            try:
-                returned_path = JSONReporter.generate(
-                    result, file_manager, adapter, output_path=None
-                )
-                assert returned_path.name == 'localization_report.json'
-                assert returned_path.exists()
-            finally:
-                os.chdir(old_cwd)
-
-    def test_load_report(self):
+        monkeypatch.chdir(tmp_path)
+        returned_path = JSONReporter.generate(
+            result, mock_file_manager, mock_adapter, output_path=None, pretty=False
+        )
+        assert returned_path.name == 'localization_report.json'
+        assert returned_path.exists()
+
+    def test_load_report(self, tmp_path):
         """Load should read JSON report."""
         test_data = {'test': 'value', 'number': 42}
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            report_path = Path(tmpdir) / 'report.json'
-            with open(report_path, 'w') as f:
-                json.dump(test_data, f)
+        report_path = tmp_path / 'report.json'
+        report_path.write_text(json.dumps(test_data))
 
-            loaded = JSONReporter.load(report_path)
-            assert loaded == test_data
+        loaded = JSONReporter.load(report_path)
+        assert loaded == test_data
 
-    def test_metadata_includes_timestamp(self):
+    def test_metadata_includes_timestamp(self, compact_report):
         """Metadata should include generation timestamp."""
-        health = self.create_mock_health()
-        result = MockAnalysisResult(health=health)
-        file_manager = self.create_mock_file_manager()
-        adapter = self.create_mock_adapter()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / 'report.json'
-            JSONReporter.generate(result, file_manager, adapter, output_path)
-
-            with open(output_path) as f:
-                data = json.load(f)
-
-            assert 'generated_at' in data['metadata']
-            assert 'version' in data['metadata']
-            assert data['metadata']['framework'] == 'swift'
+        metadata = compact_report.data['metadata']
+        assert 'generated_at' in metadata
+        assert 'version' in metadata
+        assert metadata['framework'] == 'swift'
 
 
 if __name__ == '__main__':
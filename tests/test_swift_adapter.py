@@ -4,7 +4,7 @@ import pytest
 import tempfile
 from pathlib import Path
 
-from localization_analyzer.frameworks.swift import SwiftAdapter
+from localization_analyzer.frameworks.swift import SwiftAdapter, _text_to_key_impl
 from localization_analyzer.utils.config import L10nConfig
 
 
@@ -186,6 +186,25 @@ class TestTextToKey:
         assert adapter.text_to_key('Größe') == 'grosse'
         assert adapter.text_to_key('Ändern') == 'andern'
 
+    def test_text_to_key_cached(self):
+        """Repeated texts should be served from the cache."""
+        adapter = SwiftAdapter()
+        _text_to_key_impl.cache_clear()
+
+        first = adapter.text_to_key('Größe ändern')
+        second = adapter.text_to_key('Größe ändern')
+
+        assert first == second == 'grosseAndern'
+        assert _text_to_key_impl.cache_info().hits > 0
+
+    def test_text_to_keys_matches_text_to_key(self):
+        """Batch conversion should match converting one text at a time."""
+        adapter = SwiftAdapter()
+        texts = ['Save', 'Größe ändern', 'Çıkış Yap', '', '🎉', 'a\x1fb', 'Œuvre']
+
+        assert adapter.text_to_keys(texts) == [adapter.text_to_key(t) for t in texts]
+        assert adapter.text_to_keys([]) == []
+
     def test_long_text_truncated(self):
         """Should handle long text (may or may not truncate based on implementation)."""
         adapter = SwiftAdapter()
@@ -350,6 +369,22 @@ class TestParseLocalizationFile:
 
         assert keys == {}
 
+    @pytest.mark.parametrize("content", [
+        '"a" = "A";\n"b"="B"; // trailing comment\n',
+        '"a" = "A";\r\n"b" = "B";\r\n',
+        r'"a" = "Say \"hi\"";' + '\n"b" = "B";',
+        '"a" = "first\nsecond";\n"b" = "B";',  # Value spanning lines
+        '"a"\n  = "A";',  # '=' on the next line
+        '"" = "empty key";\n"a" = "A" x;\n"b" = "B";',
+        '"dup" = "1";\n"dup" = "2";',
+    ])
+    def test_line_parser_matches_regex(self, content):
+        """Line-based parser should return exactly what the entry regex finds."""
+        from localization_analyzer.frameworks.swift import _STRINGS_ENTRY_RE, _parse_strings_content
+
+        expected = {m.group(1): m.group(2) for m in _STRINGS_ENTRY_RE.finditer(content)}
+        assert _parse_strings_content(content) == expected
+
 
 class TestWriteLocalizationEntry:
     """Test cases for write_localization_entry method."""
@@ -468,6 +503,37 @@ class TestCharacterMap:
         assert 'è' in adapter.CHAR_MAP
         assert 'ê' in adapter.CHAR_MAP
 
+    def test_char_trans_built_once(self):
+        """CHAR_TRANS should be a class-level table shared by all instances."""
+        adapter1 = SwiftAdapter()
+        adapter2 = SwiftAdapter()
+
+        assert adapter1.CHAR_TRANS is adapter2.CHAR_TRANS is SwiftAdapter.CHAR_TRANS
+
+    def test_char_trans_only_maps_non_decomposable_letters(self):
+        """CHAR_TRANS should leave accented letters to NFKD."""
+        assert ord('ß') in SwiftAdapter.CHAR_TRANS
+        assert ord('é') not in SwiftAdapter.CHAR_TRANS
+        assert ord('\u0301') in SwiftAdapter.CHAR_TRANS  # combining acute is deleted
+
+    def test_char_trans_folds_to_lowercase(self):
+        """CHAR_TRANS should expand special letters and lowercase in one pass."""
+        assert 'Schließen'.translate(SwiftAdapter.CHAR_TRANS) == 'schliessen'
+        assert 'Œuvre'.translate(SwiftAdapter.CHAR_TRANS) == 'oeuvre'
+
+    def test_subclass_char_map_overrides_key_spelling(self):
+        """A subclass CHAR_MAP should drive text_to_key without touching the base."""
+        class CustomAdapter(SwiftAdapter):
+            CHAR_MAP = {**SwiftAdapter.CHAR_MAP, 'ß': 'sz', 'é': 'ee'}
+
+        custom = CustomAdapter()
+
+        assert custom.text_to_key('Straße') == 'strasze'
+        assert custom.text_to_key('Café') == 'cafee'
+        assert custom.text_to_keys(['Straße', 'Café']) == ['strasze', 'cafee']
+        assert SwiftAdapter().text_to_key('Straße') == 'strasse'
+        assert SwiftAdapter().text_to_key('Café') == 'cafe'
+
 
 class TestFalsePositiveExclusions:
     """Test cases for false-positive exclusion patterns (v1.15.0)."""